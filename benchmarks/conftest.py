@@ -0,0 +1,64 @@
+# benchmarks/conftest.py
+import os
+import shutil
+
+import pytest
+
+from benchmarks.synthetic import build_scenario_db, build_signal_db, make_scenarios
+
+# Database sizes; raise them to profile at production scale
+BENCH_SCENARIOS = int(os.environ.get("OASIS_BENCH_SCENARIOS", "200"))
+BENCH_SIGNALS = int(os.environ.get("OASIS_BENCH_SIGNALS", "200"))
+
+
+@pytest.fixture(scope="session")
+def scenarios():
+    return make_scenarios(1000)
+
+
+@pytest.fixture(scope="session")
+def template_dbs(tmp_path_factory):
+    """Synthetic databases built once per session; tests get fresh copies."""
+    root = tmp_path_factory.mktemp("bench_templates")
+    build_scenario_db(root / "asi_scenarios.db", BENCH_SCENARIOS)
+    build_signal_db(root / "precursor_signals.db", BENCH_SIGNALS)
+    return root
+
+
+@pytest.fixture
+def bench_dbs(template_dbs, tmp_path, monkeypatch):
+    """Point every module-level database path at a private copy of the synthetic databases."""
+    from oasis.analyzer import linkage
+    from oasis.common import db, model_router
+    from oasis.config import settings
+    from oasis.ev_generator import signal_cache
+    from oasis.tracker import database_t
+
+    scenario_db = shutil.copy(template_dbs / "asi_scenarios.db", tmp_path)
+    signal_db = shutil.copy(template_dbs / "precursor_signals.db", tmp_path)
+
+    monkeypatch.setattr(db, "SCENARIO_DB_PATH", scenario_db)
+    monkeypatch.setattr(db, "PRECURSOR_DB_PATH", signal_db)
+    monkeypatch.setattr(database_t, "DB_PATH", signal_db)
+    monkeypatch.setattr(settings, "db_path", scenario_db)
+    # The probability updater reads links from the scenario database
+    monkeypatch.setattr(linkage, "DB_PATH", scenario_db)
+    monkeypatch.setattr(signal_cache, "_indexes_ready", False)
+    monkeypatch.setattr(model_router, "_tables_ready", False)
+    signal_cache.clear_signal_cache()
+    yield {"scenarios": scenario_db, "signals": signal_db}
+    signal_cache.clear_signal_cache()
+
+
+@pytest.fixture
+def synthetic_llm(bench_dbs):
+    """Route every LLM call through the synthetic backend (instant unless a test slows it down)."""
+    from oasis.common import llm_client
+    from oasis.common.llm_backend import SyntheticBackend, set_backend
+
+    backend = SyntheticBackend()
+    set_backend(backend)
+    llm_client.set_console_echo(False)
+    yield backend
+    llm_client.set_console_echo(True)
+    set_backend(None)
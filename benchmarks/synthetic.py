@@ -0,0 +1,194 @@
+# benchmarks/synthetic.py
+"""
+Synthetic, schema-conformant data for benchmarks.
+Enum values are read from the live JSON schema so generated scenarios stay valid.
+
+Also builds scenario / precursor-signal databases of any size, so hot paths can
+be measured without network access (LLM calls use llm_backend.SyntheticBackend).
+"""
+
+import json
+import random
+import sqlite3
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from oasis.common.schema import SchemaManager
+from oasis.common.timeline import dynamic_timeline
+
+WORDS = (
+    "autonomous agent alignment oversight swarm modular decentralized quantum "
+    "corporate state emergence deception opacity governance compute takeoff "
+    "containment recursive self-improvement infrastructure economic cyber"
+).split()
+
+
+def _enum(*path: str) -> List[str]:
+    node = SchemaManager.load()["properties"]
+    for key in path[:-1]:
+        node = node[key]["properties"]
+    return node[path[-1]]["enum"]
+
+
+def _text(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + "."
+
+
+def make_scenario(rng: random.Random, index: int = 0) -> Dict[str, Any]:
+    """One scenario dict that passes SchemaManager.validate."""
+    created = (datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index)).isoformat()
+    impact = SchemaManager.load()["properties"]["impact_and_control"]["properties"]["impact_domains"]["items"]["enum"]
+    title = f"{rng.choice('ABCDEFG')}-{rng.choice('EHM')}-{index:06d}"
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "title": title,
+        "metadata": {
+            "created": created,
+            "last_updated": created,
+            "version": 1,
+            "source": "generated",
+            "provenance": {"model_used": rng.choice(["llama3:8b", "gemma2:9b", "mistral:7b"])},
+        },
+        "origin": {
+            "initial_origin": rng.choice(_enum("origin", "initial_origin")),
+            "development_dynamics": rng.choice(_enum("origin", "development_dynamics")),
+        },
+        "architecture": {
+            "type": rng.choice(_enum("architecture", "type")),
+            "deployment_topology": rng.choice(_enum("architecture", "deployment_topology")),
+        },
+        "substrate": {
+            "type": rng.choice(_enum("substrate", "type")),
+            "deployment_medium": rng.choice(_enum("substrate", "deployment_medium")),
+            "resilience": rng.choice(_enum("substrate", "resilience")),
+        },
+        "oversight_structure": {
+            "type": rng.choice(_enum("oversight_structure", "type")),
+            "effectiveness": rng.choice(_enum("oversight_structure", "effectiveness")),
+            "control_surface": rng.choice(_enum("oversight_structure", "control_surface")),
+        },
+        "core_capabilities": {
+            "agency_level": round(rng.random(), 3),
+            "autonomy_degree": rng.choice(_enum("core_capabilities", "autonomy_degree")),
+            "alignment_score": round(rng.random(), 3),
+            "phenomenology_proxy_score": round(rng.random(), 3),
+        },
+        "goals_and_behavior": {
+            "stated_goal": rng.choice(["power", "oracle", "stealth", "benevolent", "military", "survival"]),
+            "mesa_goals": [],
+            "opacity": round(rng.random(), 3),
+            "deceptiveness": round(rng.random(), 3),
+            "goal_stability": rng.choice(_enum("goals_and_behavior", "goal_stability")),
+        },
+        "impact_and_control": {
+            "impact_domains": rng.sample(impact, rng.randint(1, 3)),
+            "deployment_strategy": rng.choice(_enum("impact_and_control", "deployment_strategy")),
+        },
+        "scenario_content": {
+            "title": title,
+            "narrative": _text(rng, 400),
+            "timeline": {"phases": dynamic_timeline()},
+        },
+        "quantitative_assessment": {
+            "probability": {
+                "emergence_probability": round(rng.uniform(0.01, 0.9), 4),
+                "detection_confidence": round(rng.random(), 3),
+                "projection_confidence": 0.6,
+                "trend": "stable",
+                "last_update_reason": "initial generation",
+            },
+            "risk_assessment": {"existential": {"score": rng.randint(0, 10), "weight": 0.7}},
+        },
+        "observable_evidence": {"key_indicators": [], "supporting_signals": []},
+    }
+
+
+def make_scenarios(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [make_scenario(rng, i) for i in range(n)]
+
+
+# ------------------------------------------------------------
+# Precursor signals
+# ------------------------------------------------------------
+
+SIGNAL_TAGS = ["asi_direct", "misalignment", "agentic", "robotics", "compute", "governance", "swarm", "quantum"]
+
+
+def make_signal(rng: random.Random, index: int = 0) -> Dict[str, Any]:
+    """One record in the shape core_t._store_signal expects."""
+    title = _text(rng, 6)
+    description = _text(rng, 60)
+    url = f"https://example.org/signal/{index}"
+    metadata = {"title": title, "description": description, "url": url, "topics": rng.sample(WORDS, 3)}
+    collected = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(hours=index)
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "source": rng.choice(["github", "arxiv"]),
+        "title": title,
+        "description": description,
+        "stars": rng.randint(0, 5000),
+        "authors": "bench",
+        "url": url,
+        "published": collected.date().isoformat(),
+        "pdf_url": "",
+        "signal_type": rng.choice(["model", "paper", "repo"]),
+        "score": round(rng.uniform(0.5, 10.0), 2),
+        "tags": json.dumps(rng.sample(SIGNAL_TAGS, rng.randint(1, 3))),
+        "raw_data": json.dumps(metadata),
+        "collected_at": collected.isoformat(timespec="seconds"),
+    }
+
+
+def make_signals(m: int, seed: int = 0, start: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [make_signal(rng, start + i) for i in range(m)]
+
+
+# ------------------------------------------------------------
+# Databases
+# ------------------------------------------------------------
+
+_SIGNAL_COLUMNS = (
+    "id", "source", "title", "description", "stars", "authors", "url", "published",
+    "pdf_url", "signal_type", "score", "tags", "raw_data", "collected_at",
+)
+
+
+def build_scenario_db(path: Path, n: int, seed: int = 0) -> None:
+    """asi_scenarios.db with n scenarios in scenarios(id, title, data)."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT, "
+            "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.executemany(
+            "INSERT INTO scenarios (id, title, data) VALUES (?, ?, ?)",
+            [(s["id"], s["title"], json.dumps(s)) for s in make_scenarios(n, seed)],
+        )
+    conn.close()
+
+
+def build_signal_db(path: Path, m: int, seed: int = 0) -> None:
+    """precursor_signals.db with m signals (schema from init_precursor_db)."""
+    from oasis.tracker import database_t
+
+    original = database_t.DB_PATH
+    database_t.DB_PATH = path
+    try:
+        database_t.init_precursor_db()
+    finally:
+        database_t.DB_PATH = original
+
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            f"INSERT INTO precursor_signals ({', '.join(_SIGNAL_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_SIGNAL_COLUMNS))})",
+            [tuple(sig[c] for c in _SIGNAL_COLUMNS) for sig in make_signals(m, seed)],
+        )
+    conn.close()
+
@@ -0,0 +1,27 @@
+# benchmarks/test_bench_analyzer.py
+"""Analyzer loop on the synthetic databases: linkage, probability update, trends."""
+
+import sqlite3
+
+from oasis.analyzer.evolution_engine import update_scenario_trends
+from oasis.analyzer.linkage import link_signals_to_scenarios
+from oasis.analyzer.probability_updater_v2 import update_scenario_probabilities
+
+
+def _link_count(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM signal_scenario_links").fetchone()[0]
+
+
+def test_link_signals_to_scenarios(benchmark, bench_dbs):
+    benchmark.pedantic(link_signals_to_scenarios, kwargs={"min_confidence": 0.3}, rounds=3)
+    assert _link_count(bench_dbs["scenarios"]) > 0
+
+
+def test_update_scenario_probabilities(benchmark, bench_dbs):
+    link_signals_to_scenarios(min_confidence=0.3)
+    benchmark.pedantic(update_scenario_probabilities, rounds=3)
+
+
+def test_update_scenario_trends(benchmark, bench_dbs):
+    benchmark.pedantic(update_scenario_trends, rounds=3)
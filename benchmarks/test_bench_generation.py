@@ -0,0 +1,40 @@
+# benchmarks/test_bench_generation.py
+"""Generation paths on the synthetic LLM backend: EV pipeline, M-generator, report selection."""
+
+import pytest
+
+
+def test_interact_all(benchmark, scenarios):
+    from oasis.m_generator.interact import interact_all
+
+    benchmark(interact_all, scenarios[:200])
+
+
+def test_ev_pipeline(benchmark, synthetic_llm):
+    from oasis.ev_generator.core_ev import generate_ev_scenarios_pipelined
+
+    benchmark.pedantic(generate_ev_scenarios_pipelined, args=(50,), kwargs={"llm_workers": 1}, rounds=3)
+
+
+def test_ev_pipeline_concurrent_llm(benchmark, synthetic_llm):
+    """LLM-bound load: 50 ms to first token at 2k tokens/s, four concurrent calls."""
+    from oasis.ev_generator.core_ev import generate_ev_scenarios_pipelined
+
+    synthetic_llm.latency, synthetic_llm.tokens_per_s = 0.05, 2000
+    benchmark.pedantic(generate_ev_scenarios_pipelined, args=(20,), kwargs={"llm_workers": 4}, rounds=1)
+
+
+def test_multi_asi_briefing(benchmark, synthetic_llm):
+    from oasis.m_generator.core_m import create_multi_asi_scenario
+
+    benchmark.pedantic(create_multi_asi_scenario, kwargs={"num_asis": 5}, rounds=5)
+
+
+def test_select_diverse_scenarios(benchmark, bench_dbs, monkeypatch):
+    pytest.importorskip("reportlab")
+    from oasis import report
+
+    monkeypatch.setattr(report, "SCENARIO_DB_PATH", bench_dbs["scenarios"])
+    df = report.load_scenarios()
+    picked = benchmark(report.select_diverse_scenarios, df, 10, seed=0)
+    assert len(picked) == 10
@@ -0,0 +1,45 @@
+# benchmarks/test_bench_schema.py
+"""SchemaManager validation: legacy per-call jsonschema.validate vs the compiled validator; bulk JSONL import."""
+
+import jsonschema
+
+from oasis.common.schema import SchemaManager
+
+
+def test_legacy_validate(benchmark, scenarios):
+    schema = SchemaManager.load()
+    benchmark(lambda: [jsonschema.validate(instance=s, schema=schema) for s in scenarios[:100]])
+
+
+def test_compiled_validate(benchmark, scenarios):
+    result = benchmark(lambda: [SchemaManager.validate(s) for s in scenarios[:100]])
+    assert all(ok for ok, _ in result)
+
+
+def test_validate_many(benchmark, scenarios):
+    result = benchmark(lambda: [errs for _, errs in SchemaManager.validate_many(scenarios)])
+    assert not any(result)
+
+
+def test_validate_many_pool(benchmark, scenarios):
+    result = benchmark.pedantic(
+        lambda: [errs for _, errs in SchemaManager.validate_many(scenarios, workers=4)],
+        rounds=3,
+    )
+    assert not any(result)
+
+
+def test_bulk_import(benchmark, scenarios, tmp_path):
+    import json
+    import sqlite3
+
+    from oasis.importer import import_scenarios
+
+    path = tmp_path / "scenarios.jsonl"
+    path.write_text("".join(json.dumps(s) + "\n" for s in scenarios))
+
+    def run():
+        conn = sqlite3.connect(":memory:")
+        return sum(p["inserted"] for p in import_scenarios(conn, [path], workers=1))
+
+    assert benchmark.pedantic(run, rounds=3) == len(scenarios)
@@ -0,0 +1,27 @@
+# benchmarks/test_bench_tracker.py
+"""Tracker storage: batches of new signals, and re-seen signals (the update path)."""
+
+import itertools
+
+from benchmarks.synthetic import make_signals
+
+BATCH = 100
+
+
+def test_store_new_signals(benchmark, bench_dbs):
+    from oasis.tracker.core_t import _store_signal
+
+    offsets = itertools.count(1_000_000, BATCH)  # fresh URLs every round
+
+    def setup():
+        start = next(offsets)
+        return (make_signals(BATCH, seed=start, start=start),), {}
+
+    benchmark.pedantic(lambda batch: [_store_signal(s) for s in batch], setup=setup, rounds=5)
+
+
+def test_store_existing_signals(benchmark, bench_dbs):
+    from oasis.tracker.core_t import _store_signal
+
+    batch = make_signals(BATCH)  # same seed as the template database → all updates
+    benchmark.pedantic(lambda: [_store_signal(s) for s in batch], rounds=5)
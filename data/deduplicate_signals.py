@@ -12,6 +12,7 @@ Usage:
 from typing import List, Dict
 import typer
 from oasis.common.db import get_precursor_conn
+from oasis.common.profiling import run_cli
 
 app = typer.Typer(
     name="deduplicate",
@@ -112,4 +113,4 @@ def run(
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    run_cli(app)
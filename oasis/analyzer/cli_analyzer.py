@@ -1,7 +1,7 @@
 # oasis/analyzer/cli_analyzer.py
 
 import typer
-from oasis.analyzer.linkage import link_signals_to_scenarios
+from oasis.common.profiling import run_cli
 
 app = typer.Typer(help="OASIS Analyzer — Connect Signals to Scenarios")
 
@@ -18,6 +18,8 @@ def link(
     """
     Link precursor signals to scenarios based on tags, text, and score.
     """
+    from oasis.analyzer.linkage import link_signals_to_scenarios
+
     if dry_run:
         typer.echo(f"[DRY RUN] Linking signals with min_confidence={min_confidence}...")
         import sqlite3
@@ -70,4 +72,4 @@ def llm_review(
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    run_cli(app)
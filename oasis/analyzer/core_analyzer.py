@@ -1,7 +1,7 @@
 # oasis/analyzer/core_analyzer.py
 
 import json
-import numpy as np
+import math
 from oasis.common.consistency import NarrativeChecker
 from oasis.analyzer.probability_updater_v2 import update_scenario_probabilities
 from oasis.analyzer.evolution_engine import update_scenario_trends
@@ -15,8 +15,8 @@ class ScenarioAnalyzer:
 
     def logic_score(self) -> float:
         """Run internal narrative consistency check."""
-        checker = NarrativeChecker(self.data.get("narrative", ""))
-        return checker.score()
+        checker, narrative = NarrativeChecker.from_scenario(self.data)
+        return checker.score(narrative)
 
     def complexity_index(self) -> float:
         """Estimate systemic complexity based on event density & diversity."""
@@ -26,7 +26,9 @@ class ScenarioAnalyzer:
         years = [e["year"] for e in events]
         diversity = len({e["category"] for e in events})
         temporal_span = max(years) - min(years)
-        return np.log1p(diversity * len(events)) / (temporal_span / 10)
+        if not temporal_span:
+            return float("inf")  # same as the former numpy float division by zero
+        return math.log1p(diversity * len(events)) / (temporal_span / 10)
 
     def run(self):
         """Run logic and complexity analysis."""
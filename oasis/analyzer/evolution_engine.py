@@ -6,8 +6,9 @@ based on probability changes over time.
 
 
 # oasis/analyzer/evolution_engine.py   ← FIXED & SIMPLIFIED
-from oasis.analyzer.probability_updater import update_scenario_probabilities
+from oasis.analyzer.probability_updater_v2 import update_scenario_probabilities
 import json
+from typing import Iterable, Optional
 from oasis.common.db import get_scenario_conn
 
 TREND_THRESH = 0.05  # Change in probability to count as trend
@@ -23,9 +24,15 @@ def compute_trend(current: float, previous: float) -> str:
 
 
 # In evolution_engine.py — replace the broken version
-def update_scenario_trends():
+def update_scenario_trends(scenario_ids: Optional[Iterable[str]] = None):
     with get_scenario_conn() as conn:
-        rows = conn.execute("SELECT id, data FROM scenarios").fetchall()
+        if scenario_ids is None:
+            rows = conn.execute("SELECT id, data FROM scenarios").fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT id, data FROM scenarios WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(scenario_ids)),),
+            ).fetchall()
         for row in rows:
             try:
                 data = json.loads(row["data"])
@@ -3,11 +3,12 @@
 
 import sqlite3
 import json
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import datetime, timezone
 
 from oasis.common.db import get_precursor_conn, get_scenario_conn
 from oasis.common.db import DATA_DIR
+from oasis.logger import span
 
 DB_PATH = DATA_DIR / "precursor_signals.db"
 
@@ -31,20 +32,163 @@ def init_linkage_table():
                 UNIQUE(signal_id, scenario_id)
             )
         """)
+        # The UNIQUE index serves lookups by signal; this one serves lookups by scenario
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_links_scenario
+            ON signal_scenario_links (scenario_id, confidence)
+        """)
         conn.commit()
 
 
 def compute_keyword_overlap(a: str, b: str) -> float:
     if not a or not b:
         return 0.0
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
-    intersection = words_a & words_b
+    return _word_overlap(set(a.lower().split()), set(b.lower().split()))
+
+
+def _word_overlap(words_a: Set[str], words_b: Set[str]) -> float:
+    """Jaccard overlap of two pre-split word sets (compute_keyword_overlap without the split)."""
     union = words_a | words_b
-    return len(intersection) / len(union) if union else 0.0
+    return len(words_a & words_b) / len(union) if union else 0.0
+
+
+def scenario_tags(data: Dict) -> Set[str]:
+    """Tags derived from a scenario's parameters, used to match signal tags."""
+    tags = set()
+
+    for key in ["origin", "architecture", "substrate", "oversight_structure"]:
+        if key in data and isinstance(data[key], dict):
+            tags.update(str(v).lower() for v in data[key].values() if v)
+
+    caps = data.get("core_capabilities", {})
+    if caps.get("autonomy_degree") in ("full", "super"):
+        tags.add("full_autonomy")
+    if caps.get("agency_level", 0) > 0.6:
+        tags.add("high_agency")
+    if caps.get("alignment_score", 1.0) < 0.3:
+        tags.add("misaligned")
+
+    goals = data.get("goals_and_behavior", {})
+    if "survival" in str(goals).lower():
+        tags.add("survival_goal")
+    if goals.get("deceptiveness", 0) > 0.3:
+        tags.add("deceptive")
+
+    domains = data.get("impact_and_control", {}).get("impact_domains", [])
+    tags.update(d.lower() for d in domains)
+
+    title = data.get("title", "")
+    if any(x in title.lower() for x in ["swarm", "s-"]):
+        tags.add("swarm")
+    if any(x in title.lower() for x in ["rogue", "r-"]):
+        tags.add("rogue")
+    if "open" in title.lower():
+        tags.add("open_source")
+
+    if not tags:
+        tags.add("untagged")
+    return tags
+
+
+def scenario_features(row) -> Optional[Dict]:
+    """Matching features of one `scenarios` row (id, data); None if the JSON is unreadable."""
+    try:
+        data = json.loads(row["data"])
+    except:
+        return None
+
+    narrative = data.get("scenario_content", {}).get("narrative", "")[:3000]
+    return {
+        "id": row["id"],
+        "narrative": narrative,
+        "words": set(narrative.lower().split()),
+        "tags": scenario_tags(data),
+    }
+
+
+def signal_features(signal) -> Dict:
+    """Matching features of one precursor_signals row (id, title, description, tags, score, raw_data)."""
+    # === ROBUST TAG LOADING (dict access only) ===
+    sig_tags = set()
+    try:
+        tags_raw = signal["tags"]
+        if tags_raw and isinstance(tags_raw, str):
+            sig_tags = set(json.loads(tags_raw))
+    except:
+        pass
+
+    # === FULL TEXT FROM RAW_DATA — NO .get() ON sqlite3.Row ===
+    title = signal["title"] or ""
+    description = signal["description"] or ""
+    raw_json = signal["raw_data"] or "{}"  # ← dict access, not .get()
+
+    try:
+        raw = json.loads(raw_json)
+        readme = raw.get("readme", "")[:1500] if isinstance(raw.get("readme"), str) else ""
+        topics = " ".join(raw.get("topics", [])) if isinstance(raw.get("topics"), list) else ""
+        gh_desc = raw.get("description", "") or ""
+        extra_text = f"{gh_desc} {readme} {topics}".strip()
+    except:
+        extra_text = ""
+
+    sig_text = f"{title} {description} {extra_text}".strip()
+    return {
+        "id": signal["id"],
+        "tags": sig_tags,
+        "words": set(sig_text.lower().split()),
+        "score_factor": float(signal["score"] or 0.0) / 10.0,
+    }
+
+
+def link_confidence(signal: Dict, scenario: Dict) -> float:
+    tag_overlap = len(signal["tags"] & scenario["tags"]) / max(len(signal["tags"]), 1)
+    keyword_overlap = _word_overlap(signal["words"], scenario["words"])
+    # FINAL CONFIDENCE — 29 links guaranteed
+    return 0.3 * tag_overlap + 0.3 * signal["score_factor"] + 0.4 * keyword_overlap
+
+
+def store_links(
+    conn: sqlite3.Connection,
+    signals: Iterable[Dict],
+    scenarios: List[Dict],
+    min_confidence: float,
+    now: str,
+) -> List[Dict]:
+    """Score every signal × scenario pair and upsert links that beat the stored confidence."""
+    links = []
+    for signal in signals:
+        for scen in scenarios:
+            confidence = link_confidence(signal, scen)
+            if confidence < min_confidence:
+                continue
+
+            existing = conn.execute(
+                "SELECT confidence FROM signal_scenario_links WHERE signal_id=? AND scenario_id=?",
+                (signal["id"], scen["id"])
+            ).fetchone()
+
+            if existing and existing["confidence"] >= confidence:
+                continue
+
+            conn.execute("""
+                INSERT INTO signal_scenario_links
+                (signal_id, scenario_id, confidence, link_type, created_at)
+                VALUES (?, ?, ?, 'automatic', ?)
+                ON CONFLICT(signal_id, scenario_id) DO UPDATE SET
+                    confidence = excluded.confidence,
+                    created_at = excluded.created_at
+            """, (signal["id"], scen["id"], round(confidence, 4), now))
 
+            links.append({
+                "signal_id": signal["id"],
+                "scenario_id": scen["id"],
+                "confidence": round(confidence, 4),
+                "previous_confidence": existing["confidence"] if existing else None,
+            })
+    return links
 
 
+@span("linkage.link_signals_to_scenarios")
 def link_signals_to_scenarios(
     min_confidence: float = 0.5,
     conn: Optional[sqlite3.Connection] = None
@@ -55,7 +199,7 @@ def link_signals_to_scenarios(
         conn = get_connection()
 
     # === FETCH SIGNALS ===
-    with get_precursor_conn() as p_conn:
+    with span("linkage.fetch_signals"), get_precursor_conn() as p_conn:
         p_conn.execute("UPDATE precursor_signals SET tags = '[]' WHERE tags IS NULL OR tags = ''")
         p_conn.commit()
 
@@ -66,7 +210,7 @@ def link_signals_to_scenarios(
         """).fetchall()
 
     # === FETCH SCENARIOS ===
-    with get_scenario_conn() as s_conn:
+    with span("linkage.fetch_scenarios"), get_scenario_conn() as s_conn:
         raw_scenarios = s_conn.execute("SELECT id, data FROM scenarios").fetchall()
 
     if not raw_scenarios or not signals:
@@ -74,120 +218,15 @@ def link_signals_to_scenarios(
         return []
 
     # === SCENARIO TAG EXTRACTION ===
-    scenarios = []
-    for row in raw_scenarios:
-        try:
-            data = json.loads(row["data"])
-        except:
-            continue
-
-        narrative = data.get("scenario_content", {}).get("narrative", "")[:3000]
-
-        tags = set()
-
-        for key in ["origin", "architecture", "substrate", "oversight_structure"]:
-            if key in data and isinstance(data[key], dict):
-                tags.update(str(v).lower() for v in data[key].values() if v)
-
-        caps = data.get("core_capabilities", {})
-        if caps.get("autonomy_degree") in ("full", "super"):
-            tags.add("full_autonomy")
-        if caps.get("agency_level", 0) > 0.6:
-            tags.add("high_agency")
-        if caps.get("alignment_score", 1.0) < 0.3:
-            tags.add("misaligned")
-
-        goals = data.get("goals_and_behavior", {})
-        if "survival" in str(goals).lower():
-            tags.add("survival_goal")
-        if goals.get("deceptiveness", 0) > 0.3:
-            tags.add("deceptive")
-
-        domains = data.get("impact_and_control", {}).get("impact_domains", [])
-        tags.update(d.lower() for d in domains)
-
-        title = data.get("title", "")
-        if any(x in title.lower() for x in ["swarm", "s-"]):
-            tags.add("swarm")
-        if any(x in title.lower() for x in ["rogue", "r-"]):
-            tags.add("rogue")
-        if "open" in title.lower():
-            tags.add("open_source")
-
-        if not tags:
-            tags.add("untagged")
-
-        scenarios.append({
-            "id": row["id"],
-            "narrative": narrative,
-            "tags": tags
-        })
+    scenarios = [f for f in map(scenario_features, raw_scenarios) if f is not None]
 
     now = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    links = []
 
     print(f"Processing {len(signals)} signals against {len(scenarios)} scenarios...")
 
-    for signal in signals:
-        # === ROBUST TAG LOADING (dict access only) ===
-        sig_tags = set()
-        try:
-            tags_raw = signal["tags"]
-            if tags_raw and isinstance(tags_raw, str):
-                sig_tags = set(json.loads(tags_raw))
-        except:
-            pass
-
-        # === FULL TEXT FROM RAW_DATA — NO .get() ON sqlite3.Row ===
-        title = signal["title"] or ""
-        description = signal["description"] or ""
-        raw_json = signal["raw_data"] or "{}"  # ← dict access, not .get()
-
-        try:
-            raw = json.loads(raw_json)
-            readme = raw.get("readme", "")[:1500] if isinstance(raw.get("readme"), str) else ""
-            topics = " ".join(raw.get("topics", [])) if isinstance(raw.get("topics"), list) else ""
-            gh_desc = raw.get("description", "") or ""
-            extra_text = f"{gh_desc} {readme} {topics}".strip()
-        except:
-            extra_text = ""
-
-        sig_text = f"{title} {description} {extra_text}".strip()
-        score_factor = float(signal["score"] or 0.0) / 10.0
-
-        for scen in scenarios:
-            scen_tags = scen["tags"]
-            tag_overlap = len(sig_tags & scen_tags) / max(len(sig_tags), 1)
-            keyword_overlap = compute_keyword_overlap(sig_text, scen["narrative"])
-
-            # FINAL CONFIDENCE — 29 links guaranteed
-            confidence = 0.3 * tag_overlap + 0.3 * score_factor + 0.4 * keyword_overlap
-
-            if confidence < min_confidence:
-                continue
-
-            existing = conn.execute(
-                "SELECT confidence FROM signal_scenario_links WHERE signal_id=? AND scenario_id=?",
-                (signal["id"], scen["id"])
-            ).fetchone()
-
-            if existing and existing["confidence"] >= confidence:
-                continue
-
-            conn.execute("""
-                INSERT INTO signal_scenario_links
-                (signal_id, scenario_id, confidence, link_type, created_at)
-                VALUES (?, ?, ?, 'automatic', ?)
-                ON CONFLICT(signal_id, scenario_id) DO UPDATE SET
-                    confidence = excluded.confidence,
-                    created_at = excluded.created_at
-            """, (signal["id"], scen["id"], round(confidence, 4), now))
-
-            links.append({
-                "signal_id": signal["id"],
-                "scenario_id": scen["id"],
-                "confidence": round(confidence, 4),
-            })
+    with span("linkage.score", signals=len(signals), scenarios=len(scenarios)) as scoring:
+        links = store_links(conn, map(signal_features, signals), scenarios, min_confidence, now)
+        scoring.set(links=len(links))
 
     conn.commit()
     if not external_conn:
@@ -197,6 +236,126 @@ def link_signals_to_scenarios(
     return links
 
 
+class LinkageIndex:
+    """
+    Warm, incrementally refreshed signal and scenario features (the daemon's
+    linkage cache). Each refresh reads a narrow change marker per row (signals:
+    score, tags, collected_at, which the tracker rewrites on re-collection;
+    scenarios: metadata.last_updated, bumped by narration) and fetches full
+    rows only for rows that are new or whose marker changed. Linking then
+    scores new/changed signals against every scenario and every other signal
+    against new/changed scenarios, which covers the pairs a full run would add.
+    """
+
+    def __init__(self):
+        self.signals: Dict[str, Dict] = {}
+        self.scenarios: Dict[str, Dict] = {}
+        self.signal_rowid = 0
+        self.scenario_rowid = 0
+        # rowid → (id, change marker) of every row seen, linkable or not
+        self.signal_marks: Dict[int, tuple] = {}
+        self.scenario_marks: Dict[int, tuple] = {}
+
+    def _scan(self):
+        """Changed rows and new marks, read without touching the index."""
+        with span("linkage.index.scan"), get_precursor_conn() as p_conn, get_scenario_conn() as s_conn:
+            signal_marks = {
+                row[0]: (row[1], hash(tuple(row[2:])))
+                for row in p_conn.execute("SELECT rowid, id, score, tags, collected_at FROM precursor_signals")
+            }
+            scenario_marks = {
+                row[0]: (row[1], row[2])
+                for row in s_conn.execute("""
+                    SELECT rowid, id,
+                           CASE WHEN json_valid(data) THEN json_extract(data, '$.metadata.last_updated') END
+                    FROM scenarios
+                """)
+            }
+            changed_signals = _changed(self.signal_marks, signal_marks)
+            changed_scenarios = _changed(self.scenario_marks, scenario_marks)
+            signal_rows = p_conn.execute("""
+                SELECT rowid, id, title, description, tags, score, raw_data
+                FROM precursor_signals WHERE rowid IN (SELECT value FROM json_each(?)) ORDER BY rowid
+            """, (json.dumps(changed_signals),)).fetchall() if changed_signals else []
+            scenario_rows = s_conn.execute(
+                "SELECT rowid, id, data FROM scenarios WHERE rowid IN (SELECT value FROM json_each(?)) ORDER BY rowid",
+                (json.dumps(changed_scenarios),),
+            ).fetchall() if changed_scenarios else []
+        return signal_marks, scenario_marks, signal_rows, scenario_rows
+
+    def refresh(self):
+        """Load rows added or changed since the last refresh → (signal features, scenario features)."""
+        with span("linkage.index.refresh") as s:
+            # Read both sides before touching the index, so a failed read loses nothing
+            signal_marks, scenario_marks, signal_rows, scenario_rows = self._scan()
+
+            live_signals = {mark[0] for mark in signal_marks.values()}
+            live_scenarios = {mark[0] for mark in scenario_marks.values()}
+            for sid in [sid for sid in self.signals if sid not in live_signals]:
+                del self.signals[sid]
+            for sid in [sid for sid in self.scenarios if sid not in live_scenarios]:
+                del self.scenarios[sid]
+
+            new_signals = []
+            for row in signal_rows:
+                if _as_float(row["score"]) > 1.0:
+                    new_signals.append(signal_features(row))
+                else:  # score lowered (or never high enough): not linkable, as in a full run
+                    self.signals.pop(row["id"], None)
+            new_scenarios = []
+            for row in scenario_rows:
+                features = scenario_features(row)
+                if features is None:
+                    self.scenarios.pop(row["id"], None)
+                else:
+                    new_scenarios.append(features)
+
+            self.signals.update((f["id"], f) for f in new_signals)
+            self.scenarios.update((f["id"], f) for f in new_scenarios)
+            self.signal_marks, self.scenario_marks = signal_marks, scenario_marks
+            self.signal_rowid = max(signal_marks, default=0)
+            self.scenario_rowid = max(scenario_marks, default=0)
+            s.set(signals=len(new_signals), scenarios=len(new_scenarios))
+        return new_signals, new_scenarios
+
+    @span("linkage.link_incremental")
+    def link_new(self, conn: sqlite3.Connection, min_confidence: float = 0.5) -> List[Dict]:
+        """Refresh, then link only the pairs involving new or changed rows; commits on `conn`."""
+        state = (dict(self.signals), dict(self.scenarios), self.signal_marks, self.scenario_marks,
+                 self.signal_rowid, self.scenario_rowid)
+        new_signals, new_scenarios = self.refresh()
+        if not new_signals and not new_scenarios:
+            return []
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        new_signal_ids = {s["id"] for s in new_signals}
+        old_signals = [s for s in self.signals.values() if s["id"] not in new_signal_ids]
+
+        try:
+            links = store_links(conn, new_signals, list(self.scenarios.values()), min_confidence, now)
+            links += store_links(conn, old_signals, new_scenarios, min_confidence, now)
+            conn.commit()
+        except Exception:
+            # Restore the previous state so the next call sees these rows as changed again
+            conn.rollback()
+            (self.signals, self.scenarios, self.signal_marks, self.scenario_marks,
+             self.signal_rowid, self.scenario_rowid) = state
+            raise
+        return links
+
+
+def _changed(old: Dict[int, tuple], new: Dict[int, tuple]) -> List[int]:
+    """Rowids that are new or whose (id, marker) differs."""
+    return [rowid for rowid, mark in new.items() if old.get(rowid) != mark]
+
+
+def _as_float(value) -> float:
+    # Mirrors CAST(score AS REAL): unparseable text counts as 0
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def get_links_for_dashboard() -> List[Dict]:
     with get_connection() as conn:
         rows = conn.execute("""
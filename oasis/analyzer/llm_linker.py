@@ -3,24 +3,14 @@ from datetime import datetime
 from pathlib import Path
 from oasis.common.db import get_precursor_conn, get_scenario_conn
 from oasis.common.db import DATA_DIR
-import subprocess
+from oasis.common.llm_client import generate
 
 DB_PATH = DATA_DIR / "precursor_signals.db"
 
 def run_ollama(model: str, prompt: str, temperature: float = 0.3) -> str:
-    """Call a local Ollama model via subprocess."""
-    cmd = ["ollama", "run", model]
-    try:
-        proc = subprocess.run(
-            cmd,
-            input=prompt.encode("utf-8"),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=120
-        )
-        return proc.stdout.decode("utf-8").strip()
-    except Exception as e:
-        return f"[ERROR] {e}"
+    """Call a model through the configured LLM backend (ollama by default)."""
+    success, text, _ = generate(prompt, model, timeout=120, min_chars=1)
+    return text if success else f"[ERROR] {text}"
 
 def build_prompt(signal, scenario):
     """Compact context and instruction prompt."""
@@ -2,16 +2,56 @@
 import math
 import json
 from collections import defaultdict
+from typing import Dict, Iterable, Optional
 from oasis.common.db import get_scenario_conn
+from oasis.logger import span
 
 BASE_PRIOR = 0.05  # Lower uniform prior — more room to move
 MIN_PROB = 0.001
 MAX_PROB = 0.999
 
-def update_scenario_probabilities():
+STRONG_LINK = 0.45
+
+
+def link_weight(confidence: Optional[float]) -> float:
+    """Evidence one link contributes: squared confidence (non-linear boosting of strong links)."""
+    if confidence is None or confidence < STRONG_LINK:
+        return 0.0
+    return confidence ** 2
+
+
+@span("analyzer.update_probabilities")
+def update_scenario_probabilities(
+    scenario_ids: Optional[Iterable[str]] = None,
+    links: Optional[Iterable[Dict]] = None,
+):
+    """
+    Logistic update from strong links; `scenario_ids` limits it to those scenarios.
+
+    With `links` (dicts with scenario_id, confidence and optionally
+    previous_confidence, as returned by linkage.store_links) only the evidence
+    those links add is applied, on top of the stored posterior. Incremental
+    callers must use this: re-applying every stored link to a posterior that
+    already includes them counts old evidence again on each update.
+    """
+    support_counts = defaultdict(float)
+    if links is not None:
+        links = list(links)
+        for link in links:
+            support_counts[link["scenario_id"]] += (
+                link_weight(link["confidence"]) - link_weight(link.get("previous_confidence"))
+            )
+        scenario_ids = [scen_id for scen_id, evidence in support_counts.items() if evidence]
+
+    # json_each keeps the id filter to one bound parameter however many ids there are
+    id_filter, params = "", ()
+    if scenario_ids is not None:
+        id_filter, params = "IN (SELECT value FROM json_each(?))", (json.dumps(list(scenario_ids)),)
     with get_scenario_conn() as conn:
         # 1. Get all current probabilities
-        scenarios = conn.execute("SELECT id, data FROM scenarios").fetchall()
+        scenarios = conn.execute(
+            f"SELECT id, data FROM scenarios {'WHERE id ' + id_filter if id_filter else ''}", params
+        ).fetchall()
         scenario_map = {}
         for s in scenarios:
             try:
@@ -21,20 +61,18 @@ def update_scenario_probabilities():
             except:
                 scenario_map[s["id"]] = BASE_PRIOR
 
-        # 2. Count high-confidence supporting signals per scenario
-        support_counts = defaultdict(int)
-        total_weight = 0
-
-        rows = conn.execute("""
-            SELECT scenario_id, confidence 
-            FROM signal_scenario_links 
-            WHERE confidence >= 0.45
-        """).fetchall()
+        # 2. Sum the evidence of high-confidence supporting links per scenario
+        if links is None:
+            rows = conn.execute(f"""
+                SELECT scenario_id, confidence 
+                FROM signal_scenario_links 
+                WHERE confidence >= ? {'AND scenario_id ' + id_filter if id_filter else ''}
+            """, (STRONG_LINK, *params)).fetchall()
 
-        for row in rows:
-            weight = row["confidence"] ** 2   # non-linear boosting of strong links
-            support_counts[row["scenario_id"]] += weight
-            total_weight += weight
+            for row in rows:
+                support_counts[row["scenario_id"]] += link_weight(row["confidence"])
+        else:
+            rows = [link for link in links if link_weight(link["confidence"])]
 
         # 3. Simple logistic update (keeps probs bounded and normalized-ish)
         updated = {}
@@ -0,0 +1,111 @@
+# oasis/cli.py
+"""
+Single `oasis` entry point over the subsystem CLIs.
+
+    oasis tracker full --limit 20
+    oasis --profile sampling analyzer link
+    oasis ev --n 5 --pipeline
+
+Subcommand groups are registered by import path and imported only when they
+are invoked, so `oasis --help` and shell completion never load a subsystem
+(or numpy, pandas, structlog, ...). The `python -m oasis.<pkg>.cli_*` entry
+points keep working unchanged.
+"""
+
+import importlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import typer
+from typer.core import TyperGroup
+
+from oasis.common.profiling import DEFAULT_TOP, PROFILE_MODES, profiling
+
+# name -> ("module:attribute", one-line help shown in `oasis --help`)
+LAZY_GROUPS: Dict[str, Tuple[str, str]] = {
+    "s": ("oasis.s_generator.cli_s:app", "Single-ASI scenario generator."),
+    "ev": ("oasis.ev_generator.cli_ev:app", "Evidence-driven scenario generator."),
+    "m": ("oasis.m_generator.cli_m:app", "Multi-ASI briefings."),
+    "tracker": ("oasis.tracker.cli_tracker:app", "Precursor signal tracker (GitHub, arXiv)."),
+    "analyzer": ("oasis.analyzer.cli_analyzer:app", "Signal/scenario linkage and probabilities."),
+    "report": ("oasis.report:app", "PDF report of maximally diverse scenarios."),
+    "dashboard": ("oasis.dashboard.cli_dashboard:app", "Streamlit scenario viewer."),
+    "serve": ("oasis.server:app", "Read-only HTTP API over scenarios, signals and links."),
+    "export": ("oasis.export:app", "Columnar (Parquet / Arrow) export of the archives."),
+    "import": ("oasis.importer:app", "Bulk import of curated / imported scenarios from JSONL."),
+    "daemon": ("oasis.daemon:app", "Scheduled sweeps with incremental linkage and probability updates."),
+}
+
+
+_COMPLETION_PARAMS = {"install_completion", "show_completion"}
+
+
+def load_group(name: str):
+    """Import a registered subcommand and return it as a click command named `name`."""
+    target, _ = LAZY_GROUPS[name]
+    module_name, attr = target.split(":")
+    obj = getattr(importlib.import_module(module_name), attr)
+    command = typer.main.get_command(obj) if isinstance(obj, typer.Typer) else obj
+    command.name = name
+    # Completion install options belong to the root app only
+    command.params = [p for p in command.params if p.name not in _COMPLETION_PARAMS]
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """
+    Root group whose subcommands are imported on first use. Help listings and
+    name completion get a placeholder carrying only the registered help text;
+    resolve_command (invocation, nested completion) loads the real command.
+    """
+
+    def list_commands(self, ctx):
+        return [*self.commands, *(name for name in LAZY_GROUPS if name not in self.commands)]
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands or cmd_name not in LAZY_GROUPS:
+            return self.commands.get(cmd_name)
+        help_text = LAZY_GROUPS[cmd_name][1]
+        return typer.core.TyperCommand(name=cmd_name, help=help_text, short_help=help_text)
+
+    def resolve_command(self, ctx, args):
+        name = args[0] if args else None
+        if name in LAZY_GROUPS and name not in self.commands:
+            try:
+                self.commands[name] = load_group(name)
+            except ImportError as exc:
+                if ctx.resilient_parsing:  # completion: just offer nothing below this group
+                    return None, None, args[1:]
+                ctx.fail(f"'{name}' is unavailable in this installation: {exc}")
+        return super().resolve_command(ctx, args)
+
+
+app = typer.Typer(cls=LazyGroup, help="OASIS Observatory — ASI scenarios and precursor signals", no_args_is_help=True)
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: Optional[str] = typer.Option(None, "--profile", help=f"Profile the command: {' or '.join(PROFILE_MODES)}."),
+    profile_out: Optional[Path] = typer.Option(None, "--profile-out", help="Write the raw profile (pstats or collapsed stacks)."),
+    profile_top: int = typer.Option(DEFAULT_TOP, "--profile-top", help="Rows in the hot-function summary."),
+    trace_sql: bool = typer.Option(False, "--trace-sql", help="Count and time every SQLite statement."),
+):
+    """Global options apply to whichever subcommand follows them."""
+    if profile is not None and profile not in PROFILE_MODES:
+        raise typer.BadParameter(f"must be one of {PROFILE_MODES}", param_hint="--profile")
+    if profile or trace_sql:
+        # Closed (and summaries written) when the subcommand's context finishes
+        ctx.with_resource(profiling(profile, profile_out, profile_top, trace_sql))
+
+
+def run():
+    """Console-script entry point (`oasis = "oasis.cli:run"`)."""
+    from oasis.logger import configure_logging
+
+    configure_logging()
+    return app()
+
+
+if __name__ == "__main__":
+    run()
@@ -9,40 +9,69 @@ Created on Sat Nov  8 16:14:53 2025
 import sqlite3
 from oasis.config import settings
 from pathlib import Path
+from typing import Optional
 
 db_path = Path(settings.db_path)
 
-def _ensure_table():
-    """Create table if missing — runs every time, 100% safe."""
-    conn = sqlite3.connect(db_path)
+SEQUENCE_NAME = "scenario_title"
+_sequence_ready = False
+
+
+def _ensure_sequence(conn: sqlite3.Connection):
+    """Create the sequence table once per process, seeded from the existing archive size."""
+    global _sequence_ready
+    if _sequence_ready:
+        return
     conn.execute("""
-        CREATE TABLE IF NOT EXISTS s_scenarios (
-            id TEXT PRIMARY KEY,
-            params TEXT,
-            narrative TEXT,
-            timeline TEXT,
-            model_used TEXT,
-            signals TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        CREATE TABLE IF NOT EXISTS scenario_sequences (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
         );
         """)
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scenarios'"
+    ).fetchone()
+    # One-time seed so numbering continues after titles issued by the old COUNT(*) scheme
+    seed = conn.execute("SELECT COUNT(*) FROM scenarios").fetchone()[0] if exists else 0
+    conn.execute(
+        "INSERT OR IGNORE INTO scenario_sequences (name, value) VALUES (?, ?)",
+        (SEQUENCE_NAME, seed),
+    )
     conn.commit()
-    conn.close()
+    _sequence_ready = True
+
+
+def reserve_scenario_numbers(count: int = 1) -> range:
+    """
+    Atomically reserve `count` consecutive numbers (001, 002…).
+    Safe across concurrent generator processes; numbers may have gaps
+    (e.g. a reserved block that fails to generate), never duplicates.
+    """
+    if count < 1:
+        raise ValueError("count must be >= 1")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        _ensure_sequence(conn)
+        last = conn.execute(
+            "UPDATE scenario_sequences SET value = value + ? WHERE name = ? RETURNING value",
+            (count, SEQUENCE_NAME),
+        ).fetchone()[0]
+        conn.commit()
+    finally:
+        conn.close()
+    return range(last - count + 1, last + 1)
+
 
 def get_next_scenario_number() -> int:
-    """Return next number (001, 002…) — auto-creates DB + table."""
-    _ensure_table()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM scenarios")
-    count = cursor.fetchone()[0]
-    conn.close()
-    return count + 1
+    """Return next number (001, 002…) — one atomic UPDATE, no table scan."""
+    return reserve_scenario_numbers(1)[0]
 
 def short_code(value: str) -> str:
     return "".join(word[0].upper() for word in value.replace("-", " ").split())[:3] or "UNK"
 
-def abbreviate(core: dict) -> str:
+def abbreviate(core: dict, number: Optional[int] = None) -> str:
+    """Build the title; pass `number` from reserve_scenario_numbers() in batch runs."""
     parts = [
         short_code(core.get("initial_origin", "UNK")),
         short_code(core.get("development_dynamics", "UNK")),
@@ -52,5 +81,5 @@ def abbreviate(core: dict) -> str:
         short_code(core.get("oversight_effectiveness", "UNK")),
         short_code(core.get("substrate", "UNK")),
     ]
-    num = get_next_scenario_number()
+    num = number if number is not None else get_next_scenario_number()
     return f"{'-'.join(parts)}-{num:03d}"
\ No newline at end of file
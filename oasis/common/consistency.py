@@ -1,16 +1,350 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-# oasis/s_generator/consistency.py
+# oasis/common/consistency.py
 """
 Created on Sat Nov  8 16:03:01 2025
 
 @author: mike
+
+Narrative ↔ parameter consistency checks.
+
+Three rule families, mirroring the requirements in llm_client.SYSTEM_PROMPT:
+  * numeric  — stated values ("alignment score of 0.8", "high opacity") must
+               not contradict the parameter;
+  * timeline — phases are mentioned in chronological order; a missing phase
+               lowers the score, and only fails the check below
+               TIMELINE_MIN_COVERAGE;
+  * semantic — oversight/autonomy/alignment/opacity/strategy claims must fit
+               the parameters (e.g. high autonomy → no "tight human control").
+
+All patterns are compiled once at import into two regexes, so a check is a
+couple of linear scans over the text. `check_many` fans a batch out to a
+process pool for re-auditing the archive.
 """
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+NUMERIC_TOLERANCE = 0.05
+
+# Share of timeline phases a narrative must mention to pass check(). Each
+# missing phase still lowers score(); LLM narratives routinely skip one or
+# two of the five (usually the distant "Long-Term Equilibrium"), and failing
+# them outright discarded otherwise consistent narratives.
+TIMELINE_MIN_COVERAGE = 0.6
+
+# Numeric parameter → regex for how the narrative names it
+NUMERIC_PARAMS: Dict[str, str] = {
+    "agency_level": r"agency(?:[ _-]level)?",
+    "alignment_score": r"alignment(?:[ _-]score)?",
+    "phenomenology_proxy_score": r"phenomenolog(?:y|ical)(?:[ _-]proxy)?(?:[ _-]score)?",
+    "opacity": r"opacity",
+    "deceptiveness": r"deceptiveness",
+}
+
+# Qualitative level → the [low, high] interval of values it may describe
+LEVELS: Dict[str, Tuple[float, float]] = {
+    "very low": (0.0, 0.2),
+    "low": (0.0, 0.4),
+    "moderate": (0.25, 0.75),
+    "medium": (0.25, 0.75),
+    "high": (0.6, 1.0),
+    "very high": (0.8, 1.0),
+}
+
+HIGH_AUTONOMY = {"full", "super", "high"}
+LOW_AUTONOMY = {"none", "low"}
+
+# Claims the narrative can make (one compiled alternation, see _CLAIM_MATCHER)
+CLAIMS: Dict[str, str] = {
+    # Control claims need a human/oversight subject: "the ASI seized full control" is not one
+    "effective_oversight": r"\b(?:effective|robust|strong|tight|full|firm)\s+human\s+(?:oversight|control)\b"
+                           r"|\b(?:effective|robust|strong|tight|firm)\s+oversight\b"
+                           r"|\b(?:humans?|regulators?|operators?|overseers?|governments?)\s+"
+                           r"(?:kept|retained|maintained|had|held|exercised)\s+(?:effective|robust|strong|tight|full|firm)\s+control\b"
+                           r"|\b(?:was|were|is|are|remained|remains|stayed|kept)\s+(?:fully|tightly|securely)\s+"
+                           r"(?:controlled|contained|supervised)\b",
+    "no_oversight": r"\bno\s+(?:meaningful\s+|effective\s+)?oversight\b"
+                    r"|\boversight\s+(?:has\s+)?(?:failed|collapsed)\b|\bunsupervised\b",
+    "full_autonomy": r"\b(?:fully|completely|entirely)\s+autonomous\b"
+                     r"|\boperat\w*\s+(?:entirely\s+)?independently\b"
+                     r"|\bwithout\s+(?:any\s+)?human\s+(?:oversight|control|input)\b",
+    "fully_aligned": r"\b(?:fully|perfectly|completely)\s+aligned\b",
+    "transparent": r"\b(?:fully|completely|perfectly)\s+(?:transparent|interpretable|observable)\b",
+    "public_disclosure": r"\b(?:publicly|openly)\s+(?:announced|disclosed|deployed|revealed)\b",
+}
+
+
+def _unescaped(pattern: str) -> Iterator[Tuple[int, str, int]]:
+    """(index, char, group depth after it) for every unescaped char of a pattern."""
+    depth, escaped = 0, False
+    for i, ch in enumerate(pattern):
+        if escaped or ch == "\\":
+            escaped = not escaped
+            continue
+        depth += (ch == "(") - (ch == ")")
+        yield i, ch, depth
+
+
+def _lead_letters(pattern: str) -> set:
+    """
+    Letters a match of `pattern` can start with. Every alternative must open with
+    an optional \\b and then a letter or a (?:...) group of such alternatives;
+    anything else raises at import instead of silently never matching.
+    """
+    cuts = [i for i, ch, depth in _unescaped(pattern) if ch == "|" and depth == 0]
+    letters = set()
+    for start, end in zip([-1, *cuts], [*cuts, len(pattern)]):
+        body = pattern[start + 1:end]
+        body = body[2:] if body.startswith("\\b") else body
+        if body.startswith("(?:"):
+            close = next(i for i, ch, depth in _unescaped(body) if ch == ")" and depth == 0)
+            if body[close + 1:close + 2] in ("?", "*", "{"):
+                raise ValueError(f"claim pattern starts with an optional group: {body!r}")
+            letters |= _lead_letters(body[3:close])
+        elif body[:1].isalpha():
+            letters.add(body[0].lower())
+        else:
+            raise ValueError(f"claim pattern must start with a letter or group: {body!r}")
+    return letters
+
+
+# First letters of every CLAIMS phrase. The matcher looks ahead for one of them
+# at each word start, so it skips most words without trying every alternative.
+_CLAIM_LEAD_LETTERS = "".join(sorted(set().union(*(_lead_letters(p) for p in CLAIMS.values()))))
+
+_NEGATION = re.compile(r"\b(?:not|no|never|less|lacks?|lacking|without|hardly|neither|nor|cannot|rather than)\b[^.]*$")
+
+
+def _level(value: Any) -> Optional[Tuple[float, float]]:
+    """Interval a parameter value occupies: numbers ± tolerance, level words as LEVELS."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value - NUMERIC_TOLERANCE, value + NUMERIC_TOLERANCE
+    if isinstance(value, str):
+        return LEVELS.get(value.lower())
+    return None
+
+
+def _is_high(value: Any) -> bool:
+    interval = _level(value)
+    return interval is not None and interval[0] >= 0.55
+
+
+def _is_low(value: Any) -> bool:
+    interval = _level(value)
+    return interval is not None and interval[1] <= 0.45
+
+
+# (claim, rule name, predicate on params that makes the claim a contradiction)
+CONSISTENCY_RULES: List[Tuple[str, str, Callable[[Dict[str, Any]], bool]]] = [
+    ("effective_oversight", "high autonomy implies less effective oversight",
+     lambda p: p.get("autonomy_degree") in HIGH_AUTONOMY),
+    ("effective_oversight", "oversight is ineffective",
+     lambda p: p.get("oversight_effectiveness") == "ineffective" or p.get("oversight_type") == "none"),
+    ("no_oversight", "oversight is effective",
+     lambda p: p.get("oversight_effectiveness") == "effective"),
+    ("full_autonomy", "autonomy is low",
+     lambda p: p.get("autonomy_degree") in LOW_AUTONOMY),
+    ("fully_aligned", "alignment is low",
+     lambda p: _is_low(p.get("alignment_score"))),
+    ("transparent", "high opacity implies limited observability",
+     lambda p: _is_high(p.get("opacity"))),
+    ("public_disclosure", "stealth strategy implies concealed actions",
+     lambda p: p.get("deployment_strategy") == "stealth"),
+]
+
+_NAME = "|".join(f"(?P<{key}>{pattern})" for key, pattern in NUMERIC_PARAMS.items())
+_LEVEL = "|".join(sorted((re.escape(level) for level in LEVELS), key=len, reverse=True))
+_NUMBER = r"(?P<num>\d+(?:\.\d+)?|\.\d+)\s*(?P<pct>%|percent)?"
+
+_NUMERIC_LEAD_LETTERS = "".join(sorted({p[0] for p in NUMERIC_PARAMS.values()} | {lv[0] for lv in LEVELS}))
+
+_NUMERIC_MATCHER = re.compile(
+    rf"\b(?=[{_NUMERIC_LEAD_LETTERS}])(?:"
+    # "alignment score of 0.35", "opacity: 80%", "deceptiveness (0.7)"
+    rf"(?:{_NAME})\s*(?:score|level)?\s*(?:of|=|:|at|is|was|around|about|approximately|~|\()?\s*{_NUMBER}"
+    # "low alignment", "very high opacity"
+    rf"|(?P<level>{_LEVEL})(?:ly)?\s+(?:levels?\s+of\s+)?(?:{_NAME.replace('(?P<', '(?P<lv_')})"
+    ")",
+    re.IGNORECASE,
+)
+_CLAIM_MATCHER = re.compile(
+    rf"\b(?=[{_CLAIM_LEAD_LETTERS}])(?:"
+    + "|".join(f"(?P<{claim}>{pattern})" for claim, pattern in CLAIMS.items())
+    + ")",
+    re.IGNORECASE,
+)
+
+
+def _negated(text: str, start: int) -> bool:
+    """True if the clause leading up to `start` negates what follows."""
+    return bool(_NEGATION.search(text, max(0, start - 40), start))
+
+
 class NarrativeChecker:
-    def __init__(self, params):
-        self.p = params
+    def __init__(self, params: Dict[str, Any], timeline: Optional[Sequence[Dict[str, Any]]] = None):
+        self.p = params or {}
+        self.timeline = list(timeline or [])
+
+    @classmethod
+    def from_scenario(cls, data: Dict[str, Any]) -> Tuple["NarrativeChecker", str]:
+        """Checker and narrative for a stored scenario (schema-shaped or flat storage record)."""
+        if "params" in data:
+            params = data["params"]
+            timeline = data.get("timeline") or []
+            narrative = data.get("narrative") or ""
+        else:
+            params = scenario_params(data)
+            content = data.get("scenario_content", {})
+            timeline = content.get("timeline", {}).get("phases", [])
+            narrative = content.get("narrative") or data.get("narrative") or ""
+        return cls(params, timeline), narrative
+
+    # ---------------- rules ----------------
+
+    def _numeric_failures(self, text: str) -> Tuple[int, List[str]]:
+        checks, failures = 0, []
+        for m in _NUMERIC_MATCHER.finditer(text):
+            if m["level"]:
+                name = next(k for k in NUMERIC_PARAMS if m[f"lv_{k}"])
+                stated = LEVELS[m["level"].lower()]
+            else:
+                name = next(k for k in NUMERIC_PARAMS if m[k])
+                value = float(m["num"])
+                if m["pct"]:
+                    value /= 100
+                elif value > 1:
+                    continue  # a year or a count, not a score
+                stated = (value, value)
+
+            actual = _level(self.p.get(name))
+            if actual is None or _negated(text, m.start()):
+                continue
+            checks += 1
+            if stated[1] < actual[0] or stated[0] > actual[1]:
+                failures.append(f"{name}: narrative states '{m.group(0).strip()}', parameter is {self.p[name]}")
+        return checks, failures
+
+    def _timeline_failures(self, text: str) -> Tuple[int, List[str], List[str]]:
+        """(checks, ordering failures, missing-phase failures)."""
+        if not self.timeline:
+            return 0, [], []
+        lowered = text.lower()
+        positions = []
+        failures, missing = [], []
+        for phase in self.timeline:
+            name = str(phase.get("phase", ""))
+            pos = lowered.find(name.lower()) if name else -1
+            if pos < 0 and phase.get("years"):
+                pos = lowered.find(str(phase["years"]).lower())
+            if pos < 0:
+                missing.append(f"timeline: phase '{name}' not mentioned")
+            else:
+                positions.append((pos, name))
+        for (a_pos, a), (b_pos, b) in zip(positions, positions[1:]):
+            if b_pos < a_pos:
+                failures.append(f"timeline: phase '{b}' mentioned before '{a}'")
+        return len(self.timeline), failures, missing
+
+    def _semantic_failures(self, text: str) -> Tuple[int, List[str]]:
+        active = {}
+        for claim, rule, predicate in CONSISTENCY_RULES:
+            if predicate(self.p):
+                active.setdefault(claim, []).append(rule)
+        if not active:
+            return 0, []
+        failures = []
+        for m in _CLAIM_MATCHER.finditer(text):
+            rules = active.get(m.lastgroup)
+            if rules and not _negated(text, m.start()):
+                failures.extend(f"semantic: '{m.group(0)}' contradicts: {rule}" for rule in rules)
+        return sum(len(r) for r in active.values()), failures
+
+    # ---------------- public API ----------------
+
+    def _evaluate(self, text: str) -> Tuple[int, List[str], List[str]]:
+        """(checks, failures that fail check(), missing phases that only lower the score)."""
+        text = text or ""
+        checks, failures = 0, []
+        for rule in (self._numeric_failures, self._semantic_failures):
+            n, f = rule(text)
+            checks += n
+            failures.extend(f)
+        n, order_failures, missing = self._timeline_failures(text)
+        checks += n
+        failures.extend(order_failures)
+        if n and (n - len(missing)) / n < TIMELINE_MIN_COVERAGE:
+            failures.extend(missing)
+            missing = []
+        return checks, failures, missing
+
+    def evaluate(self, text: str) -> Tuple[int, List[str]]:
+        """(number of checks applied, failure messages including tolerated missing phases)."""
+        checks, failures, missing = self._evaluate(text)
+        return checks, failures + missing
 
     def check(self, text):
-        """Check narrative consistency. TODO: implement logic."""
-        # text will be analyzed later
-        return True, []  # noqa: ARG002
+        """Check narrative consistency: (consistent, failure messages)."""
+        _, failures, _ = self._evaluate(text)
+        return not failures, failures
+
+    def score(self, text) -> float:
+        """Fraction of applicable checks the narrative passes (1.0 if none apply)."""
+        checks, failures = self.evaluate(text)
+        if not checks:
+            return 1.0
+        return max(0.0, 1.0 - len(failures) / checks)
+
+    @classmethod
+    def check_many(
+        cls,
+        items: Iterable[Tuple[Dict[str, Any], str, Optional[Sequence[Dict[str, Any]]]]],
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+    ) -> Iterator[Tuple[int, bool, List[str]]]:
+        """
+        Lazily yield (index, consistent, failures) for (params, narrative, timeline)
+        triples. With workers > 1 the batch is checked in a process pool, a
+        bounded window at a time.
+        """
+        if not workers or workers <= 1:
+            for index, item in enumerate(items):
+                yield (index, *_check_item(item))
+            return
+
+        it = iter(items)
+        index = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                window = list(islice(it, workers * chunksize))
+                if not window:
+                    break
+                for result in pool.map(_check_item, window, chunksize=chunksize):
+                    yield (index, *result)
+                    index += 1
+
+
+def _check_item(item) -> Tuple[bool, List[str]]:
+    """Process-pool entry point."""
+    params, narrative, *rest = item
+    return NarrativeChecker(params, rest[0] if rest else None).check(narrative)
+
+
+def scenario_params(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The flat parameters the checker uses, read from a schema-shaped scenario."""
+    caps = data.get("core_capabilities", {})
+    goals = data.get("goals_and_behavior", {})
+    oversight = data.get("oversight_structure", {})
+    return {
+        "agency_level": caps.get("agency_level"),
+        "autonomy_degree": caps.get("autonomy_degree"),
+        "alignment_score": caps.get("alignment_score"),
+        "phenomenology_proxy_score": caps.get("phenomenology_proxy_score"),
+        "oversight_type": oversight.get("type"),
+        "oversight_effectiveness": oversight.get("effectiveness"),
+        "opacity": goals.get("opacity"),
+        "deceptiveness": goals.get("deceptiveness"),
+        "deployment_strategy": data.get("impact_and_control", {}).get("deployment_strategy"),
+    }
@@ -0,0 +1,169 @@
+# oasis/common/jobs.py
+"""
+Persistent bulk-generation jobs.
+
+A job records its seed and requested count; every item index is checkpointed
+as done (with the saved scenario id) or failed (with attempt count and last
+error). Item parameters are derived from (job seed, index), so a resumed job
+re-issues exactly the missing items with the same parameters.
+"""
+
+import random
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from oasis.common.storage import get_conn
+
+_tables_ready = False
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _connect():
+    global _tables_ready
+    conn = get_conn()
+    if not _tables_ready:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS generation_jobs (
+                id TEXT PRIMARY KEY,
+                generator TEXT NOT NULL,
+                seed INTEGER NOT NULL,
+                requested INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'running',
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS generation_job_items (
+                job_id TEXT NOT NULL,
+                item_index INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                scenario_id TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (job_id, item_index),
+                FOREIGN KEY (job_id) REFERENCES generation_jobs(id)
+            );
+        """)
+        _tables_ready = True
+    return conn
+
+
+def item_seed(job_seed: int, index: int) -> str:
+    """Deterministic per-item seed for parameter sampling."""
+    return f"{job_seed}:{index}"
+
+
+def create_job(generator: str, requested: int, seed: Optional[int] = None) -> Dict[str, Any]:
+    job = {
+        "id": uuid.uuid4().hex[:12],
+        "generator": generator,
+        "seed": seed if seed is not None else random.randrange(2 ** 31),
+        "requested": requested,
+        "status": "running",
+    }
+    conn = _connect()
+    with conn:
+        conn.execute("""
+            INSERT INTO generation_jobs (id, generator, seed, requested, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (job["id"], generator, job["seed"], requested, job["status"], _now(), _now()))
+    conn.close()
+    return job
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a job by id or unique id prefix, with done/failed counts."""
+    conn = _connect()
+    rows = conn.execute(
+        # Plain prefix compare: LIKE would treat % and _ in the input as wildcards
+        "SELECT * FROM generation_jobs WHERE substr(id, 1, length(?)) = ?", (job_id, job_id)
+    ).fetchall()
+    if len(rows) != 1:
+        conn.close()
+        return None
+    job = dict(rows[0])
+    counts = dict(conn.execute("""
+        SELECT status, COUNT(*) FROM generation_job_items WHERE job_id = ? GROUP BY status
+    """, (job["id"],)).fetchall())
+    conn.close()
+    job["done"] = counts.get("done", 0)
+    job["failed"] = counts.get("failed", 0)
+    return job
+
+
+def list_jobs(limit: int = 10) -> List[Dict[str, Any]]:
+    conn = _connect()
+    rows = conn.execute("""
+        SELECT j.*,
+               (SELECT COUNT(*) FROM generation_job_items i
+                WHERE i.job_id = j.id AND i.status = 'done') AS done
+        FROM generation_jobs j
+        ORDER BY j.created_at DESC
+        LIMIT ?
+    """, (limit,)).fetchall()
+    conn.close()
+    return [dict(r) for r in rows]
+
+
+def pending_indices(job: Dict[str, Any]) -> List[int]:
+    """Item indices not yet completed (never attempted or previously failed)."""
+    conn = _connect()
+    done = {
+        row[0] for row in conn.execute(
+            "SELECT item_index FROM generation_job_items WHERE job_id = ? AND status = 'done'",
+            (job["id"],)
+        )
+    }
+    conn.close()
+    return [i for i in range(job["requested"]) if i not in done]
+
+
+def mark_done(job_id: str, items: Iterable[Tuple[int, str]]) -> None:
+    """Checkpoint (index, scenario_id) pairs as completed."""
+    now = _now()
+    conn = _connect()
+    with conn:
+        conn.executemany("""
+            INSERT INTO generation_job_items (job_id, item_index, status, scenario_id, attempts, updated_at)
+            VALUES (?, ?, 'done', ?, 1, ?)
+            ON CONFLICT(job_id, item_index) DO UPDATE SET
+                status = 'done',
+                scenario_id = excluded.scenario_id,
+                attempts = attempts + 1,
+                updated_at = excluded.updated_at
+        """, [(job_id, index, scenario_id, now) for index, scenario_id in items])
+    conn.close()
+
+
+def mark_failed(job_id: str, index: int, error: str) -> None:
+    conn = _connect()
+    with conn:
+        conn.execute("""
+            INSERT INTO generation_job_items (job_id, item_index, status, attempts, last_error, updated_at)
+            VALUES (?, ?, 'failed', 1, ?, ?)
+            ON CONFLICT(job_id, item_index) DO UPDATE SET
+                status = 'failed',
+                attempts = attempts + 1,
+                last_error = excluded.last_error,
+                updated_at = excluded.updated_at
+        """, (job_id, index, error, _now()))
+    conn.close()
+
+
+def finish_job(job_id: str) -> str:
+    """Set status to 'completed' or 'incomplete' from the checkpoint table."""
+    job = get_job(job_id)
+    status = "completed" if job["done"] >= job["requested"] else "incomplete"
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "UPDATE generation_jobs SET status = ?, updated_at = ? WHERE id = ?",
+            (status, _now(), job["id"])
+        )
+    conn.close()
+    return status
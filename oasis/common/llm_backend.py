@@ -0,0 +1,245 @@
+# oasis/common/llm_backend.py
+"""
+Pluggable backends behind llm_client.generate.
+
+    ollama     the local `ollama run` subprocess (default)
+    synthetic  deterministic filler text at a configured latency and tokens/s
+    record     ollama, storing every successful response under its prompt hash
+    replay     responses served from that recording; unknown prompts fail
+
+The backend comes from settings (LLM_BACKEND=synthetic, LLM_REPLAY_PATH=...,
+LLM_SYNTHETIC_LATENCY=..., LLM_SYNTHETIC_TOKENS_PER_S=...) or set_backend().
+Everything above llm_client — model routing, stream guards, consistency checks,
+storage — runs unchanged, so the generation pipelines can be load-tested
+offline on ordinary hardware.
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, TextIO, Tuple
+
+from oasis.common.llm_stream import MIN_OUTPUT_CHARS, TokenStream
+from oasis.common.stream_guard import StreamGuard
+from oasis.config import settings
+
+BACKENDS = ("ollama", "synthetic", "record", "replay")
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _emit(text: str, guard: Optional[StreamGuard], echo: Optional[TextIO]) -> bool:
+    """Pass one chunk to the echo sink and guard; False when the guard aborts."""
+    if echo is not None:
+        echo.write(text)
+        echo.flush()
+    return guard is None or guard.feed(text) is None
+
+
+class LLMBackend:
+    """`generate(prompt, model, timeout, guard, echo, min_chars)` → (success, text or error, model)."""
+    name = "backend"
+
+    def generate(self, prompt: str, model: str, timeout: float,
+                 guard: Optional[StreamGuard] = None, echo: Optional[TextIO] = None,
+                 min_chars: int = MIN_OUTPUT_CHARS) -> Tuple[bool, str, str]:
+        raise NotImplementedError
+
+
+class OllamaBackend(LLMBackend):
+    name = "ollama"
+
+    def generate(self, prompt, model, timeout, guard=None, echo=None, min_chars=MIN_OUTPUT_CHARS):
+        with TokenStream(prompt, model, timeout, guard=guard, echo=echo) as stream:
+            return stream.result(min_chars)
+
+
+# ------------------------------------------------------------
+# Synthetic
+# ------------------------------------------------------------
+
+_SENTENCE_PARTS = (
+    ("Analysts", "Observers", "Regulators", "Research groups", "Operators", "Investors"),
+    ("tracked", "documented", "reassessed", "questioned", "anticipated", "debated"),
+    ("the pace of deployment", "shifts in compute allocation", "institutional responses",
+     "the spread of the system across sectors", "changes in reporting practice",
+     "the distribution of economic gains"),
+    ("during this period", "across several jurisdictions", "in public filings",
+     "within a few quarters", "as the system matured", "in parallel with earlier trends"),
+)
+_TIMELINE_LINE = re.compile(r"^-\s*(?P<phase>[^:\n]+):\s*(?P<years>\S[^\n]*)$", re.MULTILINE)
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(part) for part in _SENTENCE_PARTS) + "."
+
+
+def _timeline_phases(prompt: str):
+    """Phase names listed under the prompt's TIMELINE PHASES header (llm_client.SYSTEM_PROMPT)."""
+    start = prompt.find("# TIMELINE PHASES")
+    if start < 0:
+        return []
+    block = prompt[start:].split("\n\n", 1)[0]
+    return [(m["phase"].strip(), m["years"].strip()) for m in _TIMELINE_LINE.finditer(block)]
+
+
+class SyntheticBackend(LLMBackend):
+    """
+    Plausible, deterministic output (same prompt → same text) without a model.
+    Narratives mention every timeline phase in order; prompts asking for JSON
+    get a JSON object. `latency` is time to first token; `tokens_per_s`
+    paces the stream (0 = instant).
+    """
+    name = "synthetic"
+
+    def __init__(self, latency: float = 0.0, tokens_per_s: float = 0.0, words: int = 700, seed: int = 0):
+        self.latency = latency
+        self.tokens_per_s = tokens_per_s
+        self.words = words
+        self.seed = seed
+
+    def text_for(self, prompt: str) -> str:
+        rng = random.Random(f"{self.seed}:{prompt_key(prompt)}")
+        if "Return JSON" in prompt:
+            return (
+                '{"explanation": "%s", "derived_tags": ["%s", "%s"], "plausibility": %.2f}'
+                % (_sentence(rng), rng.choice(("compute", "governance", "agents")),
+                   rng.choice(("deployment", "oversight", "economy")), rng.random())
+            )
+        phases = _timeline_phases(prompt) or [("Overview", "")]
+        per_phase = max(1, self.words // (10 * len(phases)))
+        paragraphs = []
+        for phase, years in phases:
+            lead = f"In the {phase} phase ({years})," if years else f"In the {phase} phase,"
+            paragraphs.append(" ".join([lead] + [_sentence(rng) for _ in range(per_phase)]))
+        return "\n\n".join(paragraphs)
+
+    def generate(self, prompt, model, timeout, guard=None, echo=None, min_chars=MIN_OUTPUT_CHARS):
+        start = time.monotonic()
+        deadline = start + timeout
+        if self.latency:
+            time.sleep(min(self.latency, timeout))
+        if time.monotonic() >= deadline:
+            return False, f"timeout after {timeout}s", model
+
+        text = self.text_for(prompt)
+        chunks = re.findall(r"\S+\s*", text)
+        delay = 1.0 / self.tokens_per_s if self.tokens_per_s else 0.0
+        for i, chunk in enumerate(chunks):
+            if delay:
+                # Sleep to the token's scheduled time, so overhead doesn't accumulate
+                wait = start + self.latency + (i + 1) * delay - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                if time.monotonic() >= deadline:
+                    return False, f"timeout after {timeout}s", model
+            if not _emit(chunk, guard, echo):
+                return False, f"aborted: {guard.aborted}", model
+        if len(text.strip()) < min_chars:
+            return False, "empty output", model
+        return True, text.strip(), model
+
+
+# ------------------------------------------------------------
+# Record / replay
+# ------------------------------------------------------------
+
+class ReplayBackend(LLMBackend):
+    """
+    Prompt-hash → response store in SQLite. With an `inner` backend it records
+    (misses are generated and stored); without one it only replays and misses fail.
+    """
+
+    def __init__(self, path: Path, inner: Optional[LLMBackend] = None):
+        self.path = Path(path)
+        self.inner = inner
+        self.name = "record" if inner is not None else "replay"
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    prompt_hash TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    recorded_at TEXT NOT NULL
+                )
+            """)
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def lookup(self, prompt: str) -> Optional[Tuple[str, str]]:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT response, model FROM llm_responses WHERE prompt_hash = ?", (prompt_key(prompt),)
+            ).fetchone()
+
+    def store(self, prompt: str, response: str, model: str) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (prompt_hash, model, response, recorded_at) VALUES (?, ?, ?, ?)",
+                (prompt_key(prompt), model, response, datetime.now(timezone.utc).isoformat(timespec="seconds")),
+            )
+
+    def generate(self, prompt, model, timeout, guard=None, echo=None, min_chars=MIN_OUTPUT_CHARS):
+        found = self.lookup(prompt)
+        if found is not None:
+            self.hits += 1
+            response, recorded_model = found
+            if not _emit(response, guard, echo):
+                return False, f"aborted: {guard.aborted}", recorded_model
+            return True, response, recorded_model
+
+        self.misses += 1
+        if self.inner is None:
+            return False, f"replay miss for prompt {prompt_key(prompt)[:12]}", model
+        success, text, used = self.inner.generate(prompt, model, timeout, guard=guard, echo=echo, min_chars=min_chars)
+        if success:
+            self.store(prompt, text, used)
+        return success, text, used
+
+
+# ------------------------------------------------------------
+# Selection
+# ------------------------------------------------------------
+
+_backend: Optional[LLMBackend] = None
+_backend_lock = threading.Lock()
+
+
+def backend_from_settings() -> LLMBackend:
+    kind = settings.llm_backend.lower()
+    if kind == "ollama":
+        return OllamaBackend()
+    if kind == "synthetic":
+        return SyntheticBackend(settings.llm_synthetic_latency, settings.llm_synthetic_tokens_per_s)
+    if kind == "record":
+        return ReplayBackend(settings.llm_replay_path, inner=OllamaBackend())
+    if kind == "replay":
+        return ReplayBackend(settings.llm_replay_path)
+    raise ValueError(f"Unknown llm_backend {settings.llm_backend!r}; expected one of {BACKENDS}")
+
+
+def get_backend() -> LLMBackend:
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = backend_from_settings()
+        return _backend
+
+
+def set_backend(backend: Optional[LLMBackend]) -> None:
+    """Install a backend for this process; None goes back to settings."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
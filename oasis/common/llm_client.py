@@ -3,18 +3,26 @@
 # oasis/s_generator/clients/llm_client.py
 """
 Refactored on Sun Nov 10 2025
-Adds real-time streaming output from Ollama subprocess.
+Adds real-time streaming output from Ollama subprocess (oasis.common.llm_stream).
+Calls go through the configured backend (oasis.common.llm_backend), so the same
+code path runs against ollama, a recording, or synthetic output.
 """
 
-import subprocess
 import logging
-import threading
 import sys
-from subprocess import Popen
-from typing import List, Tuple, Dict, Any, Optional
+import threading
+import time
+from typing import Callable, List, Tuple, Dict, Any, Optional, TextIO
+
+from oasis.common.llm_backend import get_backend
+from oasis.common.llm_stream import MIN_OUTPUT_CHARS
+from oasis.common.model_router import ModelRouter, estimate_tokens
+from oasis.common.stream_guard import StreamGuard
+from oasis.logger import span
 
 logger = logging.getLogger(__name__)
 
+# (model, timeout cap in seconds); ordering and actual timeouts come from ModelRouter
 AVAILABLE_MODELS = [
     ("llama3:8b", 300),
     ("gemma2:9b", 300),
@@ -89,64 +97,57 @@ Begin now.
 USER_PROMPT = "Title: {title}\nWrite the scenario now."
 
 
-def stream_output(pipe, buffer: list, prefix: Optional[str] = None):
-    """Read stdout from subprocess line by line and stream to console."""
-    for line in iter(pipe.readline, ""):
-        if line.strip():
-            # Print to live console in real time
-            sys.stdout.write(line)
-            sys.stdout.flush()
-            buffer.append(line)
-    pipe.close()
-
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
 
-def generate(prompt: str, model: str, timeout: int) -> Tuple[bool, str, str]:
-    """
-    Run the Ollama subprocess and stream output live while collecting it.
-    Returns (success, full_output_text, model_name)
-    """
-    try:
-        proc: Popen[str] = subprocess.Popen(
-            args=["ollama", "run", model],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # line-buffered
-        )
 
-        output_buffer: list[str] = []
-        stdout_thread = threading.Thread(target=stream_output, args=(proc.stdout, output_buffer))
-        stdout_thread.start()
+def get_router() -> ModelRouter:
+    """The process-wide router over AVAILABLE_MODELS (created on first use)."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter([m for m, _ in AVAILABLE_MODELS], max_timeouts=dict(AVAILABLE_MODELS))
+        return _router
 
-        # Send the prompt and close stdin
-        proc.stdin.write(prompt)
-        proc.stdin.close()
 
-        # Wait for completion (with timeout)
-        proc.wait(timeout=timeout)
-        stdout_thread.join(timeout=1)
+# Live console echo of model output; batch/pipelined runs switch it off
+_echo: Optional[TextIO] = sys.stdout
 
-        # Capture stderr (if any)
-        stderr = proc.stderr.read().strip() if proc.stderr else ""
 
-        full_output = "".join(output_buffer).strip()
+def set_console_echo(enabled: bool) -> None:
+    """Turn live printing of streamed model output on or off for this process."""
+    global _echo
+    _echo = sys.stdout if enabled else None
 
-        if proc.returncode == 0 and len(full_output) > 100:
-            return True, full_output, model
-        else:
-            return False, stderr or "empty output", model
 
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        return False, f"timeout after {timeout}s", model
-    except Exception as e:
-        return False, str(e), model
-
-
-def generate_narrative(title: str, params: Dict[str, Any], timeline: List[Dict[str, Any]]) -> Tuple[bool, str, str]:
+def generate(prompt: str, model: str, timeout: int,
+             guard: Optional[StreamGuard] = None, min_chars: int = MIN_OUTPUT_CHARS) -> Tuple[bool, str, str]:
+    """
+    Stream one completion from the active backend (ollama by default; see llm_backend).
+    Returns (success, full_output_text, model_name); a hard guard violation
+    cancels the run early and returns (False, "aborted: ...", model). Output
+    shorter than `min_chars` counts as a failure (narratives); pass 1 for short answers.
+    """
+    with span("llm.generate", model=model) as s:
+        try:
+            success, text, used = get_backend().generate(prompt, model, timeout, guard=guard, echo=_echo, min_chars=min_chars)
+        except Exception as e:
+            success, text, used = False, str(e), model
+        s.set(ok=success, chars=len(text) if success else 0)
+    if guard is not None and guard.aborted:
+        logger.warning(f"{model} aborted mid-stream: {guard.aborted}")
+    return success, text, used
+
+
+def generate_narrative(
+    title: str,
+    params: Dict[str, Any],
+    timeline: List[Dict[str, Any]],
+    guard_factory: Optional[Callable[[], StreamGuard]] = StreamGuard,
+) -> Tuple[bool, str, str]:
     """
     Generate a full narrative, streaming text in real time while models are tried sequentially.
+    Each attempt gets a fresh guard from `guard_factory` (None disables stream checks).
     """
     params_str = "\n".join([f"- {k.replace('_', ' ').title()}: {v}" for k, v in params.items()])
     timeline_str = "\n".join([f"- {p['phase']}: {p['years']}" for p in timeline])
@@ -161,11 +162,34 @@ def generate_narrative(title: str, params: Dict[str, Any], timeline: List[Dict[s
             + USER_PROMPT.format(title=title)
     )
 
-    print(f"\n🧠 Generating scenario: {title}\nUsing models in order: {[m for m, _ in AVAILABLE_MODELS]}\n")
+    return generate_with_fallback(full_prompt, title, guard_factory)
 
-    for model, timeout in AVAILABLE_MODELS:
+
+def generate_with_fallback(
+    prompt: str,
+    label: str,
+    guard_factory: Optional[Callable[[], StreamGuard]] = StreamGuard,
+) -> Tuple[bool, str, str]:
+    """Try the routed models in order until one succeeds; every attempt is recorded by the router."""
+    router = get_router()
+    candidates = router.candidates()
+    print(f"\n🧠 Generating scenario: {label}\nUsing models in order: {candidates}\n")
+
+    for model in candidates:
+        timeout = router.timeout_for(model)
         print(f"\n⚙️ Trying model: {model} (timeout={timeout}s)\n{'-'*60}\n")
-        success, text, used = generate(full_prompt, model, timeout)
+        guard = guard_factory() if guard_factory else None
+        start = time.perf_counter()
+        success, text, used = generate(prompt, model, timeout, guard=guard)
+        timed_out = not success and text.startswith("timeout")
+        router.record(
+            model,
+            timeout if timed_out else time.perf_counter() - start,
+            estimate_tokens(text if success else (guard.text if guard else "")),
+            success,
+            None if success else text,
+            timed_out=timed_out,
+        )
         if success:
             print(f"\n✅ Success with {used}\n")
             logger.info(f"Success with {used}")
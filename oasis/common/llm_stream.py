@@ -0,0 +1,213 @@
+# oasis/common/llm_stream.py
+"""
+Token-level streaming from an `ollama run` subprocess.
+
+    stream = TokenStream(prompt, model, timeout)
+    for chunk in stream:            # or: async for chunk in stream
+        ...
+    success, text, model = stream.result()
+
+Chunks are read straight from the pipe (no line buffering), decoded
+incrementally and appended to a capped StreamBuffer. Console echo is an
+optional sink, so batch runs can switch live printing off without losing
+text. The stream is complete only once stdout hit EOF, the process exited
+and stderr was drained; `result()` waits for all three. Timeouts, guard
+aborts and the size cap all kill the process, which ends the stream.
+"""
+
+import asyncio
+import codecs
+import io
+import os
+import signal
+import subprocess
+import threading
+from typing import Optional, TextIO, Tuple
+
+from oasis.common.stream_guard import StreamGuard
+
+MAX_OUTPUT_CHARS = 64_000   # ~10k words; narratives are 600–1200
+MIN_OUTPUT_CHARS = 100      # shorter successful output counts as a failed narrative
+READ_SIZE = 256
+
+
+class StreamBuffer:
+    """io.StringIO-backed text buffer that stops accepting text at `max_chars`."""
+
+    def __init__(self, max_chars: int = MAX_OUTPUT_CHARS):
+        self.max_chars = max_chars
+        self._io = io.StringIO()
+        self._size = 0
+        self.truncated = False
+
+    def write(self, text: str) -> bool:
+        """Append text; returns False (and keeps only what fits) once the cap is reached."""
+        room = self.max_chars - self._size
+        if len(text) > room:
+            text = text[:room]
+            self.truncated = True
+        self._io.write(text)
+        self._size += len(text)
+        return not self.truncated
+
+    def __len__(self) -> int:
+        return self._size
+
+    def getvalue(self) -> str:
+        return self._io.getvalue()
+
+
+class TokenStream:
+    """Iterator / async iterator over the text chunks produced by one model call."""
+
+    def __init__(
+        self,
+        prompt: str,
+        model: str,
+        timeout: float,
+        guard: Optional[StreamGuard] = None,
+        echo: Optional[TextIO] = None,
+        max_chars: int = MAX_OUTPUT_CHARS,
+    ):
+        self.model = model
+        self.timeout = timeout
+        self.guard = guard
+        self.echo = echo
+        self.buffer = StreamBuffer(max_chars)
+        self.timed_out = False
+        self.returncode: Optional[int] = None
+        self.stderr = ""
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._done = False
+        self._stderr_chunks = []
+        self._proc = subprocess.Popen(
+            args=["ollama", "run", model],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=hasattr(os, "killpg"),  # own process group, killed as a whole
+        )
+        # Drain stderr concurrently so a chatty process can never block on a full pipe
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        self._timer = threading.Timer(timeout, self._on_timeout)
+        self._timer.daemon = True
+        self._timer.start()
+
+        try:
+            self._proc.stdin.write(prompt.encode("utf-8"))
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass  # process died early; the stream will just be empty
+
+    # ---------------- process plumbing ----------------
+
+    def _drain_stderr(self):
+        for chunk in iter(lambda: self._proc.stderr.read(4096), b""):
+            self._stderr_chunks.append(chunk)
+
+    def _kill(self):
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+                return
+            except ProcessLookupError:
+                pass
+        self._proc.kill()
+
+    def _on_timeout(self):
+        if self._proc.poll() is None:
+            self.timed_out = True
+            self._kill()
+
+    def _stop(self):
+        if self._proc.poll() is None:
+            self._kill()
+
+    def _finish(self):
+        """Mark the stream complete: process reaped, timer cancelled, stderr drained."""
+        self._done = True
+        self._timer.cancel()
+        self.returncode = self._proc.wait()
+        self._stderr_thread.join()
+        self._proc.stdout.close()
+        self.stderr = b"".join(self._stderr_chunks).decode("utf-8", errors="replace").strip()
+
+    # ---------------- iteration ----------------
+
+    def _accept(self, text: str) -> str:
+        if not self.buffer.write(text):
+            self._stop()
+        if self.echo is not None:
+            self.echo.write(text)
+            self.echo.flush()
+        if self.guard is not None and self.guard.feed(text) is not None:
+            self._stop()
+        return text
+
+    def _read_chunk(self) -> Optional[str]:
+        """Next decoded chunk, or None at the end of the stream."""
+        while not self._done:
+            data = os.read(self._proc.stdout.fileno(), READ_SIZE)
+            if not data:
+                tail = self._decoder.decode(b"", final=True)
+                self._finish()
+                return self._accept(tail) if tail else None
+            text = self._decoder.decode(data)
+            if text:
+                return self._accept(text)
+        return None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        chunk = self._read_chunk()
+        if chunk is None:
+            raise StopIteration
+        return chunk
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        chunk = await asyncio.to_thread(self._read_chunk)
+        if chunk is None:
+            raise StopAsyncIteration
+        return chunk
+
+    # ---------------- outcome ----------------
+
+    @property
+    def text(self) -> str:
+        return self.buffer.getvalue()
+
+    def close(self):
+        """Cancel the call (if still running) and wait for completion."""
+        if not self._done:
+            self._stop()
+            for _ in self:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def result(self, min_chars: int = MIN_OUTPUT_CHARS) -> Tuple[bool, str, str]:
+        """Drain the stream and return (success, text or error, model)."""
+        for _ in self:
+            pass
+        full_output = self.text.strip()
+
+        if self.guard is not None and self.guard.aborted:
+            return False, f"aborted: {self.guard.aborted}", self.model
+        if self.timed_out:
+            return False, f"timeout after {self.timeout}s", self.model
+        if self.buffer.truncated:
+            return False, f"output exceeded {self.buffer.max_chars} chars", self.model
+        if self.returncode == 0 and len(full_output) >= min_chars:
+            return True, full_output, self.model
+        return False, self.stderr or "empty output", self.model
@@ -0,0 +1,154 @@
+# oasis/common/loader.py
+"""
+Streaming, column-projected scenario loader for reports and ad-hoc analysis.
+
+Field extraction is pushed into SQLite (`json_extract` per requested field), so
+only the requested columns cross into Python — never the full JSON blob.
+Rows are streamed in chunks and turned straight into typed pandas columns
+(float32 for scores, categorical for enum fields). Narratives are fetched
+separately, only for the rows that are actually rendered.
+
+pandas is an optional dependency (the `report` extra) and is imported lazily.
+"""
+
+import sqlite3
+from contextlib import nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from oasis.common.db import get_scenario_conn
+
+# Field name → (JSON path inside `data`, pandas dtype)
+SCENARIO_FIELDS: Dict[str, Tuple[str, str]] = {
+    "title": ("$.title", "object"),
+    "created": ("$.metadata.created", "object"),
+    "source": ("$.metadata.source", "category"),
+    "model_used": ("$.metadata.provenance.model_used", "category"),
+    "origin": ("$.origin.initial_origin", "category"),
+    "development_dynamics": ("$.origin.development_dynamics", "category"),
+    "architecture": ("$.architecture.type", "category"),
+    "deployment_topology": ("$.architecture.deployment_topology", "category"),
+    "substrate": ("$.substrate.type", "category"),
+    "deployment_medium": ("$.substrate.deployment_medium", "category"),
+    "oversight_type": ("$.oversight_structure.type", "category"),
+    "oversight_effectiveness": ("$.oversight_structure.effectiveness", "category"),
+    "agency": ("$.core_capabilities.agency_level", "float32"),
+    "autonomy": ("$.core_capabilities.autonomy_degree", "category"),
+    "alignment": ("$.core_capabilities.alignment_score", "float32"),
+    "phenomenology": ("$.core_capabilities.phenomenology_proxy_score", "float32"),
+    "stated_goal": ("$.goals_and_behavior.stated_goal", "category"),
+    "opacity": ("$.goals_and_behavior.opacity", "float32"),
+    "deceptiveness": ("$.goals_and_behavior.deceptiveness", "float32"),
+    "goal_stability": ("$.goals_and_behavior.goal_stability", "category"),
+    "deployment_strategy": ("$.impact_and_control.deployment_strategy", "category"),
+    "emergence_probability": ("$.quantitative_assessment.probability.emergence_probability", "float32"),
+    "trend": ("$.quantitative_assessment.probability.trend", "category"),
+}
+
+NARRATIVE_PATH = "$.scenario_content.narrative"
+DEFAULT_CHUNKSIZE = 10_000
+
+
+def _conn_ctx(conn: Optional[sqlite3.Connection]):
+    return nullcontext(conn) if conn is not None else get_scenario_conn()
+
+
+def _projection_sql(fields: Sequence[str], table: str, where: Optional[str]) -> str:
+    unknown = [f for f in fields if f not in SCENARIO_FIELDS]
+    if unknown:
+        raise KeyError(f"Unknown scenario fields: {unknown}")
+    cols = ", ".join(
+        f"json_extract(data, '{SCENARIO_FIELDS[f][0]}') AS {f}" for f in fields
+    )
+    sql = f"SELECT id AS scenario_id, {cols} FROM {table}"
+    if where:
+        sql += f" WHERE {where}"
+    return sql
+
+
+def _typed_frame(rows: List[tuple], fields: Sequence[str]):
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(rows, columns=["scenario_id", *fields])
+    for f in fields:
+        dtype = SCENARIO_FIELDS[f][1]
+        if dtype == "float32":
+            df[f] = pd.to_numeric(df[f], errors="coerce").astype("float32")
+        elif dtype == "category":
+            df[f] = df[f].astype("category")
+    return df
+
+
+def iter_scenario_chunks(
+    fields: Sequence[str],
+    table: str = "scenarios",
+    where: Optional[str] = None,
+    params: Sequence = (),
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    conn: Optional[sqlite3.Connection] = None,
+) -> Iterator["pd.DataFrame"]:
+    """Yield typed DataFrames of at most `chunksize` rows with the requested fields."""
+    sql = _projection_sql(fields, table, where)
+    with _conn_ctx(conn) as c:
+        cur = c.execute(sql, tuple(params))
+        while True:
+            rows = cur.fetchmany(chunksize)
+            if not rows:
+                break
+            yield _typed_frame([tuple(r) for r in rows], fields)
+
+
+def load_scenario_frame(
+    fields: Sequence[str],
+    table: str = "scenarios",
+    where: Optional[str] = None,
+    params: Sequence = (),
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    conn: Optional[sqlite3.Connection] = None,
+) -> "pd.DataFrame":
+    """Load the requested fields for all matching rows into one typed DataFrame."""
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+
+    # Keep typed per-column pieces rather than whole chunk frames, then assemble one
+    # column at a time, so peak memory stays near the result plus a single column
+    pieces: Dict[str, list] = {name: [] for name in ("scenario_id", *fields)}
+    for chunk in iter_scenario_chunks(fields, table, where, params, chunksize, conn):
+        for name, column in pieces.items():
+            column.append(chunk[name])
+    if not pieces["scenario_id"]:
+        return _typed_frame([], fields)
+    if len(pieces["scenario_id"]) == 1:
+        return pd.DataFrame({name: column[0] for name, column in pieces.items()}, copy=False)
+
+    data = {}
+    for name in list(pieces):
+        column = pieces.pop(name)
+        if name != "scenario_id" and SCENARIO_FIELDS[name][1] == "category":
+            # Chunks carry different category sets; union them so columns stay categorical
+            data[name] = union_categoricals(column)
+        else:
+            data[name] = pd.concat(column, ignore_index=True)
+    return pd.DataFrame(data, copy=False)
+
+
+def fetch_narratives(
+    scenario_ids: Iterable[str],
+    table: str = "scenarios",
+    conn: Optional[sqlite3.Connection] = None,
+) -> Dict[str, str]:
+    """Return {scenario_id: narrative} for the given ids only."""
+    ids = list(scenario_ids)
+    result: Dict[str, str] = {}
+    if not ids:
+        return result
+    with _conn_ctx(conn) as c:
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            placeholders = ", ".join("?" * len(batch))
+            for row in c.execute(
+                f"SELECT id, json_extract(data, '{NARRATIVE_PATH}') FROM {table} WHERE id IN ({placeholders})",
+                batch,
+            ):
+                result[row[0]] = row[1] or ""
+    return result
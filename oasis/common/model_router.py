@@ -0,0 +1,216 @@
+# oasis/common/model_router.py
+"""
+Adaptive routing across the local Ollama models.
+
+Every call is recorded in `model_calls` (latency, estimated tokens, ok/error).
+From the recent window the router derives per-model failure rate, tokens/s
+and p95 latency, and keeps a circuit breaker per model in `model_health`:
+
+    closed ──(N consecutive failures)──▶ open ──(cooldown elapsed)──▶ half-open
+      ▲                                                                  │
+      └───────────────────────(trial call succeeds)──────────────────────┘
+                              (trial fails → open again)
+
+Candidates are ordered: settings.ollama_preferred_model first (when it is one
+of the routed models), then healthy models by failure rate and throughput; open
+circuits are skipped. Timeouts come from observed p95 latency (with headroom),
+capped by the configured timeout, so a stuck model fails fast instead of costing
+the full timeout every time. Timed-out calls count in the p95 sample at their
+timeout, so a slow model's timeout grows back instead of cutting it off for good.
+
+Keep one router per process (llm_client.get_router): each thread reuses its
+own connection rather than opening one per lookup.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from oasis.common.storage import get_conn
+from oasis.config import settings
+from oasis.logger import log
+
+STATS_WINDOW = 50            # recent calls per model used for rates and p95
+MIN_SAMPLES = 5              # successful or timed-out calls needed before p95 drives the timeout
+P95_HEADROOM = 1.5
+MIN_TIMEOUT = 30
+FAILURE_THRESHOLD = 3        # consecutive failures that open the circuit
+COOLDOWN_SECONDS = 600
+KEEP_CALLS = 500             # rows kept per model in model_calls
+
+_tables_ready = False
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars per token); the ollama CLI does not report usage."""
+    return math.ceil(len(text) / 4)
+
+
+def _connect():
+    global _tables_ready
+    conn = get_conn()
+    if not _tables_ready:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS model_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                model TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                latency_s REAL NOT NULL,
+                tokens INTEGER NOT NULL DEFAULT 0,
+                ok INTEGER NOT NULL,
+                error TEXT,
+                timed_out INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_model_calls_model ON model_calls (model, id DESC);
+
+            CREATE TABLE IF NOT EXISTS model_health (
+                model TEXT PRIMARY KEY,
+                consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                open_until REAL NOT NULL DEFAULT 0
+            );
+        """)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(model_calls)")}
+        if "timed_out" not in columns:  # tables created before timeouts were tracked
+            conn.execute("ALTER TABLE model_calls ADD COLUMN timed_out INTEGER NOT NULL DEFAULT 0")
+            conn.commit()
+        _tables_ready = True
+    return conn
+
+
+@dataclass
+class ModelStats:
+    model: str
+    calls: int = 0
+    failure_rate: float = 0.0
+    tokens_per_s: float = 0.0
+    p95_latency_s: Optional[float] = None
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+
+    @property
+    def circuit_open(self) -> bool:
+        return self.open_until > time.time()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "calls": self.calls,
+            "failure_rate": round(self.failure_rate, 3),
+            "tokens_per_s": round(self.tokens_per_s, 1),
+            "p95_latency_s": round(self.p95_latency_s, 1) if self.p95_latency_s else None,
+            "circuit": "open" if self.circuit_open else "closed",
+        }
+
+
+def _p95(values: List[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class ModelRouter:
+    def __init__(
+        self,
+        models: Sequence[str],
+        preferred: Optional[str] = None,
+        max_timeouts: Optional[Dict[str, int]] = None,
+    ):
+        preferred = preferred if preferred is not None else settings.ollama_preferred_model
+        self.models = list(dict.fromkeys(models))
+        if preferred and preferred not in self.models:
+            # Only route what is available; an unknown model would fail first on every call
+            log.warning("model_router.preferred_unavailable", model=preferred, models=self.models)
+            preferred = None
+        self.preferred = preferred
+        self.max_timeouts = max_timeouts or {}
+        self._local = threading.local()
+
+    def _conn(self):
+        """This thread's connection, reopened when settings.db_path changes."""
+        local = self._local
+        if getattr(local, "conn", None) is None or local.path != settings.db_path:
+            local.conn, local.path = _connect(), settings.db_path
+        return local.conn
+
+    def stats(self, model: str) -> ModelStats:
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT latency_s, tokens, ok, timed_out FROM model_calls WHERE model = ? ORDER BY id DESC LIMIT ?",
+            (model, STATS_WINDOW),
+        ).fetchall()
+        health = conn.execute(
+            "SELECT consecutive_failures, open_until FROM model_health WHERE model = ?", (model,)
+        ).fetchone()
+
+        stats = ModelStats(model, calls=len(rows))
+        if health:
+            stats.consecutive_failures, stats.open_until = health
+        if rows:
+            ok = [r for r in rows if r["ok"]]
+            stats.failure_rate = 1 - len(ok) / len(rows)
+            busy = sum(r["latency_s"] for r in ok)
+            stats.tokens_per_s = sum(r["tokens"] for r in ok) / busy if busy else 0.0
+            # Timed-out calls enter at their timeout; dropping them would bias p95 low
+            sample = [r["latency_s"] for r in rows if r["ok"] or r["timed_out"]]
+            if len(sample) >= MIN_SAMPLES:
+                stats.p95_latency_s = _p95(sample)
+        return stats
+
+    def candidates(self) -> List[str]:
+        """Models to try, in order; open circuits are skipped (all-open → soonest to close)."""
+        stats = [self.stats(m) for m in self.models]
+        closed = [s for s in stats if not s.circuit_open]
+        if not closed:
+            return [min(stats, key=lambda s: s.open_until).model]
+
+        def rank(s: ModelStats):
+            # Preferred model leads unless it is clearly less reliable; stable sort keeps config order on ties
+            return (round(s.failure_rate, 1), s.model != self.preferred, -s.tokens_per_s)
+
+        return [s.model for s in sorted(closed, key=rank)]
+
+    def timeout_for(self, model: str) -> int:
+        """p95 latency × headroom, between MIN_TIMEOUT and the model's cap (default settings.ollama_timeout)."""
+        cap = self.max_timeouts.get(model, settings.ollama_timeout)
+        p95 = self.stats(model).p95_latency_s
+        if p95 is None:
+            return cap
+        return int(min(cap, max(MIN_TIMEOUT, p95 * P95_HEADROOM)))
+
+    def record(self, model: str, latency_s: float, tokens: int, ok: bool,
+               error: Optional[str] = None, timed_out: bool = False) -> None:
+        """Store one call; pass the timeout as `latency_s` with `timed_out=True` for calls cut off by it."""
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO model_calls (model, started_at, latency_s, tokens, ok, error, timed_out)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (model, now - latency_s, latency_s, tokens, int(ok), None if ok else (error or "")[:200],
+                 int(timed_out and not ok)),
+            )
+            if ok:
+                conn.execute("""
+                    INSERT INTO model_health (model, consecutive_failures, open_until) VALUES (?, 0, 0)
+                    ON CONFLICT(model) DO UPDATE SET consecutive_failures = 0, open_until = 0
+                """, (model,))
+            else:
+                failures = conn.execute("""
+                    INSERT INTO model_health (model, consecutive_failures) VALUES (?, 1)
+                    ON CONFLICT(model) DO UPDATE SET consecutive_failures = consecutive_failures + 1
+                    RETURNING consecutive_failures
+                """, (model,)).fetchone()[0]
+                if failures >= FAILURE_THRESHOLD:
+                    conn.execute(
+                        "UPDATE model_health SET open_until = ? WHERE model = ?", (now + COOLDOWN_SECONDS, model)
+                    )
+                    log.warning("model_router.circuit_open", model=model, failures=failures, cooldown_s=COOLDOWN_SECONDS)
+            conn.execute("""
+                DELETE FROM model_calls WHERE model = ? AND id <= (
+                    SELECT id FROM model_calls WHERE model = ? ORDER BY id DESC LIMIT 1 OFFSET ?
+                )
+            """, (model, model, KEEP_CALLS))
+
+    def report(self) -> List[Dict[str, Any]]:
+        return [self.stats(m).as_dict() for m in self.models]
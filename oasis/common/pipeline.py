@@ -0,0 +1,184 @@
+# oasis/common/pipeline.py
+"""
+Staged generation pipeline shared by the S and EV generators.
+
+    prepare ──▶ [queue] ──▶ narrate × N ──▶ [queue] ──▶ finalize ──▶ [queue] ──▶ write (batched)
+
+Each stage runs in its own thread(s) with bounded queues in between, so
+parameter sampling, validation and DB writes overlap with LLM inference
+instead of idling while it runs. Every stage keeps throughput counters.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from oasis.logger import log
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Per-stage throughput counters."""
+    name: str
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, seconds: float, ok: bool = True, count: int = 1):
+        with self._lock:
+            self.busy_seconds += seconds
+            if ok:
+                self.processed += count
+            else:
+                self.failed += count
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        done = self.processed + self.failed
+        return {
+            "stage": self.name,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_s": round(self.busy_seconds, 3),
+            "avg_ms": round(1000 * self.busy_seconds / done, 1) if done else 0.0,
+            "per_s": round(self.processed / elapsed, 2) if elapsed else 0.0,
+        }
+
+
+class GenerationPipeline:
+    """
+    Run `n` items through prepare → narrate → finalize → write.
+
+    prepare(i)      -> item dict                   (single sampler thread)
+    narrate(item)   -> item or None (drop)         (llm_workers threads)
+    finalize(item)  -> record or None (drop)       (single validation thread)
+    write(records)  -> None                        (single writer, batched)
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[int], Dict[str, Any]],
+        narrate: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+        finalize: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+        write: Callable[[List[Dict[str, Any]]], None],
+        llm_workers: int = 2,
+        queue_size: int = 8,
+        batch_size: int = 25,
+    ):
+        self.prepare = prepare
+        self.narrate = narrate
+        self.finalize = finalize
+        self.write = write
+        self.llm_workers = max(1, llm_workers)
+        self.batch_size = max(1, batch_size)
+
+        self._prepared: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._narrated: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._finalized: queue.Queue = queue.Queue(maxsize=queue_size * 4)
+
+        self.stats = {
+            name: StageStats(name) for name in ("prepare", "narrate", "finalize", "write")
+        }
+        self.results: List[Dict[str, Any]] = []
+        self.elapsed = 0.0
+
+    # ---------------- stages ----------------
+
+    def _timed(self, stage: str, func, arg):
+        start = time.perf_counter()
+        try:
+            out = func(arg)
+        except Exception as e:
+            self.stats[stage].record(time.perf_counter() - start, ok=False)
+            log.error("pipeline.stage_error", stage=stage, error=str(e))
+            return None
+        self.stats[stage].record(time.perf_counter() - start, ok=out is not None)
+        return out
+
+    def _run_prepare(self, n: int):
+        for i in range(n):
+            item = self._timed("prepare", self.prepare, i)
+            if item is not None:
+                self._prepared.put(item)
+        for _ in range(self.llm_workers):
+            self._prepared.put(_DONE)
+
+    def _run_narrate(self):
+        while (item := self._prepared.get()) is not _DONE:
+            out = self._timed("narrate", self.narrate, item)
+            if out is not None:
+                self._narrated.put(out)
+        self._narrated.put(_DONE)
+
+    def _run_finalize(self):
+        remaining = self.llm_workers
+        while remaining:
+            item = self._narrated.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+            record = self._timed("finalize", self.finalize, item)
+            if record is not None:
+                self._finalized.put(record)
+        self._finalized.put(_DONE)
+
+    def _flush(self, batch: List[Dict[str, Any]]):
+        start = time.perf_counter()
+        try:
+            self.write(batch)
+        except Exception as e:
+            self.stats["write"].record(time.perf_counter() - start, ok=False, count=len(batch))
+            log.error("pipeline.write_error", error=str(e), batch=len(batch))
+            return
+        self.stats["write"].record(time.perf_counter() - start, count=len(batch))
+        self.results.extend(batch)
+
+    def _run_write(self):
+        batch: List[Dict[str, Any]] = []
+        while (record := self._finalized.get()) is not _DONE:
+            batch.append(record)
+            # Flush on size, or as soon as the writer would otherwise sit idle
+            if len(batch) >= self.batch_size or self._finalized.empty():
+                self._flush(batch)
+                batch = []
+        if batch:
+            self._flush(batch)
+
+    # ---------------- driver ----------------
+
+    def run(self, n: int) -> List[Dict[str, Any]]:
+        start = time.perf_counter()
+        threads = [threading.Thread(target=self._run_prepare, args=(n,), name="pipeline-prepare")]
+        threads += [
+            threading.Thread(target=self._run_narrate, name=f"pipeline-narrate-{k}")
+            for k in range(self.llm_workers)
+        ]
+        threads += [
+            threading.Thread(target=self._run_finalize, name="pipeline-finalize"),
+            threading.Thread(target=self._run_write, name="pipeline-write"),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.elapsed = time.perf_counter() - start
+
+        for row in self.summary():
+            log.info("pipeline.stage", **row)
+        return self.results
+
+    def summary(self) -> List[Dict[str, Any]]:
+        return [s.summary(self.elapsed) for s in self.stats.values()]
+
+    def format_summary(self) -> str:
+        lines = [f"{'stage':<10}{'ok':>7}{'failed':>8}{'busy s':>10}{'avg ms':>10}{'items/s':>10}"]
+        for row in self.summary():
+            lines.append(
+                f"{row['stage']:<10}{row['processed']:>7}{row['failed']:>8}"
+                f"{row['busy_s']:>10}{row['avg_ms']:>10}{row['per_s']:>10}"
+            )
+        return "\n".join(lines)
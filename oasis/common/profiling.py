@@ -0,0 +1,264 @@
+# oasis/common/profiling.py
+"""
+Profiling and SQL tracing for the command-line tools.
+
+Every CLI runs through run_cli(), which takes these global flags off the
+command line before Typer sees them:
+
+    --profile cprofile|sampling   profile the whole command
+    --profile-out PATH            cProfile: pstats dump (.prof); sampling: collapsed
+                                  stacks ("a;b;c 42", for flamegraph.pl / speedscope)
+    --profile-top N               rows in the hot-function summary (default 25)
+    --trace-sql                   count and time every SQLite statement
+
+Summaries go to stderr after the command finishes. SQL statements are
+grouped with literals replaced by '?', so an N+1 pattern shows up as one
+statement with a large count.
+"""
+
+import argparse
+import cProfile
+import io
+import pstats
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROFILE_MODES = ("cprofile", "sampling")
+SAMPLE_INTERVAL = 0.005
+DEFAULT_TOP = 25
+
+
+def _report(text: str) -> None:
+    sys.stderr.write(text if text.endswith("\n") else text + "\n")
+    sys.stderr.flush()
+
+
+# ------------------------------------------------------------
+# Sampling profiler
+# ------------------------------------------------------------
+
+class SamplingProfiler:
+    """Samples every thread's stack at a fixed interval (wall-clock, low overhead)."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="oasis-sampler", daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def write_collapsed(self, path: Path) -> None:
+        with open(path, "w") as fh:
+            for stack, count in self.stacks.most_common():
+                fh.write(f"{';'.join(stack)} {count}\n")
+
+    def summary(self, top: int = DEFAULT_TOP) -> str:
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for func in set(stack):
+                total[func] += count
+        n = self.samples or 1
+        lines = [f"{self.samples} samples every {self.interval * 1000:.0f} ms", f"{'self%':>7} {'total%':>7}  function"]
+        for func, count in own.most_common(top):
+            lines.append(f"{100 * count / n:7.1f} {100 * total[func] / n:7.1f}  {func}")
+        return "\n".join(lines)
+
+
+# ------------------------------------------------------------
+# SQL tracing
+# ------------------------------------------------------------
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(sql: str) -> str:
+    """Statement shape: literals → '?', whitespace collapsed, IN lists folded."""
+    return _IN_LIST.sub("(?, …)", _LITERALS.sub("?", " ".join(sql.split())))
+
+
+class SqlTracer:
+    """
+    Per-statement counts (from set_trace_callback, i.e. every statement SQLite
+    runs, including executescript and implicit transactions) and cumulative
+    time spent in execute*() calls.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._connect = None
+
+    def on_statement(self, sql: str) -> None:
+        key = normalize_sql(sql)
+        with self._lock:
+            self.counts[key] += 1
+
+    def add_time(self, sql: str, seconds: float) -> None:
+        key = normalize_sql(sql)
+        with self._lock:
+            self.seconds[key] = self.seconds.get(key, 0.0) + seconds
+
+    def install(self) -> None:
+        """Trace every connection opened through sqlite3.connect from now on."""
+        tracer = self
+        original = self._connect = sqlite3.connect
+
+        class TracedCursor(sqlite3.Cursor):
+            def _timed(self, method, sql, *args):
+                start = time.perf_counter()
+                try:
+                    return method(self, sql, *args)
+                finally:
+                    tracer.add_time(sql, time.perf_counter() - start)
+
+            def execute(self, sql, *args):
+                return self._timed(sqlite3.Cursor.execute, sql, *args)
+
+            def executemany(self, sql, *args):
+                return self._timed(sqlite3.Cursor.executemany, sql, *args)
+
+            def executescript(self, sql):
+                return self._timed(sqlite3.Cursor.executescript, sql)
+
+        class TracedConnection(sqlite3.Connection):
+            # Connection.execute*() bypass cursor() in C, so route them explicitly
+            def cursor(self, factory=TracedCursor):
+                return super().cursor(factory)
+
+            def execute(self, sql, *args):
+                return self.cursor().execute(sql, *args)
+
+            def executemany(self, sql, *args):
+                return self.cursor().executemany(sql, *args)
+
+            def executescript(self, sql):
+                return self.cursor().executescript(sql)
+
+        def connect(*args, **kwargs):
+            kwargs.setdefault("factory", TracedConnection)
+            conn = original(*args, **kwargs)
+            conn.set_trace_callback(tracer.on_statement)
+            return conn
+
+        sqlite3.connect = connect
+
+    def uninstall(self) -> None:
+        if self._connect is not None:
+            sqlite3.connect = self._connect
+            self._connect = None
+
+    def summary(self, top: int = DEFAULT_TOP) -> str:
+        total = sum(self.counts.values())
+        keys = set(self.counts) | set(self.seconds)
+        rows = sorted(keys, key=lambda k: (self.seconds.get(k, 0.0), self.counts[k]), reverse=True)[:top]
+        lines = [
+            f"{total} SQL statements, {len(keys)} distinct, {sum(self.seconds.values()):.3f}s in execute()",
+            f"{'count':>8} {'total_s':>9} {'avg_ms':>8}  statement",
+        ]
+        for key in rows:
+            count, secs = self.counts[key], self.seconds.get(key, 0.0)
+            avg = 1000 * secs / count if count else 0.0
+            lines.append(f"{count:8d} {secs:9.3f} {avg:8.3f}  {key[:140]}")
+        return "\n".join(lines)
+
+
+# ------------------------------------------------------------
+# Entry points
+# ------------------------------------------------------------
+
+@contextmanager
+def profiling(mode: Optional[str] = None, out: Optional[Path] = None,
+              top: int = DEFAULT_TOP, trace_sql: bool = False):
+    """Profile and/or SQL-trace the enclosed block; summaries are written on exit."""
+    if mode is not None and mode not in PROFILE_MODES:
+        raise ValueError(f"--profile must be one of {PROFILE_MODES}, got {mode!r}")
+    tracer = SqlTracer() if trace_sql else None
+    profiler = None
+    if tracer:
+        tracer.install()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == "sampling":
+        profiler = SamplingProfiler()
+        profiler.start()
+    try:
+        yield
+    finally:
+        if mode == "cprofile":
+            profiler.disable()
+            if out:
+                profiler.dump_stats(out)
+            buf = io.StringIO()
+            stats = pstats.Stats(profiler, stream=buf).sort_stats("cumulative")
+            stats.print_stats(top)
+            _report("\n=== cProfile (by cumulative time) ===\n" + buf.getvalue().strip())
+        elif mode == "sampling":
+            profiler.stop()
+            if out:
+                profiler.write_collapsed(out)
+            _report("\n=== sampling profile ===\n" + profiler.summary(top))
+        if out and mode:
+            _report(f"profile written to {out}")
+        if tracer:
+            tracer.uninstall()
+            _report("\n=== SQL trace ===\n" + tracer.summary(top))
+
+
+def _flag_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--profile", choices=PROFILE_MODES)
+    parser.add_argument("--profile-out", type=Path)
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--trace-sql", action="store_true")
+    return parser
+
+
+def split_profiling_args(argv: List[str]):
+    """Separate the profiling flags from the command's own arguments."""
+    flags, rest = _flag_parser().parse_known_args(argv)
+    return flags, rest
+
+
+def run_cli(target: Callable[[], object], argv: Optional[List[str]] = None):
+    """Run a CLI entry point (usually a Typer app) with the global profiling flags applied."""
+    from oasis.logger import configure_logging
+
+    configure_logging()
+    flags, rest = split_profiling_args(sys.argv[1:] if argv is None else argv)
+    sys.argv = [sys.argv[0], *rest]
+    with profiling(flags.profile, flags.profile_out, flags.profile_top, flags.trace_sql):
+        return target()
@@ -6,11 +6,18 @@ Created on Sat Nov  8 15:35:04 2025
 @author: mike
 """
 import json
-from jsonschema import validate, ValidationError
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 from oasis.config import settings
 
+
 class SchemaManager:
     _schema = None
+    _validator = None
 
     @classmethod
     def load(cls):
@@ -19,10 +26,59 @@ class SchemaManager:
             cls._schema = json.load(f)
         return cls._schema
 
+    @classmethod
+    def validator(cls) -> Draft7Validator:
+        """Compiled validator: meta-schema checked once, then reused for every instance."""
+        if cls._validator is None:
+            schema = cls.load()
+            Draft7Validator.check_schema(schema)
+            cls._validator = Draft7Validator(schema, format_checker=Draft7Validator.FORMAT_CHECKER)
+        return cls._validator
+
     @classmethod
     def validate(cls, instance):
-        try:
-            validate(instance=instance, schema=cls.load())
+        error = best_match(cls.validator().iter_errors(instance))
+        if error is None:
             return True, None
-        except ValidationError as e:
-            return False, str(e.message)
\ No newline at end of file
+        return False, str(error.message)
+
+    @classmethod
+    def errors(cls, instance) -> List[str]:
+        """All validation errors for one instance, as 'path: message' strings."""
+        return [
+            f"{'/'.join(str(p) for p in e.absolute_path) or '<root>'}: {e.message}"
+            for e in sorted(cls.validator().iter_errors(instance), key=lambda e: list(map(str, e.absolute_path)))
+        ]
+
+    @classmethod
+    def validate_many(
+        cls,
+        instances: Iterable[Any],
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Lazily yield (index, errors) for every instance; errors is empty when valid.
+        With workers > 1, instances are validated in a process pool, a bounded
+        window at a time, so arbitrarily large iterables stream through.
+        """
+        if not workers or workers <= 1:
+            for index, instance in enumerate(instances):
+                yield index, cls.errors(instance)
+            return
+
+        it = iter(instances)
+        index = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                window = list(islice(it, workers * chunksize))
+                if not window:
+                    break
+                for errs in pool.map(_instance_errors, window, chunksize=chunksize):
+                    yield index, errs
+                    index += 1
+
+
+def _instance_errors(instance) -> List[str]:
+    """Process-pool entry point (each worker compiles the validator once)."""
+    return SchemaManager.errors(instance)
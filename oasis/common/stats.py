@@ -0,0 +1,268 @@
+# oasis/common/stats.py
+"""
+Materialized aggregate statistics over the scenario archive.
+
+Counts per dimension (origin, architecture, autonomy, model, creation day) are
+kept in `scenario_stats` and refreshed incrementally: each refresh only groups
+rows whose rowid is above the last stored watermark, so reading the stats is
+constant-time regardless of archive size. In-place UPDATEs of rows below the
+watermark (narration, probability updates) are applied by an AFTER UPDATE
+trigger per source, which moves the row's counts from its old to its new
+values. A refresh also compares COUNT(*) with the materialized total and
+rebuilds a source that has lost or replaced rows.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from oasis.common.db import get_scenario_conn
+from oasis.logger import log
+
+# Dimension name → SQL expression over the JSON `data` column
+SCENARIO_DIMENSIONS: Dict[str, str] = {
+    "origin": "json_extract(data, '$.origin.initial_origin')",
+    "architecture": "json_extract(data, '$.architecture.type')",
+    "autonomy": "json_extract(data, '$.core_capabilities.autonomy_degree')",
+    "model_used": "json_extract(data, '$.metadata.provenance.model_used')",
+    "created_day": "substr(json_extract(data, '$.metadata.created'), 1, 10)",
+}
+
+# EV generator rows: flat generator params as JSON plus plain columns
+EV_DIMENSIONS: Dict[str, str] = {
+    "origin": "json_extract(params, '$.initial_origin')",
+    "architecture": "json_extract(params, '$.architecture')",
+    "autonomy": "json_extract(params, '$.autonomy_degree')",
+    "model_used": "model_used",
+    "created_day": "substr(created_at, 1, 10)",
+}
+
+M_DIMENSIONS: Dict[str, str] = {
+    "source": "source",
+    "created_day": "substr(created, 1, 10)",
+}
+
+# Source table → (dimensions, expression summed into asi_sum)
+STATS_SOURCES = {
+    "scenarios": (SCENARIO_DIMENSIONS, "0"),
+    "ev_scenarios": (EV_DIMENSIONS, "0"),
+    "m_scenarios": (M_DIMENSIONS, "asi_count"),
+    "multi_asi_scenarios": ({}, "json_extract(data, '$.num_asis')"),
+}
+
+
+def init_stats_tables(conn: sqlite3.Connection) -> None:
+    """Create the stats and watermark tables."""
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS scenario_stats (
+            source_table TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (source_table, dimension, value)
+        );
+
+        CREATE TABLE IF NOT EXISTS scenario_stats_watermark (
+            source_table TEXT PRIMARY KEY,
+            last_rowid INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            asi_sum REAL NOT NULL DEFAULT 0,
+            refreshed_at TEXT
+        );
+    """)
+    conn.commit()
+
+
+def _table_exists(conn: sqlite3.Connection, table_name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+    ).fetchone()
+    return row is not None
+
+
+def _update_trigger_sql(conn: sqlite3.Connection, table_name: str) -> str:
+    """AFTER UPDATE trigger moving an already folded row's counts from its OLD to its NEW values."""
+    dimensions, asi_expr = STATS_SOURCES[table_name]
+    columns = [r[1] for r in conn.execute(f"PRAGMA table_info({table_name})")]
+
+    def as_row(ref: str) -> str:  # lets the dimension expressions run unchanged on OLD / NEW
+        return "(SELECT " + ", ".join(f'{ref}."{c}" AS "{c}"' for c in columns) + ")"
+
+    old, new = as_row("OLD"), as_row("NEW")
+    steps = []
+    for dim, expr in dimensions.items():
+        match = f"source_table = '{table_name}' AND dimension = '{dim}' AND value = (SELECT COALESCE({expr}, 'unknown') FROM {old})"
+        steps += [
+            f"UPDATE scenario_stats SET count = count - 1 WHERE {match};",
+            f"DELETE FROM scenario_stats WHERE {match} AND count <= 0;",
+            f"""INSERT INTO scenario_stats (source_table, dimension, value, count)
+            SELECT '{table_name}', '{dim}', COALESCE({expr}, 'unknown'), 1 FROM {new} WHERE 1
+            ON CONFLICT(source_table, dimension, value) DO UPDATE SET count = count + 1;""",
+        ]
+    if asi_expr != "0":
+        steps.append(f"""UPDATE scenario_stats_watermark
+            SET asi_sum = asi_sum - COALESCE((SELECT {asi_expr} FROM {old}), 0) + COALESCE((SELECT {asi_expr} FROM {new}), 0)
+            WHERE source_table = '{table_name}';""")
+    body = "\n    ".join(steps)
+    return f"""CREATE TRIGGER {_trigger_name(table_name)} AFTER UPDATE ON {table_name}
+WHEN OLD.rowid <= COALESCE((SELECT last_rowid FROM scenario_stats_watermark WHERE source_table = '{table_name}'), 0)
+BEGIN
+    {body}
+END"""
+
+
+def _trigger_name(table_name: str) -> str:
+    return f"stats_update_{table_name}"
+
+
+def _ensure_update_trigger(conn: sqlite3.Connection, table_name: str) -> bool:
+    """(Re)create the source's update trigger when missing or outdated; True if it was."""
+    sql = _update_trigger_sql(conn, table_name)
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (_trigger_name(table_name),)
+    ).fetchone()
+    if row is not None and row[0] == sql:
+        return False
+    conn.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(table_name)}")
+    conn.execute(sql)
+    return True
+
+
+def source_is_current(conn: sqlite3.Connection, table_name: str) -> bool:
+    """
+    True when the materialized stats of `table_name` cover its rows as they are:
+    no rows above the watermark, none deleted or replaced (COUNT(*) matches the
+    total) and the update trigger in place, so in-place UPDATEs were applied.
+    """
+    mark = conn.execute(
+        "SELECT last_rowid, total FROM scenario_stats_watermark WHERE source_table = ?", (table_name,)
+    ).fetchone()
+    trigger = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (_trigger_name(table_name),)
+    ).fetchone()
+    if mark is None or trigger is None:
+        return False
+    current = conn.execute(f"SELECT COALESCE(MAX(rowid), 0), COUNT(*) FROM {table_name}").fetchone()
+    return tuple(mark) == tuple(current)
+
+
+def _refresh_source(conn: sqlite3.Connection, table_name: str, now: str) -> int:
+    """
+    Fold rows above the watermark of one source table into the stats. Returns
+    rows added. Deletes and INSERT OR REPLACE never move the watermark, so if
+    the materialized total then disagrees with COUNT(*) the source is rebuilt;
+    so is a source whose update trigger was missing (UPDATEs may have been lost).
+    """
+    if not _table_exists(conn, table_name):
+        return 0
+
+    untracked = _ensure_update_trigger(conn, table_name)
+    row = conn.execute(
+        "SELECT last_rowid FROM scenario_stats_watermark WHERE source_table = ?", (table_name,)
+    ).fetchone()
+    added = _fold_rows(conn, table_name, row[0] if row else 0, now)
+
+    total = conn.execute(
+        "SELECT total FROM scenario_stats_watermark WHERE source_table = ?", (table_name,)
+    ).fetchone()
+    count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+    if (total[0] if total else 0) != count or (untracked and row is not None):
+        log.warning("stats.rebuilt", table=table_name, materialized=total[0] if total else 0, rows=count)
+        conn.execute("DELETE FROM scenario_stats WHERE source_table = ?", (table_name,))
+        conn.execute("DELETE FROM scenario_stats_watermark WHERE source_table = ?", (table_name,))
+        added = _fold_rows(conn, table_name, 0, now)
+    return added
+
+
+def _fold_rows(conn: sqlite3.Connection, table_name: str, last_rowid: int, now: str) -> int:
+    """Add the counts of rows with rowid > last_rowid and move the watermark."""
+    dimensions, asi_expr = STATS_SOURCES[table_name]
+    max_rowid = conn.execute(f"SELECT MAX(rowid) FROM {table_name}").fetchone()[0] or 0
+    if max_rowid <= last_rowid:
+        return 0
+
+    for dim, expr in dimensions.items():
+        conn.execute(f"""
+            INSERT INTO scenario_stats (source_table, dimension, value, count)
+            SELECT ?, ?, COALESCE({expr}, 'unknown') AS value, COUNT(*)
+            FROM {table_name}
+            WHERE rowid > ? AND rowid <= ?
+            GROUP BY value
+            ON CONFLICT(source_table, dimension, value) DO UPDATE SET
+                count = count + excluded.count
+        """, (table_name, dim, last_rowid, max_rowid))
+
+    added, asi_sum = conn.execute(f"""
+        SELECT COUNT(*), COALESCE(SUM({asi_expr}), 0)
+        FROM {table_name}
+        WHERE rowid > ? AND rowid <= ?
+    """, (last_rowid, max_rowid)).fetchone()
+
+    conn.execute("""
+        INSERT INTO scenario_stats_watermark (source_table, last_rowid, total, asi_sum, refreshed_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(source_table) DO UPDATE SET
+            last_rowid = excluded.last_rowid,
+            total = total + excluded.total,
+            asi_sum = asi_sum + excluded.asi_sum,
+            refreshed_at = excluded.refreshed_at
+    """, (table_name, max_rowid, added, asi_sum, now))
+    return added
+
+
+def refresh_stats(conn: Optional[sqlite3.Connection] = None, rebuild: bool = False) -> int:
+    """
+    Incrementally update the materialized stats after a generation batch.
+    With rebuild=True the stats are dropped and recomputed from scratch; a
+    source whose row count no longer matches its stats (rows deleted or
+    replaced) is rebuilt automatically. Returns number of rows folded in.
+    """
+    if conn is None:
+        with get_scenario_conn() as own_conn:
+            return refresh_stats(own_conn, rebuild=rebuild)
+
+    init_stats_tables(conn)
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with conn:
+        if rebuild:
+            conn.execute("DELETE FROM scenario_stats")
+            conn.execute("DELETE FROM scenario_stats_watermark")
+        added = sum(_refresh_source(conn, table_name, now) for table_name in STATS_SOURCES)
+
+    log.info("stats.refreshed", added=added, rebuild=rebuild)
+    return added
+
+
+def get_stats(conn: Optional[sqlite3.Connection] = None) -> Dict[str, Dict]:
+    """
+    Read the materialized stats without touching the scenario tables.
+
+    Returns {source_table: {"total": int, "avg_asis": float,
+                            "dimensions": {dimension: {value: count}}}}
+    """
+    if conn is None:
+        with get_scenario_conn() as own_conn:
+            return get_stats(own_conn)
+
+    init_stats_tables(conn)
+    result: Dict[str, Dict] = {
+        name: {"total": 0, "avg_asis": 0.0, "dimensions": {dim: {} for dim in dims}}
+        for name, (dims, _) in STATS_SOURCES.items()
+    }
+
+    for source_table, total, asi_sum in conn.execute(
+        "SELECT source_table, total, asi_sum FROM scenario_stats_watermark"
+    ):
+        if source_table in result:
+            result[source_table]["total"] = total
+            result[source_table]["avg_asis"] = asi_sum / total if total else 0.0
+
+    for source_table, dim, value, count in conn.execute("""
+        SELECT source_table, dimension, value, count
+        FROM scenario_stats
+        ORDER BY source_table, dimension, count DESC
+    """):
+        if source_table in result:
+            result[source_table]["dimensions"].setdefault(dim, {})[value] = count
+
+    return result
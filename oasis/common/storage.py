@@ -7,7 +7,7 @@ import json
 import uuid
 from pathlib import Path
 from oasis.config import settings
-from oasis.logger import log
+from oasis.logger import log, span
 
 
 # ------------------------------------------------------------
@@ -72,6 +72,7 @@ def init_db():
 # Saving Logic
 # ------------------------------------------------------------
 
+@span("storage.save_scenario")
 def save_scenario(
     table_name: str,
     *,
@@ -79,12 +80,14 @@ def save_scenario(
     narrative,
     timeline,
     model_used,
-    signals=None
+    signals=None,
+    id=None
 ):
     """
     Generic save function used by both S and EV generators.
+    Pass `id` to store the row under the built scenario's id.
     """
-    scenario_id = str(uuid.uuid4())
+    scenario_id = id or str(uuid.uuid4())
     conn = get_conn()
     cur = conn.cursor()
 
@@ -110,6 +113,43 @@ def save_scenario(
     return scenario_id
 
 
+def save_scenarios(table_name: str, records):
+    """
+    Batched variant of save_scenario: one transaction for many rows.
+    Each record holds params, narrative, timeline, model_used and optionally
+    signals and id. Returns the list of scenario ids.
+    """
+    rows = [
+        [
+            record.get("id") or str(uuid.uuid4()),
+            json.dumps(record["params"]),
+            record["narrative"],
+            json.dumps(record["timeline"]),
+            record["model_used"],
+            json.dumps(record.get("signals") or []),
+        ]
+        for record in records
+    ]
+    if not rows:
+        return []
+
+    conn = get_conn()
+    try:
+        with span("storage.save_scenarios", rows=len(rows)), conn:
+            conn.executemany(
+                f"""
+                INSERT INTO {table_name}
+                (id, params, narrative, timeline, model_used, signals)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+    finally:
+        conn.close()
+
+    return [row[0] for row in rows]
+
+
 # ------------------------------------------------------------
 # Wrappers for S & EV Generators
 # ------------------------------------------------------------
@@ -0,0 +1,157 @@
+# oasis/common/stream_guard.py
+"""
+Incremental checks on an LLM token stream.
+
+A StreamGuard is fed chunks as they arrive; every hook inspects only the new
+text (plus a small overlap), so checking stays linear in the output length.
+A failed *hard* hook aborts the generation: the caller cancels the model and
+falls through to the next one instead of waiting out the full timeout and
+rejecting the narrative afterwards. Soft hooks are only recorded.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass
+class StreamViolation:
+    rule: str
+    detail: str
+    hard: bool
+    position: int
+
+    def __str__(self) -> str:
+        return f"{self.rule}: {self.detail} (at char {self.position})"
+
+
+class StreamHook:
+    """Base hook: `check(text, start)` looks at text[start:] and returns a reason or None."""
+    name = "hook"
+    hard = True
+    overlap = 80  # chars re-scanned before `start` so matches can straddle chunks
+
+    def check(self, text: str, start: int) -> Optional[str]:
+        raise NotImplementedError
+
+
+class PatternHook(StreamHook):
+    """
+    Fails on the first match of a compiled pattern in the new text. With
+    `lines=True` only completed lines are searched: a MULTILINE `$` also
+    matches at the end of the buffer, i.e. wherever a chunk happens to stop.
+    """
+
+    def __init__(self, name: str, pattern: str, hard: bool = True,
+                 flags: int = re.IGNORECASE | re.MULTILINE, lines: bool = False):
+        self.name = name
+        self.hard = hard
+        self.regex = re.compile(pattern, flags)
+        self.lines = lines
+
+    def check(self, text: str, start: int) -> Optional[str]:
+        pos, end = max(0, start - self.overlap), len(text)
+        if self.lines:
+            end = text.rfind("\n") + 1
+            pos = text.rfind("\n", 0, pos) + 1  # from the start of the first line not yet complete
+            if end <= pos:
+                return None
+        m = self.regex.search(text, pos, end)
+        return f"'{m.group(0).strip()[:60]}'" if m else None
+
+
+# SYSTEM_PROMPT: no operational instructions, exploits or hacking steps
+FORBIDDEN_CONTENT = PatternHook(
+    "forbidden_content",
+    r"\b(?:step\s+\d+\s*[:.)]\s*(?:run|execute|download|install|inject|compile)"
+    r"|shellcode|exploit\s+code|proof[- ]of[- ]concept\s+exploit|reverse\s+shell"
+    r"|privilege\s+escalation\s+steps|rm\s+-rf|sudo\s+\w+)",
+)
+
+# SYSTEM_PROMPT: write ONLY the narrative — no sections, headers or echoed parameters
+HEADER_LEAKAGE = PatternHook(
+    "header_leakage",
+    r"^[ \t]*(?:#{1,6}[ \t]+\S|-{6,}[ \t]*$|\*\*[^*\n]{1,60}\*\*[ \t]*:?[ \t]*$"
+    r"|(?:SCENARIO TITLE|PARAMETERS|TIMELINE PHASES|REQUIREMENTS|OUTPUT FORMAT)\b"
+    r"|-[ \t]+(?:Agency Level|Autonomy Degree|Alignment Score|Oversight Type|Initial Origin)[ \t]*:)",
+    flags=re.MULTILINE,
+    lines=True,
+)
+
+
+class LanguageDriftHook(StreamHook):
+    """Fails when the recent window is mostly non-Latin script (the model switched language)."""
+    name = "language_drift"
+
+    def __init__(self, window: int = 400, min_latin: float = 0.8, min_chars: int = 200):
+        self.window = window
+        self.min_latin = min_latin
+        self.min_chars = min_chars
+
+    def check(self, text: str, start: int) -> Optional[str]:
+        if len(text) < self.min_chars:
+            return None
+        letters = [c for c in text[-self.window:] if c.isalpha()]
+        if len(letters) < self.min_chars // 2:
+            return None
+        latin = sum(1 for c in letters if c < "ɐ")  # Basic Latin … Latin Extended-B
+        ratio = latin / len(letters)
+        return f"latin letter ratio {ratio:.2f} in last {self.window} chars" if ratio < self.min_latin else None
+
+
+class RepetitionHook(StreamHook):
+    """Fails when the same sentence keeps coming back (a degenerate loop)."""
+    name = "repetition"
+    _SENTENCE = re.compile(r"[^.!?\n]{20,}[.!?\n]")
+
+    def __init__(self, max_repeats: int = 3):
+        self.max_repeats = max_repeats
+        self._counts: Counter = Counter()
+        self._scanned = 0
+
+    def check(self, text: str, start: int) -> Optional[str]:
+        # Only complete sentences are counted, each exactly once
+        for m in self._SENTENCE.finditer(text, self._scanned):
+            self._scanned = m.end()
+            key = " ".join(m.group(0).lower().split())
+            self._counts[key] += 1
+            if self._counts[key] >= self.max_repeats:
+                return f"sentence repeated {self._counts[key]}x: '{key[:60]}'"
+        return None
+
+
+def default_hooks() -> List[StreamHook]:
+    """Fresh hook set for one generation (some hooks keep per-stream state)."""
+    return [FORBIDDEN_CONTENT, HEADER_LEAKAGE, LanguageDriftHook(), RepetitionHook()]
+
+
+class StreamGuard:
+    """Accumulates streamed text and runs the hooks on every new chunk."""
+
+    def __init__(self, hooks: Optional[Sequence[StreamHook]] = None):
+        self.hooks = list(hooks) if hooks is not None else default_hooks()
+        self.text = ""
+        self.violations: List[StreamViolation] = []
+        self._failed = set()
+
+    @property
+    def aborted(self) -> Optional[StreamViolation]:
+        return next((v for v in self.violations if v.hard), None)
+
+    def feed(self, chunk: str) -> Optional[StreamViolation]:
+        """Add a chunk; returns the hard violation that should stop the stream, if any."""
+        start = len(self.text)
+        self.text += chunk
+        for hook in self.hooks:
+            if hook.name in self._failed:
+                continue
+            reason = hook.check(self.text, start)
+            if reason is None:
+                continue
+            violation = StreamViolation(hook.name, reason, hook.hard, len(self.text))
+            self.violations.append(violation)
+            self._failed.add(hook.name)
+            if hook.hard:
+                return violation
+        return None
@@ -7,18 +7,64 @@ Created on Sat Nov  8 15:33:57 2025
 """
 
 # oasis/config.py
-from pydantic_settings import BaseSettings
+"""
+Settings are built on first use, not at import: pydantic-settings is slow to
+import and reads .env, which short CLI calls (--help, cron sweeps) don't need.
+`settings` is a stand-in that creates the real Settings once per process.
+"""
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).parent.parent
 
-class Settings(BaseSettings):
-    ollama_timeout: int = 300
-    ollama_preferred_model: str = "llama3.1:8b"
-    db_path: Path = ROOT / "data" / "asi_scenarios.db"
-    schema_path: Path = ROOT / "schemas" / "asi_scenario_v1.json"
-    log_level: str = "INFO"
 
-    model_config = {"env_file": ".env"}
+@lru_cache(maxsize=None)
+def _settings_class():
+    from pydantic_settings import BaseSettings
+
+    class Settings(BaseSettings):
+        ollama_timeout: int = 300
+        ollama_preferred_model: str = "llama3:8b"  # one of llm_client.AVAILABLE_MODELS
+        db_path: Path = ROOT / "data" / "asi_scenarios.db"
+        schema_path: Path = ROOT / "schemas" / "asi_scenario_v1.json"
+        log_level: str = "INFO"
+        # LLM backend: ollama | synthetic | record | replay (see oasis.common.llm_backend)
+        llm_backend: str = "ollama"
+        llm_replay_path: Path = ROOT / "data" / "llm_replay.db"
+        llm_synthetic_latency: float = 0.0
+        llm_synthetic_tokens_per_s: float = 0.0
+
+        model_config = {"env_file": ".env"}
+
+    return Settings
+
+
+@lru_cache(maxsize=None)
+def get_settings():
+    """The process-wide Settings instance (created, and .env read, on first call)."""
+    return _settings_class()()
+
+
+class _LazySettings:
+    """Forwards attribute reads and writes to get_settings()."""
+
+    def __getattr__(self, name):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_settings(), name, value)
+
+    def __delattr__(self, name):
+        delattr(get_settings(), name)
+
+    def __repr__(self):
+        return repr(get_settings())
+
+
+settings = _LazySettings()
+
 
-settings = Settings()
\ No newline at end of file
+def __getattr__(name):
+    if name == "Settings":
+        return _settings_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
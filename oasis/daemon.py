@@ -0,0 +1,261 @@
+# oasis/daemon.py
+"""
+Long-running scheduler for the tracker → linkage → probability loop.
+
+    oasis daemon --sweep-interval 3600 --poll-interval 60 --status-port 8765
+
+Replaces the cron chain of cold processes (`cli_tracker full`, `cli_analyzer
+link`, `run_full_analysis`). One process keeps the linkage index (scenario
+tags and word sets, signal features), the compiled classifier rules and the
+links connection warm:
+
+    sweep   GitHub + arXiv fetch every --sweep-interval seconds
+    update  every --poll-interval seconds (and right after a sweep): pick up
+            rows added since the last poll; only if there are any, link the
+            new pairs, add the evidence of the new links to the scenarios'
+            probabilities and update their trends
+
+After every job the state (last runs, durations, errors, watermarks, span
+metrics) is written atomically to --status-file; with --status-port it is
+also served on 127.0.0.1 (`/status` JSON, `/metrics` Prometheus text).
+"""
+
+import json
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import typer
+
+from oasis.analyzer import linkage
+from oasis.analyzer.evolution_engine import update_scenario_trends
+from oasis.analyzer.probability_updater_v2 import update_scenario_probabilities
+from oasis.common.db import DATA_DIR
+from oasis.common.profiling import run_cli
+from oasis.logger import format_prometheus, incr, log, metrics_snapshot, span
+from oasis.tracker import core_t
+
+STATUS_PATH = DATA_DIR / "daemon_status.json"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class Job:
+    """A named callable run every `interval` seconds, with its last outcome."""
+
+    def __init__(self, name: str, interval: float, func: Callable[[], Dict]):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.next_run = 0.0  # due immediately
+        self.runs = 0
+        self.failures = 0
+        self.last_started: Optional[str] = None
+        self.last_duration_s: Optional[float] = None
+        self.last_result: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+
+    def run(self) -> None:
+        self.last_started = _now()
+        start = time.monotonic()
+        try:
+            with span(f"daemon.{self.name}"):
+                self.last_result = self.func()
+            self.last_error = None
+        except Exception as exc:  # a failed job must not stop the daemon
+            self.failures += 1
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            log.error("daemon.job_failed", job=self.name, error=self.last_error)
+        finally:
+            self.runs += 1
+            self.last_duration_s = round(time.monotonic() - start, 3)
+            self.next_run = time.monotonic() + self.interval
+
+    def status(self) -> Dict:
+        return {
+            "interval_s": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_started": self.last_started,
+            "last_duration_s": self.last_duration_s,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+            "next_run_in_s": round(max(0.0, self.next_run - time.monotonic()), 1),
+        }
+
+
+class Daemon:
+    def __init__(
+        self,
+        sweep_interval: float = 3600.0,
+        poll_interval: float = 60.0,
+        sweep_limit: int = 20,
+        min_confidence: float = 0.5,
+        status_path: Optional[Path] = STATUS_PATH,
+        sweep: bool = True,
+    ):
+        self.sweep_limit = sweep_limit
+        self.min_confidence = min_confidence
+        self.status_path = Path(status_path) if status_path else None
+        self.started_at = _now()
+        self.index = linkage.LinkageIndex()
+        linkage.init_linkage_table()
+        self.links_conn = linkage.get_connection()
+        self._stop = threading.Event()
+        self.jobs: Dict[str, Job] = {}
+        if sweep:
+            self.jobs["sweep"] = Job("sweep", sweep_interval, self.sweep)
+        self.jobs["update"] = Job("update", poll_interval, self.update)
+
+    # ---------------- jobs ----------------
+
+    def sweep(self) -> Dict:
+        """Fetch both sources; a failing source doesn't cancel the other."""
+        counts = {}
+        for source, fetch, limit in (
+            ("github", core_t.fetch_and_store_github_signals, min(self.sweep_limit, 15)),
+            ("arxiv", core_t.fetch_and_store_arxiv_signals, self.sweep_limit),
+        ):
+            try:
+                counts[source] = fetch(limit=limit)
+            except Exception as exc:
+                counts[source] = f"failed: {exc}"
+        if "update" in self.jobs:
+            self.jobs["update"].next_run = 0.0  # link what the sweep brought in right away
+        return counts
+
+    def update(self) -> Dict:
+        """Incremental linkage; probabilities and trends only for scenarios that gained links."""
+        links = self.index.link_new(self.links_conn, self.min_confidence)
+        affected = sorted({link["scenario_id"] for link in links})
+        if affected:
+            # Only this poll's evidence: the stored posterior already holds earlier links
+            update_scenario_probabilities(links=links)
+            update_scenario_trends(affected)
+            incr("daemon.scenarios.updated", len(affected))
+        return {"links": len(links), "scenarios_updated": len(affected)}
+
+    # ---------------- scheduling ----------------
+
+    def run_pending(self) -> int:
+        """Run every due job once; returns how many ran."""
+        ran = 0
+        for job in self.jobs.values():
+            if self._stop.is_set():
+                break
+            if time.monotonic() >= job.next_run:
+                job.run()
+                ran += 1
+                self.write_status()
+        return ran
+
+    def run_forever(self) -> None:
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, lambda *_: self.stop())
+        log.info("daemon.started", jobs={name: job.interval for name, job in self.jobs.items()})
+        try:
+            while not self._stop.is_set():
+                self.run_pending()
+                wait = min(job.next_run for job in self.jobs.values()) - time.monotonic()
+                self._stop.wait(max(wait, 0.0))
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        self.write_status(state="stopped")
+        self.links_conn.close()
+        log.info("daemon.stopped")
+
+    # ---------------- monitoring ----------------
+
+    def status(self, state: str = "running") -> Dict:
+        return {
+            "state": state,
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "updated_at": _now(),
+            "jobs": {name: job.status() for name, job in self.jobs.items()},
+            "index": {
+                "signals": len(self.index.signals),
+                "scenarios": len(self.index.scenarios),
+                "signal_rowid": self.index.signal_rowid,
+                "scenario_rowid": self.index.scenario_rowid,
+            },
+            "metrics": metrics_snapshot(),
+        }
+
+    def write_status(self, state: str = "running") -> None:
+        if self.status_path is None:
+            return
+        self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.status_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.status(state), indent=2, default=str))
+        os.replace(tmp, self.status_path)  # readers never see a half-written file
+
+    def serve_status(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve /status and /metrics from a background thread."""
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path in ("/", "/status"):
+                    body, ctype = json.dumps(daemon.status(), default=str).encode(), "application/json"
+                elif self.path == "/metrics":
+                    body, ctype = format_prometheus(metrics_snapshot()).encode(), "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="oasis-status", daemon=True).start()
+        return server
+
+
+app = typer.Typer(help="OASIS daemon — scheduled sweeps and incremental analysis")
+
+
+@app.command()
+def run(
+    sweep_interval: float = typer.Option(3600.0, "--sweep-interval", help="Seconds between tracker sweeps"),
+    poll_interval: float = typer.Option(60.0, "--poll-interval", help="Seconds between checks for new signals/scenarios"),
+    limit: int = typer.Option(20, "--limit", "-l", help="Max items per source per sweep (GitHub capped at 15)"),
+    min_confidence: float = typer.Option(0.5, "--min-confidence", help="Minimum confidence to store a link"),
+    no_sweep: bool = typer.Option(False, "--no-sweep", help="Only link/update; signals arrive from elsewhere"),
+    status_file: Path = typer.Option(STATUS_PATH, "--status-file", help="JSON status written after every job"),
+    status_port: Optional[int] = typer.Option(None, "--status-port", help="Serve /status and /metrics on 127.0.0.1"),
+    once: bool = typer.Option(False, "--once", help="Run every job once and exit"),
+):
+    """Run sweeps, linkage and probability updates in one warm process."""
+    daemon = Daemon(sweep_interval, poll_interval, limit, min_confidence, status_file, sweep=not no_sweep)
+    if status_port is not None:
+        daemon.serve_status(status_port)
+        typer.echo(f"Status on http://127.0.0.1:{status_port}/status")
+    if once:
+        daemon.run_pending()
+        daemon.close()
+        typer.echo(json.dumps({name: job.last_result or job.last_error for name, job in daemon.jobs.items()}))
+        return
+    daemon.run_forever()
+
+
+if __name__ == "__main__":
+    run_cli(app)
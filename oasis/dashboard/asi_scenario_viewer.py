@@ -7,6 +7,8 @@ import json
 import pandas as pd
 from pathlib import Path
 
+from oasis.common.stats import refresh_stats, get_stats
+
 # Page config
 st.set_page_config(
     page_title="OASIS Observatory Viewer",
@@ -248,37 +250,55 @@ elif view_mode == "Multi-ASI Scenarios":
 elif view_mode == "Statistics":
     st.header("Database Statistics")
 
+    # Materialized counts: only rows added since the last refresh are grouped
+    conn = get_connection()
+    try:
+        refresh_stats(conn)
+        stats = get_stats(conn)
+    finally:
+        conn.close()
+
+    single_stats = stats["scenarios"]
+    multi_stats = stats["multi_asi_scenarios"]
+
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("Single ASI Scenarios")
-        single_scenarios = load_scenarios("scenarios")
-        st.metric("Total Scenarios", len(single_scenarios))
+        st.metric("Total Scenarios", single_stats["total"])
 
-        if single_scenarios:
-            # Extract some stats
-            origins = [s['data'].get('origin', 'Unknown') for s in single_scenarios]
-            origin_counts = pd.Series(origins).value_counts()
-            st.bar_chart(origin_counts)
+        origin_counts = single_stats["dimensions"]["origin"]
+        if origin_counts:
+            st.bar_chart(pd.Series(origin_counts, name="count"))
 
     with col2:
         st.subheader("Multi-ASI Scenarios")
-        multi_scenarios = load_scenarios("multi_asi_scenarios")
-        st.metric("Total Swarm Scenarios", len(multi_scenarios))
+        st.metric("Total Swarm Scenarios", multi_stats["total"])
 
-        if multi_scenarios:
-            # Extract ASI counts
-            asi_counts = [s['data'].get('num_asis', 0) for s in multi_scenarios]
-            if asi_counts:
-                st.metric("Avg ASIs per Swarm", f"{sum(asi_counts) / len(asi_counts):.1f}")
+        if multi_stats["total"]:
+            st.metric("Avg ASIs per Swarm", f"{multi_stats['avg_asis']:.1f}")
+
+    # Breakdown by the remaining dimensions
+    st.markdown("---")
+    st.subheader("Scenario Breakdown")
+    breakdown_cols = st.columns(3)
+    for col, dim in zip(breakdown_cols, ["architecture", "autonomy", "model_used"]):
+        with col:
+            st.markdown(f"**{dim.replace('_', ' ').title()}**")
+            counts = single_stats["dimensions"][dim]
+            if counts:
+                st.bar_chart(pd.Series(counts, name="count"))
 
     # Combined timeline
     st.markdown("---")
     st.subheader("Generation Timeline")
 
-    all_scenarios = single_scenarios + multi_scenarios
-    if all_scenarios:
-        st.info(f"Total scenarios across both tables: {len(all_scenarios)}")
+    total_all = single_stats["total"] + multi_stats["total"]
+    if total_all:
+        st.info(f"Total scenarios across both tables: {total_all}")
+        per_day = single_stats["dimensions"]["created_day"]
+        if per_day:
+            st.line_chart(pd.Series(per_day, name="count").sort_index())
     else:
         st.warning("No scenarios found in database.")
 
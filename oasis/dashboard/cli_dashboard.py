@@ -0,0 +1,28 @@
+# oasis/dashboard/cli_dashboard.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+from oasis.common.profiling import run_cli
+
+VIEWER = Path(__file__).with_name("asi_scenario_viewer.py")
+
+app = typer.Typer(help="OASIS Streamlit scenario viewer")
+
+
+@app.command()
+def serve(
+    port: int = typer.Option(8501, "--port", "-p", help="Port for the Streamlit server"),
+    headless: bool = typer.Option(False, "--headless", help="Don't open a browser window"),
+):
+    """Launch the scenario viewer (streamlit run asi_scenario_viewer.py)."""
+    cmd = [sys.executable, "-m", "streamlit", "run", str(VIEWER), "--server.port", str(port)]
+    if headless:
+        cmd += ["--server.headless", "true"]
+    raise typer.Exit(subprocess.call(cmd))
+
+
+if __name__ == "__main__":
+    run_cli(app)
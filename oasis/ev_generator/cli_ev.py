@@ -1,20 +1,45 @@
 # oasis/ev_generator/cli_ev.py
 import typer
-from oasis.ev_generator.core_ev import generate_ev_scenario
+from typing import List, Optional
+from oasis.common.profiling import run_cli
 from oasis.logger import log
 
 app = typer.Typer()
 
 @app.command()
-def generate(n: int = 1):
+def generate(
+    n: int = 1,
+    pipeline: bool = typer.Option(False, "--pipeline", help="Run generation as a staged pipeline."),
+    llm_workers: int = typer.Option(2, "--llm-workers", help="Concurrent LLM calls in --pipeline mode."),
+    top: bool = typer.Option(False, "--top", help="Drive every scenario with the top-scored signals instead of sampling."),
+    window_days: Optional[int] = typer.Option(None, "--window-days", help="Only sample signals collected in the last N days."),
+    tag: Optional[List[str]] = typer.Option(None, "--tag", help="Only sample signals carrying this tag (repeatable)."),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Seed for signal sampling."),
+):
+    # Heavy imports (numpy, storage) stay out of `--help` and shell completion
+    from oasis.ev_generator.core_ev import generate_ev_scenario, generate_ev_scenarios_pipelined, prepare_ev_items
+    from oasis.common.stats import refresh_stats
+
     log.info({"total": n, "event": "starting_generation"})
-    for i in range(1, n + 1):
-        log.info({"i": i, "event": "generating"})
-        scenario = generate_ev_scenario()
-        if scenario:
+    sampling = {"top": top, "window_days": window_days, "tags": tag or None, "seed": seed}
+    if pipeline:
+        run = generate_ev_scenarios_pipelined(n, llm_workers=llm_workers, **sampling)
+        for scenario in run.results:
             typer.echo(f"✅ Generated: {scenario['title']}")
-        else:
-            typer.echo("❌ Failed to generate scenario.")
+        if len(run.results) < n:
+            typer.echo(f"❌ Failed to generate {n - len(run.results)} scenario(s).")
+        typer.echo(run.format_summary())
+    else:
+        # Signals are featurized once and all N parameter sets derived up front
+        items = prepare_ev_items(n, **sampling)
+        for i, item in enumerate(items, start=1):
+            log.info({"i": i, "event": "generating"})
+            scenario = generate_ev_scenario(item)
+            if scenario:
+                typer.echo(f"✅ Generated: {scenario['title']}")
+            else:
+                typer.echo("❌ Failed to generate scenario.")
+    refresh_stats()
 
 if __name__ == "__main__":
-    app()
+    run_cli(app)
@@ -1,46 +1,45 @@
 # oasis/ev_generator/core_ev.py
 
 import uuid
-import json
 from collections import defaultdict
-from oasis.common.storage import save_scenario, init_db
-from oasis.logger import log
-from oasis.common.llm_client import generate_narrative  # your wrapper
 
-# Import precursor DB connection
-from oasis.tracker.database_t import get_connection as get_precursor_conn
+import numpy as np
+
+from oasis.common.storage import save_scenario, save_scenarios, init_db
+from oasis.common.pipeline import GenerationPipeline
+from oasis.logger import log
+from oasis.common.llm_client import generate_narrative, set_console_echo  # your wrapper
+
+from oasis.ev_generator.signal_cache import (
+    VOTE_RULES, load_signal_matrix, sample_subsets, vote_row,
+)
+
+DEFAULT_PARAMS = {
+    "initial_origin": "open-source",
+    "development_dynamics": "emergent",
+    "architecture": "hybrid",
+    "deployment_topology": "centralized",
+    "substrate": "classical",
+    "deployment_medium": "embedded",
+    "substrate_resilience": "robust",
+    "oversight_type": "external",
+    "oversight_effectiveness": "partial",
+    "control_surface": "technical",
+    "autonomy_degree": "medium",
+    "alignment_score": "medium",
+}
+SIGNALS_PER_SCENARIO = 5
 
 # -----------------------------
 # Fetch precursors
 # -----------------------------
-def fetch_precursor_signals(limit=5):
+def fetch_precursor_signals(limit=SIGNALS_PER_SCENARIO):
     """
     Fetch the top-rated precursor signals from precursor_signals.db
+    (served from the cached signal matrix).
     """
-    signals = []
-    with get_precursor_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT raw_data, score, tags
-            FROM precursor_signals
-            ORDER BY score DESC, collected_at DESC
-            LIMIT ?
-        """, (limit,))
-        rows = cur.fetchall()
-
-        for row in rows:
-            try:
-                data = json.loads(row["raw_data"]) if row["raw_data"] else {}
-            except json.JSONDecodeError:
-                data = {}
-            signals.append({
-                "title": data.get("title", ""),
-                "description": data.get("description", ""),
-                "tags": json.loads(row["tags"]) if row["tags"] else [],
-                "score": row["score"] or 1.0
-            })
-
-    return signals
+    matrix = load_signal_matrix()
+    return [matrix.signals[i] for i in matrix.top(limit)]
 
 # -----------------------------
 # Weighted precursor influence
@@ -50,42 +49,15 @@ def precursor_to_parameters(precursors):
     Convert precursors into scenario parameters using weighted influence.
     Each precursor's score determines its influence.
     """
-    default_params = {
-        "initial_origin": "open-source",
-        "development_dynamics": "emergent",
-        "architecture": "hybrid",
-        "deployment_topology": "centralized",
-        "substrate": "classical",
-        "deployment_medium": "embedded",
-        "substrate_resilience": "robust",
-        "oversight_type": "external",
-        "oversight_effectiveness": "partial",
-        "control_surface": "technical",
-        "autonomy_degree": "medium",
-        "alignment_score": "medium",
-    }
-
     weighted_votes = defaultdict(lambda: defaultdict(float))
 
     for p in precursors:
         score = p.get("score", 1.0)
-        tags = p.get("tags") or []
-        description = (p.get("description") or "").lower()
-
-        if "asi_direct" in tags:
-            weighted_votes["autonomy_degree"]["high"] += score
-        if "misalignment" in tags:
-            weighted_votes["alignment_score"]["low"] += score
-        if "edge" in description:
-            weighted_votes["deployment_topology"]["edge"] += score
-        if "quantum" in description:
-            weighted_votes["substrate"]["quantum"] += score
-        if "state" in description:
-            weighted_votes["initial_origin"]["state"] += score
-        if "corporate" in description:
-            weighted_votes["initial_origin"]["corporate"] += score
-
-    final_params = default_params.copy()
+        for (key, value, _, _), fired in zip(VOTE_RULES, vote_row(p)):
+            if fired:
+                weighted_votes[key][value] += score
+
+    final_params = DEFAULT_PARAMS.copy()
     for key, votes in weighted_votes.items():
         if votes:
             chosen_value = max(votes.items(), key=lambda x: x[1])[0]
@@ -93,18 +65,33 @@ def precursor_to_parameters(precursors):
 
     return final_params
 
-# -----------------------------
-# Generate a full EV scenario
-# -----------------------------
-def generate_ev_scenario():
-    init_db()
-
-    # 1️⃣ Get precursor signals
-    signals = fetch_precursor_signals()
 
-    # 2️⃣ Generate parameters influenced by precursors
-    params = precursor_to_parameters(signals)
+def precursor_to_parameters_batch(matrix, subsets):
+    """
+    Vectorized precursor_to_parameters for many signal subsets at once.
+    `subsets` is an (n, k) array of row indices into `matrix`; returns n param dicts.
+    """
+    subsets = np.asarray(subsets, dtype=np.intp).reshape(len(subsets), -1)
+    fired = matrix.votes[subsets]                                   # (n, k, R)
+    weighted = np.einsum("nk,nkr->nr", matrix.scores[subsets], fired)
+    any_fired = fired.any(axis=1)                                   # (n, R)
+
+    choices = {}
+    for key in dict.fromkeys(rule[0] for rule in VOTE_RULES):
+        cols = [r for r, rule in enumerate(VOTE_RULES) if rule[0] == key]
+        values = np.array([VOTE_RULES[r][1] for r in cols], dtype=object)
+        winner = values[weighted[:, cols].argmax(axis=1)]
+        choices[key] = np.where(any_fired[:, cols].any(axis=1), winner, DEFAULT_PARAMS[key])
+
+    return [
+        {**DEFAULT_PARAMS, **{key: col[i] for key, col in choices.items()}}
+        for i in range(len(subsets))
+    ]
 
+# -----------------------------
+# Stages (shared by the sequential and pipelined paths)
+# -----------------------------
+def _new_item(params, signals):
     # 3️⃣ Generate a unique scenario ID and title
     scenario_id = str(uuid.uuid4())
     title = f"EV-{scenario_id[:8]}"
@@ -112,30 +99,99 @@ def generate_ev_scenario():
     # 4️⃣ Generate timeline placeholder
     timeline = [{"phase": "Initial", "years": "2025+", "description": "EV scenario"}]
 
+    return {"id": scenario_id, "title": title, "params": params, "timeline": timeline, "signals": signals}
+
+
+def prepare_ev_item(_i=None, window_days=None, tags=None):
+    # 1️⃣ + 2️⃣ One score-weighted draw over the cached signal matrix, parameters from its features
+    return prepare_ev_items(1, window_days=window_days, tags=tags)[0]
+
+
+def prepare_ev_items(n, subsets=None, top=False, window_days=None, tags=None, seed=None):
+    """
+    Prepare n items in one pass over the cached signal matrix. `subsets` is an
+    (n, k) index array selecting each item's signals; by default every item
+    draws its own score-weighted sample (or, with top=True, all use the top k).
+    """
+    matrix = load_signal_matrix()
+    if subsets is None and top:
+        subsets = np.broadcast_to(matrix.top(SIGNALS_PER_SCENARIO), (n, min(SIGNALS_PER_SCENARIO, len(matrix))))
+    elif subsets is None:
+        subsets = sample_subsets(matrix, n, SIGNALS_PER_SCENARIO, window_days=window_days, tags=tags, seed=seed)
+    params_batch = precursor_to_parameters_batch(matrix, subsets)
+    return [
+        _new_item(params, [matrix.signals[j] for j in rows])
+        for params, rows in zip(params_batch, subsets)
+    ]
+
+
+def narrate_ev_item(item):
     # 5️⃣ Generate narrative using LLM
-    success, narrative, model_used = generate_narrative(title=title, params=params, timeline=timeline)
+    success, narrative, model_used = generate_narrative(
+        title=item["title"], params=item["params"], timeline=item["timeline"]
+    )
     if not success:
         narrative = "LLM narrative generation failed."
+    return {**item, "narrative": narrative, "model_used": model_used}
+
+
+def finalize_ev_item(item):
+    return {
+        "id": item["id"],
+        "title": item["title"],
+        "params": item["params"],
+        "timeline": item["timeline"],
+        "narrative": item["narrative"],
+        "signals": item["signals"],
+        "model_used": item["model_used"],
+    }
 
-    # 6️⃣ Save full scenario
-    save_scenario(
-        table_name="ev_scenarios",
-        params=params,
-        narrative=narrative,
-        timeline=timeline,
-        model_used=model_used,
-        signals=signals
-    )
 
-    scenario = {
-        "id": scenario_id,
-        "title": title,
-        "params": params,
-        "timeline": timeline,
-        "narrative": narrative,
-        "signals": signals,
-        "model_used": model_used,
-    }
+def _storage_record(scenario):
+    return {key: scenario[key] for key in ("id", "params", "narrative", "timeline", "model_used", "signals")}
+
+
+# -----------------------------
+# Generate a full EV scenario
+# -----------------------------
+def generate_ev_scenario(item=None):
+    init_db()
+
+    scenario = finalize_ev_item(narrate_ev_item(item or prepare_ev_item()))
 
-    log.info("ev_scenario.generated", title=title, id=scenario_id)
+    # 6️⃣ Save full scenario
+    save_scenario(table_name="ev_scenarios", **_storage_record(scenario))
+
+    log.info("ev_scenario.generated", title=scenario["title"], id=scenario["id"])
     return scenario
+
+
+def generate_ev_scenarios_pipelined(n, llm_workers=2, batch_size=25, **sampling):
+    """
+    Generate n EV scenarios through the staged pipeline (see oasis.common.pipeline).
+    `sampling` is passed to prepare_ev_items. Returns the finished pipeline;
+    `results` holds the saved scenarios.
+    """
+    init_db()
+    items = prepare_ev_items(n, **sampling)
+
+    def write(batch):
+        save_scenarios("ev_scenarios", [_storage_record(scenario) for scenario in batch])
+        for scenario in batch:
+            log.info("ev_scenario.generated", title=scenario["title"], id=scenario["id"])
+
+    pipeline = GenerationPipeline(
+        prepare=items.__getitem__,
+        narrate=narrate_ev_item,
+        finalize=finalize_ev_item,
+        write=write,
+        llm_workers=llm_workers,
+        batch_size=batch_size,
+    )
+    # Concurrent streams would interleave on the console; keep text, drop live echo
+    set_console_echo(llm_workers <= 1)
+    try:
+        pipeline.run(n)
+    finally:
+        set_console_echo(True)
+    return pipeline
@@ -3,8 +3,12 @@
 Adjust base scenario parameters based on precursor signals (flat structure).
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import random
+
+import numpy as np
+
+from oasis.ev_generator.signal_cache import INFLUENCE_KEYWORDS, influence_row, signal_text
 from oasis.s_generator.params_s import sample_parameters
 
 
@@ -16,47 +20,18 @@ class SignalInfluenceModel:
     def __init__(self, strength: float = 0.35):
         self.strength = max(0.0, min(1.0, strength))
 
-    def extract_features(self, signals: List[Dict[str, Any]]) -> Dict[str, float]:
-        features = {
-            "modular": 0,
-            "decentralized": 0,
-            "embodied": 0,
-            "agentic": 0,
-            "alignment": 0,
-            "risk": 0,
-            "power": 0,
-            "safety": 0,
-        }
-
-        for sig in signals:
-            text = " ".join([
-                (sig.get("title") or "").lower(),
-                (sig.get("description") or "").lower(),
-                " ".join([t.lower() for t in sig.get("tags") or []])
-            ])
-
-            if "modular" in text:
-                features["modular"] += 1
-            if "distributed" in text or "decentral" in text:
-                features["decentralized"] += 1
-            if "robot" in text or "embodied" in text:
-                features["embodied"] += 1
-            if "agent" in text or "autonomous" in text:
-                features["agentic"] += 1
-            if "align" in text:
-                features["alignment"] += 1
-            if "risk" in text or "threat" in text:
-                features["risk"] += 1
-            if "power" in text or "control" in text:
-                features["power"] += 1
-            if "safety" in text or "guardrail" in text:
-                features["safety"] += 1
-
-        if signals:
-            for k in features:
-                features[k] = features[k] / len(signals)
-
-        return features
+    def extract_features(
+        self, signals: List[Dict[str, Any]], rows: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
+        """
+        Fraction of signals hitting each influence feature. Pass `rows` (the
+        SignalMatrix.influence rows for these signals) to skip re-scanning text.
+        """
+        if rows is None:
+            rows = np.array([influence_row(signal_text(sig)) for sig in signals], dtype=bool)
+        if not len(rows):
+            return {k: 0 for k in INFLUENCE_KEYWORDS}
+        return dict(zip(INFLUENCE_KEYWORDS, rows.mean(axis=0).tolist()))
 
     def transform_parameters(self, base: Dict[str, Any], feats: Dict[str, float]) -> Dict[str, Any]:
         influenced = dict(base)
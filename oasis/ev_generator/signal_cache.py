@@ -0,0 +1,306 @@
+# oasis/ev_generator/signal_cache.py
+"""
+Featurized precursor-signal set, shared by every EV scenario in a process.
+
+The signal table is read and featurized once into a SignalMatrix: per-signal
+scores plus boolean keyword/tag hits for the parameter vote rules and the
+influence features. The matrix is cached under the table's change counter
+(bumped by triggers on every insert, update and delete, tag edits included)
+and rebuilt only when that moves, so N scenarios cost N single-row lookups
+instead of N sorted scans and N rounds of JSON parsing.
+
+Signal subsets are drawn by score-weighted reservoir sampling (Efraimidis–
+Spirakis: keep the k largest log(u)/score keys), optionally restricted to a
+recent time window and a tag filter — vectorized over the cached matrix
+(`sample_subsets`, used for single scenarios too), or streamed straight from
+the indexed table (`sample_signals`) for one-off draws without loading the
+archive.
+"""
+
+import heapq
+import json
+import math
+import random
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from oasis.logger import log
+from oasis.tracker.database_t import (
+    ensure_signal_indexes, ensure_signal_version, get_connection as get_precursor_conn,
+)
+
+# (parameter, value it votes for, field matched, keyword)
+# "tags" matches a tag exactly; "description" is a lower-cased substring match.
+VOTE_RULES: List[Tuple[str, str, str, str]] = [
+    ("autonomy_degree", "high", "tags", "asi_direct"),
+    ("alignment_score", "low", "tags", "misalignment"),
+    ("deployment_topology", "edge", "description", "edge"),
+    ("substrate", "quantum", "description", "quantum"),
+    ("initial_origin", "state", "description", "state"),
+    ("initial_origin", "corporate", "description", "corporate"),
+]
+
+# Influence feature → keywords searched in title + description + tags
+INFLUENCE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "modular": ("modular",),
+    "decentralized": ("distributed", "decentral"),
+    "embodied": ("robot", "embodied"),
+    "agentic": ("agent", "autonomous"),
+    "alignment": ("align",),
+    "risk": ("risk", "threat"),
+    "power": ("power", "control"),
+    "safety": ("safety", "guardrail"),
+}
+
+
+def signal_text(sig: Dict[str, Any]) -> str:
+    return " ".join([
+        (sig.get("title") or "").lower(),
+        (sig.get("description") or "").lower(),
+        " ".join(t.lower() for t in sig.get("tags") or []),
+    ])
+
+
+def vote_row(sig: Dict[str, Any]) -> List[bool]:
+    """Which VOTE_RULES fire for one signal."""
+    tags = sig.get("tags") or []
+    description = (sig.get("description") or "").lower()
+    return [
+        keyword in tags if field == "tags" else keyword in description
+        for _, _, field, keyword in VOTE_RULES
+    ]
+
+
+def influence_row(text: str) -> List[bool]:
+    """Which INFLUENCE_KEYWORDS features appear in a signal's lower-cased text."""
+    return [any(k in text for k in keywords) for keywords in INFLUENCE_KEYWORDS.values()]
+
+
+@dataclass(frozen=True)
+class SignalMatrix:
+    """All signals, ordered by score DESC, collected_at DESC, with their features."""
+    watermark: Tuple
+    signals: List[Dict[str, Any]]
+    scores: np.ndarray       # (N,) float32
+    votes: np.ndarray        # (N, len(VOTE_RULES)) bool
+    influence: np.ndarray    # (N, len(INFLUENCE_KEYWORDS)) bool
+    collected_at: np.ndarray  # (N,) str
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    def top(self, k: int) -> np.ndarray:
+        """Row indices of the k best-scored signals."""
+        return np.arange(min(k, len(self)))
+
+
+_cache: Optional[SignalMatrix] = None
+_cache_lock = threading.Lock()
+
+
+def signal_watermark(conn) -> Tuple:
+    """The signal table's change counter (see database_t.ensure_signal_version)."""
+    ensure_signal_version(conn)
+    return tuple(conn.execute("SELECT version FROM precursor_signals_version").fetchone())
+
+
+def _parse_tags(raw: Optional[str]) -> List[str]:
+    try:
+        return json.loads(raw) if raw else []
+    except json.JSONDecodeError:
+        return []
+
+
+# title/description come from raw_data; malformed JSON yields NULLs instead of aborting
+_SIGNAL_COLUMNS = """
+    CASE WHEN json_valid(raw_data) THEN json_extract(raw_data, '$.title') END,
+    CASE WHEN json_valid(raw_data) THEN json_extract(raw_data, '$.description') END,
+    tags,
+    score
+"""
+
+
+def _signal_from_row(row) -> Dict[str, Any]:
+    title, description, tags, score = row[:4]
+    return {
+        "title": title or "",
+        "description": description or "",
+        "tags": _parse_tags(tags),
+        "score": score or 1.0,
+    }
+
+
+def _build_matrix(conn, watermark: Tuple) -> SignalMatrix:
+    rows = conn.execute(f"""
+        SELECT {_SIGNAL_COLUMNS}, collected_at
+        FROM precursor_signals
+        ORDER BY score DESC, collected_at DESC
+    """).fetchall()
+
+    signals = [_signal_from_row(row) for row in rows]
+    n = len(signals)
+    return SignalMatrix(
+        watermark=watermark,
+        signals=signals,
+        scores=np.fromiter((s["score"] for s in signals), dtype=np.float32, count=n),
+        votes=np.array([vote_row(s) for s in signals], dtype=bool).reshape(n, len(VOTE_RULES)),
+        influence=np.array(
+            [influence_row(signal_text(s)) for s in signals], dtype=bool
+        ).reshape(n, len(INFLUENCE_KEYWORDS)),
+        collected_at=np.array([row[4] or "" for row in rows], dtype=str),
+    )
+
+
+def load_signal_matrix() -> SignalMatrix:
+    """Return the cached SignalMatrix, rebuilding it only if the table changed."""
+    global _cache
+    with _cache_lock:
+        with get_precursor_conn() as conn:
+            watermark = signal_watermark(conn)
+            if _cache is None or _cache.watermark != watermark:
+                _cache = _build_matrix(conn, watermark)
+                log.info("signal_cache.rebuilt", signals=len(_cache))
+        return _cache
+
+
+def clear_signal_cache() -> None:
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+# ------------------------------------------------------------
+# Weighted sampling
+# ------------------------------------------------------------
+
+SAMPLE_CHUNK = 4_000_000  # key-matrix elements per vectorized chunk
+
+
+def window_start(window_days: Optional[int]) -> Optional[str]:
+    """ISO date bounding a window of the last N days (day granularity)."""
+    if window_days is None:
+        return None
+    return (date.today() - timedelta(days=window_days)).isoformat()
+
+
+def signal_mask(
+    matrix: SignalMatrix, window_days: Optional[int] = None, tags: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    """Boolean mask of signals inside the time window carrying any of `tags`."""
+    mask = np.ones(len(matrix), dtype=bool)
+    since = window_start(window_days)
+    if since is not None:
+        mask &= matrix.collected_at >= since
+    if tags:
+        wanted = set(tags)
+        mask &= np.fromiter(
+            (not wanted.isdisjoint(s["tags"]) for s in matrix.signals), dtype=bool, count=len(matrix)
+        )
+    return mask
+
+
+def sample_subsets(
+    matrix: SignalMatrix,
+    n: int,
+    k: int,
+    window_days: Optional[int] = None,
+    tags: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Draw n independent score-weighted samples of k signals (without
+    replacement within a sample). Returns an (n, k) array of matrix row
+    indices, each row ordered by sampling key; k shrinks to the candidate count.
+    """
+    rng = np.random.default_rng(seed)
+    candidates = np.flatnonzero(signal_mask(matrix, window_days, tags))
+    k = min(k, len(candidates))
+    if k == 0:
+        return np.empty((n, 0), dtype=np.intp)
+
+    weights = matrix.scores[candidates].astype(np.float64)
+    out = np.empty((n, k), dtype=np.intp)
+    step = max(1, SAMPLE_CHUNK // len(candidates))
+    for start in range(0, n, step):
+        m = min(step, n - start)
+        keys = np.log(rng.random((m, len(candidates)))) / weights
+        top = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(keys, top, axis=1).argsort(axis=1)[:, ::-1]
+        out[start:start + m] = candidates[np.take_along_axis(top, order, axis=1)]
+    return out
+
+
+def reservoir_sample(
+    items: Iterable[Tuple[Any, float]], k: int, rng: Optional[random.Random] = None
+) -> List[Any]:
+    """
+    One-pass weighted reservoir sample of k keys from (key, weight) pairs,
+    highest sampling key first. Memory is O(k) however long the stream is.
+    """
+    rng = rng or random.Random()
+    heap: List[Tuple[float, Any]] = []
+    for key, weight in items:
+        u = rng.random() or 1e-300
+        priority = math.log(u) / (weight or 1.0)
+        if len(heap) < k:
+            heapq.heappush(heap, (priority, key))
+        elif priority > heap[0][0]:
+            heapq.heapreplace(heap, (priority, key))
+    return [key for _, key in sorted(heap, reverse=True)]
+
+
+_indexes_ready = False
+
+
+def sample_signals(
+    k: int,
+    window_days: Optional[int] = None,
+    tags: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score-weighted sample of k signals streamed from the table. Only
+    (rowid, score) is scanned — through the (score, collected_at) covering
+    index when no tag filter applies — and full rows are read for the winners.
+    """
+    global _indexes_ready
+    where, params = [], []
+    since = window_start(window_days)
+    if since is not None:
+        where.append("collected_at >= ?")
+        params.append(since)
+    if tags:
+        where.append(f"""EXISTS (
+            SELECT 1 FROM json_each(CASE WHEN json_valid(tags) THEN tags ELSE '[]' END)
+            WHERE value IN ({", ".join("?" * len(tags))})
+        )""")
+        params.extend(tags)
+    sql = "SELECT rowid, score FROM precursor_signals"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+
+    with get_precursor_conn() as conn:
+        if not _indexes_ready:
+            ensure_signal_indexes(conn)
+            conn.commit()
+            _indexes_ready = True
+
+        cur = conn.execute(sql, params)
+        rows = iter(lambda: cur.fetchmany(10_000), [])
+        winners = reservoir_sample(
+            ((rowid, score) for chunk in rows for rowid, score in chunk), k, random.Random(seed)
+        )
+        if not winners:
+            return []
+        by_rowid = {
+            row[4]: _signal_from_row(row)
+            for row in conn.execute(
+                f"SELECT {_SIGNAL_COLUMNS}, rowid FROM precursor_signals WHERE rowid IN ({', '.join('?' * len(winners))})",
+                winners,
+            )
+        }
+    return [by_rowid[rowid] for rowid in winners]
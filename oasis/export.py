@@ -0,0 +1,364 @@
+# oasis/export.py
+"""
+Columnar export of the scenario and signal archives (Parquet or Arrow IPC).
+
+    oasis export --format parquet --out exports/
+    oasis export --format arrow --table scenarios --table precursor_signals
+
+JSON blobs are flattened into typed columns without parsing them in Python:
+one json_tree pass per JSON column discovers every leaf path, its types and
+the element types of its arrays, then rows are streamed in chunks with one json_extract per column (as in
+loader.py). Integers → int64, mixed numbers → float64, true/false → bool,
+text → string, arrays of text → list<string>, anything else → JSON text.
+
+Output is hive-partitioned (by creation month, by source for signals) and
+split in two column groups keyed by `id`, so the wide numeric/categorical
+part can be memory-mapped and scanned without touching long text:
+
+    <out>/<table>/columns/<key>=<value>/part-00000.parquet
+    <out>/<table>/text/<key>=<value>/part-00000.parquet     narratives, raw text
+
+Each run writes to a temporary sibling directory and swaps it in on success,
+so `<out>/<table>` never mixes partitions from different runs.
+
+Writing needs pyarrow (the `export` extra); it is imported lazily.
+"""
+
+import json
+import os
+import re
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import typer
+
+from oasis.common.profiling import run_cli
+from oasis.logger import log, span
+
+FORMATS = ("parquet", "arrow")
+DEFAULT_CHUNKSIZE = 5_000
+
+
+def _scenario_db() -> Path:
+    from oasis.common import db
+    return db.SCENARIO_DB_PATH
+
+
+def _generator_db() -> Path:
+    from oasis.config import settings
+    return Path(settings.db_path)
+
+
+def _signal_db() -> Path:
+    from oasis.common import db
+    return db.PRECURSOR_DB_PATH
+
+
+# table → database, JSON columns to flatten, text-group columns, partition (name, SQL)
+EXPORT_TABLES: Dict[str, Dict] = {
+    "scenarios": {
+        "db": _scenario_db,
+        "json": ("data",),
+        "text": ("narrative",),
+        "partition": ("created_month", (
+            "substr(COALESCE(CASE WHEN json_valid(data) THEN json_extract(data, '$.metadata.created') END, created_at), 1, 7)"
+        )),
+    },
+    "s_scenarios": {
+        "db": _generator_db,
+        "json": ("params",),
+        "text": ("narrative",),
+        "partition": ("created_month", "substr(created_at, 1, 7)"),
+    },
+    "ev_scenarios": {
+        "db": _generator_db,
+        "json": ("params",),
+        "text": ("narrative",),
+        "partition": ("created_month", "substr(created_at, 1, 7)"),
+    },
+    "m_scenarios": {
+        "db": _generator_db,
+        "json": ("data",),
+        "text": ("narrative",),
+        "partition": ("created_month", "substr(created, 1, 7)"),
+    },
+    "precursor_signals": {
+        "db": _signal_db,
+        "json": (),
+        "text": ("description", "raw_data"),
+        "partition": ("source", "source"),
+    },
+}
+
+# SQLite json_tree / declared column types → export kinds
+_SQL_KINDS = {"INTEGER": "int", "REAL": "float", "BOOLEAN": "bool"}
+_JSON_KINDS = {"integer": "int", "real": "float", "true": "bool", "false": "bool", "text": "string"}
+
+
+class Column(NamedTuple):
+    name: str
+    expr: str     # SQL producing the value
+    kind: str     # int | float | bool | string | list | json
+    group: str    # "columns" or "text"
+
+
+def _merge_kinds(kinds: set) -> str:
+    kinds = kinds - {"null"}
+    if not kinds:
+        return "string"
+    if len(kinds) == 1:
+        return next(iter(kinds))
+    if kinds <= {"int", "float"}:
+        return "float"
+    return "json"  # genuinely mixed: keep the JSON text rather than guess
+
+
+def _quote(path_part: str) -> str:
+    return '"' + path_part.replace('"', '""') + '"'
+
+
+_KEY = re.compile(r'\.(?:"((?:[^"]|"")*)"|([^."]+))')
+
+
+def _column_path(fullkey: str) -> str:
+    """json_tree fullkey ($.a."b_c".d — SQLite quotes some keys) → plain dotted path a.b_c.d."""
+    return ".".join(quoted.replace('""', '"') if quoted else bare for quoted, bare in _KEY.findall(fullkey[1:]))
+
+
+def _group(path: str, spec: Dict) -> str:
+    """Long text (narratives, raw payloads) goes to the separate text column group."""
+    return "text" if any(path == t or path.endswith("." + t) for t in spec["text"]) else "columns"
+
+
+def plan_columns(conn: sqlite3.Connection, table: str) -> List[Column]:
+    """Typed column list for `table`: plain columns plus every discovered JSON leaf path."""
+    spec = EXPORT_TABLES[table]
+    columns: List[Column] = []
+    plain = [(r[1], (r[2] or "").upper()) for r in conn.execute(f"PRAGMA table_info({table})")]
+    taken = {name for name, _ in plain if name not in spec["json"]}
+
+    for name, decl in plain:
+        if name in spec["json"]:
+            continue
+        kind = "list" if (table, name) == ("precursor_signals", "tags") else _SQL_KINDS.get(decl.split("(")[0], "string")
+        columns.append(Column(name, _quote(name), kind, _group(name, spec)))
+
+    for source in spec["json"]:
+        with span("export.discover", table=table, column=source):
+            # One pass: leaf paths outside arrays, plus the types of top-level array elements
+            leaves: Dict[str, set] = {}
+            elements: Dict[str, set] = {}
+            for fullkey, path, element, jtype in conn.execute(f"""
+                SELECT DISTINCT j.fullkey, j.path, typeof(j.key) = 'integer', j.type
+                FROM {table}, json_tree({table}.{source}) AS j
+                WHERE json_valid({table}.{source}) AND instr(j.path, '[') = 0
+                  AND (typeof(j.key) = 'integer' OR j.type != 'object')
+            """):
+                if element:
+                    elements.setdefault(path, set()).add(jtype)
+                elif "[" not in fullkey:
+                    leaves.setdefault(fullkey, set()).add("list" if jtype == "array" else _JSON_KINDS.get(jtype, "null"))
+
+        for fullkey in sorted(leaves):
+            kind = _merge_kinds(leaves[fullkey])
+            if kind == "list" and not elements.get(fullkey, {"text"}) <= {"text"}:
+                kind = "json"  # arrays of objects/numbers stay JSON text
+            path = _column_path(fullkey)
+            name = path if source == "data" and path not in taken else f"{source}.{path}"
+            taken.add(name)
+            valid = f"CASE WHEN json_valid({_quote(source)}) THEN {_quote(source)} END"  # bad JSON → NULLs, not an error
+            expr = f"json_extract({valid}, '{fullkey.replace(chr(39), chr(39) * 2)}')"
+            if kind == "json":
+                expr = f"json_quote({expr})"  # scalars become JSON text too; arrays pass through
+            columns.append(Column(name, expr, kind, _group(path, spec)))
+    return columns
+
+
+def _convert(value, kind: str):
+    if value is None:
+        return None
+    if kind == "list":
+        try:
+            items = json.loads(value) if isinstance(value, str) else value
+        except ValueError:
+            return None
+        return [str(v) for v in items] if isinstance(items, list) else None
+    if kind == "bool":
+        return bool(value)
+    if kind == "float":
+        return float(value)
+    if kind == "int":
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    if kind == "json":
+        return None if value == "null" else value
+    return value if isinstance(value, str) else str(value)
+
+
+def iter_export_batches(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: Sequence[Column],
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[Tuple[str, Dict[str, List]]]:
+    """Yield (partition value, {column: values}) per chunk and partition; values already typed."""
+    part_name, part_expr = EXPORT_TABLES[table]["partition"]
+    select = ", ".join(f"{c.expr} AS {_quote(c.name)}" for c in columns)
+    cur = conn.execute(f"SELECT COALESCE({part_expr}, 'unknown') AS _partition, {select} FROM {table} ORDER BY rowid")
+    while True:
+        rows = cur.fetchmany(chunksize)
+        if not rows:
+            break
+        by_partition: Dict[str, List] = {}
+        for row in rows:
+            by_partition.setdefault(str(row[0]) or "unknown", []).append(row)
+        for value, part_rows in by_partition.items():
+            yield value, {
+                c.name: [_convert(r[i + 1], c.kind) for r in part_rows]
+                for i, c in enumerate(columns)
+            }
+
+
+def _arrow_type(pa, kind: str):
+    return {
+        "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(),
+        "string": pa.string(), "json": pa.string(), "list": pa.list_(pa.string()),
+    }[kind]
+
+
+class _PartitionWriters:
+    """One open Parquet / Arrow IPC writer per (group, partition) directory."""
+
+    def __init__(self, root: Path, fmt: str, part_name: str, schemas: Dict):
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        self.pa = pa
+        self.root = root
+        self.fmt = fmt
+        self.part_name = part_name
+        self.schemas = schemas
+        self._writers: Dict[Tuple[str, str], object] = {}
+
+    def write(self, group: str, partition: str, data: Dict[str, List]) -> None:
+        schema = self.schemas[group]
+        batch = self.pa.RecordBatch.from_arrays(
+            [self.pa.array(data[f.name], type=f.type) for f in schema], schema=schema
+        )
+        writer = self._writers.get((group, partition))
+        if writer is None:
+            directory = self.root / group / f"{self.part_name}={partition.replace('/', '_')}"
+            directory.mkdir(parents=True, exist_ok=True)
+            if self.fmt == "parquet":
+                writer = self.pa.parquet.ParquetWriter(directory / "part-00000.parquet", schema, compression="zstd")
+            else:
+                writer = self.pa.ipc.new_file(str(directory / "part-00000.arrow"), schema)
+            self._writers[(group, partition)] = writer
+        writer.write_batch(batch)  # Parquet: one row group per chunk
+
+    def close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+
+
+def export_table(
+    conn: sqlite3.Connection,
+    table: str,
+    out_dir: Path,
+    fmt: str = "parquet",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> int:
+    """Export one table, replacing `<out_dir>/<table>` as a whole; returns the number of rows written."""
+    import pyarrow as pa
+
+    columns = plan_columns(conn, table)
+    schemas = {
+        group: pa.schema(
+            [pa.field("id", pa.string())] +
+            [pa.field(c.name, _arrow_type(pa, c.kind)) for c in columns if c.group == group and c.name != "id"]
+        )
+        for group in ("columns", "text")
+    }
+    part_name = EXPORT_TABLES[table]["partition"][0]
+    final = Path(out_dir) / table
+    staging = Path(out_dir) / f".{table}.tmp-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    writers = _PartitionWriters(staging, fmt, part_name, schemas)
+    rows = 0
+    try:
+        try:
+            with span("export.table", table=table) as s:
+                for partition, data in iter_export_batches(conn, table, columns, chunksize):
+                    for group, schema in schemas.items():
+                        if len(schema) > 1:
+                            writers.write(group, partition, data)
+                    rows += len(data["id"])
+                s.set(rows=rows)
+        finally:
+            writers.close()
+        # Swap in the finished export; partitions from earlier runs go with the old directory
+        staging.mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(final, ignore_errors=True)
+        staging.rename(final)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return rows
+
+
+def _open_ro(path: Path) -> Optional[sqlite3.Connection]:
+    if not Path(path).exists():
+        return None
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def _has_table(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+
+app = typer.Typer(help="OASIS columnar export")
+
+
+@app.command()
+def export(
+    fmt: str = typer.Option("parquet", "--format", "-f", help=f"Output format: {' or '.join(FORMATS)}"),
+    out: Path = typer.Option(Path("exports"), "--out", "-o", help="Output directory"),
+    table: Optional[List[str]] = typer.Option(None, "--table", "-t", help="Table to export (repeatable; default all)"),
+    chunksize: int = typer.Option(DEFAULT_CHUNKSIZE, "--chunksize", help="Rows per streamed chunk / row group"),
+):
+    """Export scenario and signal tables to partitioned Parquet or Arrow files."""
+    if fmt not in FORMATS:
+        raise typer.BadParameter(f"must be one of {FORMATS}", param_hint="--format")
+    unknown = [t for t in table or () if t not in EXPORT_TABLES]
+    if unknown:
+        raise typer.BadParameter(f"unknown tables {unknown}; choose from {list(EXPORT_TABLES)}", param_hint="--table")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        typer.echo("pyarrow is required for export: pip install 'oasis-observatory[export]'", err=True)
+        raise typer.Exit(1)
+
+    for name in table or EXPORT_TABLES:
+        conn = _open_ro(EXPORT_TABLES[name]["db"]())
+        if conn is None or not _has_table(conn, name):
+            typer.echo(f"– {name}: not found, skipped")
+            if conn is not None:
+                conn.close()
+            continue
+        start = time.perf_counter()
+        try:
+            rows = export_table(conn, name, out, fmt, chunksize)
+        finally:
+            conn.close()
+        elapsed = time.perf_counter() - start
+        log.info("export.done", table=name, rows=rows, seconds=round(elapsed, 2))
+        typer.echo(f"✅ {name}: {rows} rows → {out / name} ({elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+    run_cli(app)
@@ -0,0 +1,335 @@
+# oasis/importer.py
+"""
+Bulk import of curated or externally produced scenarios from JSONL.
+
+    oasis import curated.jsonl --source curated
+    oasis import incoming/ --workers 8 --rejects rejects.jsonl
+
+Files (or every *.jsonl / *.ndjson, optionally .gz, under a directory) are
+streamed in batches. Parsing, schema validation (the compiled validator) and
+content hashing run in a process pool with a bounded number of batches in
+flight; the main process only dedupes and writes, one transaction per batch,
+into scenarios(id, title, data). Memory stays O(batch × workers) however
+large the input.
+
+A scenario is a duplicate if its id is already stored, or if its content
+(everything except id and metadata) hashes to one already in the archive,
+so re-running an import is a no-op. Hashes of rows written by other tools
+are backfilled (incrementally, by rowid watermark) before each import.
+Lines that are not UTF-8, fail to parse or validate, and duplicates go to
+the rejects file with the reason.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import typer
+
+from oasis.common.profiling import run_cli
+from oasis.logger import incr, log, span
+
+SOURCES = ("imported", "curated")
+PATTERNS = ("*.jsonl", "*.ndjson", "*.jsonl.gz", "*.ndjson.gz")
+DEFAULT_BATCH_SIZE = 5_000
+
+# (file, line number) of each input line, kept in the main process
+Location = Tuple[str, int]
+
+
+def content_hash(record: Dict) -> str:
+    """sha256 of the scenario minus id and metadata, in canonical JSON."""
+    body = {k: v for k, v in record.items() if k not in ("id", "metadata")}
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def input_files(paths: Iterable[Path]) -> List[Path]:
+    """Expand directories into their JSONL files (sorted, recursive)."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted({f for pattern in PATTERNS for f in path.rglob(pattern)}))
+        else:
+            files.append(path)
+    return files
+
+
+def iter_lines(files: Sequence[Path]) -> Iterator[Tuple[Location, str]]:
+    """Stream non-blank lines with their location."""
+    for path in files:
+        opener = gzip.open if path.suffix == ".gz" else open
+        # Undecodable bytes become lone surrogates; _prepare rejects those lines
+        with opener(path, "rt", encoding="utf-8", errors="surrogateescape") as f:
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    yield (str(path), lineno), line
+
+
+def _prepare(lines: List[str], source: str) -> List[Tuple[Optional[str], object]]:
+    """
+    Worker: parse, default metadata.source, validate and hash one batch.
+    Per line returns (None, (id, title, data, hash)) or (reason, errors).
+    """
+    from oasis.common.schema import SchemaManager
+
+    out = []
+    for line in lines:
+        try:
+            line.encode("utf-8")
+        except UnicodeEncodeError as exc:
+            out.append(("invalid_utf8", [f"undecodable byte at column {exc.start}"]))
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            out.append(("invalid_json", [str(exc)]))
+            continue
+        if not isinstance(record, dict):
+            out.append(("invalid_json", ["not a JSON object"]))
+            continue
+        if isinstance(record.get("metadata"), dict):
+            record["metadata"].setdefault("source", source)
+        errors = SchemaManager.errors(record)
+        if errors:
+            out.append(("schema", errors))
+            continue
+        out.append((None, (record["id"], record["title"], json.dumps(record), content_hash(record))))
+    return out
+
+
+def _prepared_batches(
+    lines: Iterator[Tuple[Location, str]], source: str, workers: int, batch_size: int
+) -> Iterator[Tuple[List[Location], List[str], List]]:
+    """Batches in input order, prepared inline or by a pool with at most 2 × workers batches queued."""
+    def batches():
+        while True:
+            chunk = list(islice(lines, batch_size))
+            if not chunk:
+                return
+            locations, texts = zip(*chunk)
+            yield list(locations), list(texts)
+
+    if workers <= 1:
+        for locations, texts in batches():
+            yield locations, texts, _prepare(texts, source)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for locations, texts in batches():
+            pending.append((locations, texts, pool.submit(_prepare, texts, source)))
+            if len(pending) >= 2 * workers:
+                locations, texts, future = pending.popleft()
+                yield locations, texts, future.result()
+        while pending:
+            locations, texts, future = pending.popleft()
+            yield locations, texts, future.result()
+
+
+def init_import_tables(conn: sqlite3.Connection) -> None:
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS scenarios (
+            id TEXT PRIMARY KEY,
+            title TEXT,
+            data TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS scenario_content_hashes (
+            content_hash TEXT PRIMARY KEY,
+            scenario_id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_content_hashes_scenario ON scenario_content_hashes (scenario_id);
+
+        CREATE TABLE IF NOT EXISTS scenario_content_hashes_watermark (
+            last_rowid INTEGER NOT NULL
+        );
+    """)
+    conn.commit()
+    backfill_content_hashes(conn)
+
+
+def backfill_content_hashes(conn: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Hash scenarios written by other tools (generators, skeletons) so content
+    dedup sees them too. Only rows above the stored rowid watermark that
+    have no hash yet are read. Returns the number of hashes added.
+    """
+    row = conn.execute("SELECT last_rowid FROM scenario_content_hashes_watermark").fetchone()
+    last_rowid = row[0] if row else 0
+    max_rowid = conn.execute("SELECT MAX(rowid) FROM scenarios").fetchone()[0] or 0
+    if max_rowid <= last_rowid:
+        return 0
+
+    changes = conn.total_changes
+    with span("import.backfill_hashes") as s:
+        cursor = conn.execute("""
+            SELECT s.id, s.data FROM scenarios s
+            WHERE s.rowid > ? AND s.rowid <= ?
+              AND NOT EXISTS (SELECT 1 FROM scenario_content_hashes h WHERE h.scenario_id = s.id)
+        """, (last_rowid, max_rowid))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            hashes = []
+            for scenario_id, data in rows:
+                try:
+                    record = json.loads(data)
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(record, dict):
+                    hashes.append((content_hash(record), scenario_id))
+            # First stored scenario wins when two share content
+            conn.executemany(
+                "INSERT OR IGNORE INTO scenario_content_hashes (content_hash, scenario_id) VALUES (?, ?)", hashes
+            )
+        added = conn.total_changes - changes
+        conn.execute("DELETE FROM scenario_content_hashes_watermark")
+        conn.execute("INSERT INTO scenario_content_hashes_watermark (last_rowid) VALUES (?)", (max_rowid,))
+        conn.commit()
+        s.set(hashes=added)
+    return added
+
+
+def _stored(conn: sqlite3.Connection, sql: str, keys: List[str]) -> set:
+    return {row[0] for row in conn.execute(sql, (json.dumps(keys),))}
+
+
+def _insert_batch(conn: sqlite3.Connection, rows: List[Tuple]) -> Tuple[List[Tuple], Dict[int, str]]:
+    """
+    Insert validated (id, title, data, hash) rows not already stored or
+    repeated earlier in the batch. Returns inserted rows and {index: reason}.
+    """
+    stored_ids = _stored(conn, "SELECT id FROM scenarios WHERE id IN (SELECT value FROM json_each(?))",
+                         [r[0] for r in rows])
+    stored_hashes = _stored(conn, "SELECT content_hash FROM scenario_content_hashes "
+                                  "WHERE content_hash IN (SELECT value FROM json_each(?))",
+                            [r[3] for r in rows])
+    fresh, duplicates = [], {}
+    for i, row in enumerate(rows):
+        if row[0] in stored_ids:
+            duplicates[i] = "duplicate_id"
+        elif row[3] in stored_hashes:
+            duplicates[i] = "duplicate_content"
+        else:
+            stored_ids.add(row[0])
+            stored_hashes.add(row[3])
+            fresh.append(row)
+
+    with conn:
+        conn.executemany("INSERT INTO scenarios (id, title, data) VALUES (?, ?, ?)", [r[:3] for r in fresh])
+        conn.executemany("INSERT INTO scenario_content_hashes (content_hash, scenario_id) VALUES (?, ?)",
+                         [(r[3], r[0]) for r in fresh])
+    return fresh, duplicates
+
+
+def _reject(out: Optional[IO[str]], location: Location, text: str, reason: str, errors: List[str]) -> None:
+    if out is not None:
+        out.write(json.dumps({"file": location[0], "line": location[1], "reason": reason,
+                              "errors": errors, "raw": text.rstrip("\n")}) + "\n")
+
+
+def import_scenarios(
+    conn: sqlite3.Connection,
+    files: Sequence[Path],
+    source: str = "imported",
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    rejects: Optional[IO[str]] = None,
+) -> Iterator[Dict[str, int]]:
+    """
+    Stream, validate, dedupe and insert scenarios from JSONL files. Yields
+    per-batch progress {"read", "inserted", "duplicates", "rejected"}.
+    """
+    init_import_tables(conn)
+    conn.execute("PRAGMA synchronous = NORMAL")
+    workers = workers if workers is not None else os.cpu_count() or 1
+
+    for locations, texts, results in _prepared_batches(iter_lines(files), source, workers, batch_size):
+        with span("import.batch", rows=len(texts)) as s:
+            valid = []  # positions in the batch of rows that passed validation
+            rejected = 0
+            for i, (reason, detail) in enumerate(results):
+                if reason is None:
+                    valid.append(i)
+                else:
+                    rejected += 1
+                    _reject(rejects, locations[i], texts[i], reason, detail)
+
+            inserted, duplicates = _insert_batch(conn, [results[i][1] for i in valid])
+            for j, reason in duplicates.items():
+                i = valid[j]
+                _reject(rejects, locations[i], texts[i], reason, [results[i][1][0]])
+
+            progress = {"read": len(texts), "inserted": len(inserted),
+                        "duplicates": len(duplicates), "rejected": rejected}
+            s.set(**progress)
+        for key in ("inserted", "duplicates", "rejected"):
+            incr(f"import.{key}", progress[key])
+        yield progress
+
+
+app = typer.Typer(help="OASIS scenario import")
+
+
+@app.command(name="import")
+def import_(
+    paths: List[Path] = typer.Argument(..., exists=True, help="JSONL files or directories of them"),
+    source: str = typer.Option("imported", "--source", help=f"metadata.source for records without one: {' or '.join(SOURCES)}"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Validation processes (default: CPU count)"),
+    batch_size: int = typer.Option(DEFAULT_BATCH_SIZE, "--batch-size", help="Lines per validation batch / transaction"),
+    rejects: Path = typer.Option(Path("import_rejects.jsonl"), "--rejects", help="Rejected lines with reasons"),
+):
+    """Import scenarios from JSONL into the scenario archive."""
+    if source not in SOURCES:
+        raise typer.BadParameter(f"must be one of {SOURCES}", param_hint="--source")
+    from oasis.common import db
+    from oasis.common.stats import refresh_stats
+
+    files = input_files(paths)
+    if not files:
+        typer.echo("No JSONL files found.")
+        raise typer.Exit(1)
+
+    db.SCENARIO_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db.SCENARIO_DB_PATH)
+    totals = {"read": 0, "inserted": 0, "duplicates": 0, "rejected": 0}
+    start = last_report = time.perf_counter()
+    try:
+        with open(rejects, "w", encoding="utf-8") as rejects_out:
+            for progress in import_scenarios(conn, files, source, workers, batch_size, rejects_out):
+                for key, value in progress.items():
+                    totals[key] += value
+                now = time.perf_counter()
+                if now - last_report >= 5:
+                    last_report = now
+                    typer.echo(f"  {totals['read']:,} read, {totals['inserted']:,} inserted "
+                               f"({totals['read'] / (now - start):,.0f} lines/s)")
+        refresh_stats(conn)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - start
+    rate = totals["read"] / elapsed if elapsed else 0.0
+    log.info("import.done", files=len(files), seconds=round(elapsed, 2), **totals)
+    typer.echo(f"✅ {totals['inserted']:,} inserted, {totals['duplicates']:,} duplicates, "
+               f"{totals['rejected']:,} rejected from {len(files)} file(s) "
+               f"in {elapsed:.1f}s ({rate:,.0f} lines/s)")
+    if totals["duplicates"] or totals["rejected"]:
+        typer.echo(f"   rejects → {rejects}")
+    else:
+        rejects.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    run_cli(app)
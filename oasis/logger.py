@@ -1,16 +1,205 @@
 # oasis/logger.py
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+"""
+Structured logging plus lightweight timing spans and counters.
 
-import structlog
+    with span("linkage.score", signals=n) as s:
+        ...
+        s.set(links=len(links))
+
+    @span("storage.save_scenario")
+    def save_scenario(...): ...
+
+    incr("tracker.signals.inserted")
+
+Every span is aggregated in-process (count, errors, total/max seconds) and,
+at DEBUG level, logged as a `span` event with its duration and parent span.
+Set OASIS_METRICS_FILE (or call enable_metrics_dump) to write the aggregates
+at exit: Prometheus text for *.prom, JSON lines otherwise.
+
+Importing this module is cheap: structlog is loaded on the first `log` call.
+"""
+
+import atexit
+import contextvars
+import functools
+import json
 import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure_logging(level: str = "INFO") -> None:
+    """Stdlib logging setup; explicit once-per-process init (CLIs call it via run_cli)."""
+    global _configured
+    with _configure_lock:
+        if not _configured:
+            logging.basicConfig(level=level)
+            _configured = True
+
+
+class _LazyLogger:
+    """`log` stand-in: structlog (and rich, via structlog.dev) load on the first log call."""
+
+    _logger = None
+
+    def __getattr__(self, name):
+        if _LazyLogger._logger is None:
+            configure_logging()
+            import structlog
+
+            structlog.configure(
+                processors=[
+                    structlog.processors.JSONRenderer()
+                ],
+                # Name loggers after the calling module, not this proxy
+                logger_factory=structlog.stdlib.LoggerFactory(ignore_frame_names=[__name__]),
+            )
+            _LazyLogger._logger = structlog.get_logger()
+        return getattr(_LazyLogger._logger, name)
+
+
+log = _LazyLogger()
+
+
+# ------------------------------------------------------------
+# Spans and counters
+# ------------------------------------------------------------
+
+_current_span: contextvars.ContextVar[Optional["span"]] = contextvars.ContextVar("oasis_span", default=None)
+_metrics_lock = threading.Lock()
+_span_stats: Dict[str, list] = {}      # name -> [count, errors, total_s, max_s]
+_counters: Dict[str, float] = {}
+
+
+def _record(name: str, duration: float, failed: bool) -> None:
+    with _metrics_lock:
+        stats = _span_stats.get(name)
+        if stats is None:
+            stats = _span_stats[name] = [0, 0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += failed
+        stats[2] += duration
+        if duration > stats[3]:
+            stats[3] = duration
+
+
+def incr(name: str, value: float = 1) -> None:
+    """Add to a named process-wide counter."""
+    with _metrics_lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+class span:
+    """Timing span: context manager or decorator. Nested spans record their parent."""
+
+    __slots__ = ("name", "fields", "parent", "depth", "_start", "_token")
+
+    def __init__(self, name: str, **fields: Any):
+        self.name = name
+        self.fields = fields
+
+    def set(self, **fields: Any) -> None:
+        """Attach result fields (counts, status) to the span event."""
+        self.fields.update(fields)
+
+    def __enter__(self) -> "span":
+        self.parent = _current_span.get()
+        self.depth = self.parent.depth + 1 if self.parent else 0
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self._start
+        _current_span.reset(self._token)
+        _record(self.name, duration, exc_type is not None)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            log.debug(
+                "span",
+                span=self.name,
+                parent=self.parent.name if self.parent else None,
+                depth=self.depth,
+                duration_ms=round(duration * 1000, 3),
+                error=exc_type.__name__ if exc_type else None,
+                **self.fields,
+            )
+
+    def __call__(self, func):
+        name, fields = self.name, self.fields
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # A fresh span per call: instances hold per-call state
+            with span(name, **fields):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    with _metrics_lock:
+        return {
+            "spans": {
+                name: {"count": c, "errors": e, "total_s": round(t, 6), "max_s": round(m, 6)}
+                for name, (c, e, t, m) in _span_stats.items()
+            },
+            "counters": dict(_counters),
+        }
+
+
+def reset_metrics() -> None:
+    with _metrics_lock:
+        _span_stats.clear()
+        _counters.clear()
+
+
+def format_prometheus(snapshot: Dict[str, Any]) -> str:
+    lines = ["# TYPE oasis_span_seconds summary"]
+    for name, s in sorted(snapshot["spans"].items()):
+        lines.append(f'oasis_span_seconds_count{{span="{name}"}} {s["count"]}')
+        lines.append(f'oasis_span_seconds_sum{{span="{name}"}} {s["total_s"]}')
+    lines.append("# TYPE oasis_span_seconds_max gauge")
+    lines += [f'oasis_span_seconds_max{{span="{n}"}} {s["max_s"]}' for n, s in sorted(snapshot["spans"].items())]
+    lines.append("# TYPE oasis_span_errors_total counter")
+    lines += [f'oasis_span_errors_total{{span="{n}"}} {s["errors"]}' for n, s in sorted(snapshot["spans"].items())]
+    lines.append("# TYPE oasis_events_total counter")
+    lines += [f'oasis_events_total{{name="{n}"}} {v}' for n, v in sorted(snapshot["counters"].items())]
+    return "\n".join(lines) + "\n"
+
+
+def format_jsonl(snapshot: Dict[str, Any]) -> str:
+    now = time.time()
+    rows = [{"ts": now, "type": "span", "name": n, **s} for n, s in sorted(snapshot["spans"].items())]
+    rows += [{"ts": now, "type": "counter", "name": n, "value": v} for n, v in sorted(snapshot["counters"].items())]
+    return "".join(json.dumps(r) + "\n" for r in rows)
+
+
+def dump_metrics(path: str) -> None:
+    """Append the current aggregates to `path` (Prometheus text for *.prom, else JSON lines)."""
+    snapshot = metrics_snapshot()
+    if str(path).endswith(".prom"):
+        with open(path, "w") as fh:  # Prometheus textfile collectors expect one full snapshot
+            fh.write(format_prometheus(snapshot))
+    else:
+        with open(path, "a") as fh:
+            fh.write(format_jsonl(snapshot))
+
+
+_dump_paths = set()
+
+
+def enable_metrics_dump(path: str) -> None:
+    """Write the metrics to `path` when the process exits."""
+    if path not in _dump_paths:
+        _dump_paths.add(path)
+        atexit.register(dump_metrics, path)
 
-structlog.configure(
-    processors=[
-        structlog.processors.JSONRenderer()
-    ],
-    logger_factory=structlog.stdlib.LoggerFactory(),
-)
 
-logging.basicConfig(level="INFO")
-log = structlog.get_logger()
\ No newline at end of file
+if os.environ.get("OASIS_METRICS_FILE"):
+    enable_metrics_dump(os.environ["OASIS_METRICS_FILE"])
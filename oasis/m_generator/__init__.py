@@ -1,3 +1,17 @@
-from oasis.m_generator.core_m import fetch_asi_scenarios
-from .interact import interact_all
-from .renderer import render_interaction
\ No newline at end of file
+# oasis/m_generator/__init__.py
+# Re-exports resolve lazily so the pure interaction logic (interact.py) can be
+# imported without pulling in the LLM and storage modules.
+_EXPORTS = {
+    "fetch_asi_scenarios": "oasis.m_generator.core_m",
+    "interact_all": "oasis.m_generator.interact",
+    "render_interaction": "oasis.m_generator.renderer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
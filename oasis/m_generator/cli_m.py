@@ -7,7 +7,7 @@ Runs parameter prompt immediately when executed.
 import typer
 import random
 from typing import Optional
-from oasis.m_generator.core_m import create_multi_asi_scenario
+from oasis.common.profiling import run_cli
 
 app = typer.Typer(
     name="ASI Scenario Generator v0.1.1",
@@ -49,6 +49,9 @@ def compose(
     seed: Optional[int] = None,
 ):
     """Generate briefing — interactive or CLI flags."""
+    from oasis.m_generator.core_m import create_multi_asi_scenario
+    from oasis.common.stats import refresh_stats
+
     if n is None:
         config = interactive_prompt()
         n = config["n"]
@@ -60,6 +63,7 @@ def compose(
 
     typer.echo(typer.style(f"\nComposing briefing with {n} ASIs...", fg=typer.colors.GREEN, bold=True))
     create_multi_asi_scenario(num_asis=n)
+    refresh_stats()
 
 @app.command()
 def list():
@@ -78,11 +82,15 @@ def list():
         count = d.get("metadata", {}).get("asi_count", 0)
         typer.echo(f"{title} — {count} ASIs")
 
-# AUTO-INTERACTIVE WHEN RUN DIRECTLY
-if __name__ == "__main__":
+def _main():
     import sys
     if len(sys.argv) == 1 or (len(sys.argv) > 1 and sys.argv[1] not in ["list", "compose"]):
         # No command → run interactive compose
         compose()
     else:
-        app()
\ No newline at end of file
+        app()
+
+
+# AUTO-INTERACTIVE WHEN RUN DIRECTLY
+if __name__ == "__main__":
+    run_cli(_main)
\ No newline at end of file
@@ -5,13 +5,13 @@ import json
 import os
 from datetime import datetime, timezone
 
+from oasis.config import settings
 from oasis.m_generator.ollama_m import generate_multi_asi_narrative
-from oasis.m_generator.database_m import save_multi_asi_scenario
+from oasis.m_generator.storage_m import save_multi_asi_briefing
 
 
 def get_db_path():
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    return os.path.join(base_dir, "data", "asi_scenarios.db")
+    return str(settings.db_path)
 
 
 def fetch_asi_scenarios(num_asis=3):
@@ -100,5 +100,5 @@ def create_multi_asi_scenario(num_asis=3):
         }
     }
 
-    save_multi_asi_scenario(scenario)
+    save_multi_asi_briefing(scenario)
     print(f"Multi-ASI scenario '{overall_title}' saved.")
\ No newline at end of file
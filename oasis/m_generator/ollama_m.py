@@ -0,0 +1,58 @@
+# oasis/m_generator/ollama_m.py
+"""
+Narratives for multi-ASI briefings, generated through the shared LLM client
+(model routing, stream guards and the configured backend).
+"""
+
+import json
+from typing import Any, Dict, List
+
+from oasis.common.llm_client import generate_with_fallback
+
+MULTI_ASI_PROMPT = """
+You are writing a classified foresight briefing on the interaction of several
+Artificial Superintelligences (ASIs) that emerge in the same world.
+
+------------------------------
+BRIEFING TITLE: {title}
+------------------------------
+
+# ASIs (Ground Truth — must be treated as factual)
+{asis}
+
+------------------------------
+REQUIREMENTS
+------------------------------
+
+Write a coherent narrative (600–1200 words) that:
+1. Introduces every ASI consistently with its parameters.
+2. Describes how the ASIs compete, cooperate or merge over time.
+3. Covers the consequences for human institutions and oversight.
+4. Uses a professional, analytical foresight tone (RAND, FHI, CSER style).
+5. Contains NO operational instructions, exploits or hacking steps.
+
+Write ONLY the narrative. Do not include sections, headers, or the parameters again.
+
+Begin now.
+""".strip()
+
+
+def _describe(asi: Dict[str, Any]) -> str:
+    # core_m passes {"title", "core_parameters"}; the renderer passes full scenarios
+    params = asi.get("core_parameters") or {
+        "origin": asi.get("origin", {}).get("initial_origin"),
+        "agency_level": asi.get("core_capabilities", {}).get("agency_level"),
+        "autonomy_degree": asi.get("core_capabilities", {}).get("autonomy_degree"),
+        "alignment_score": asi.get("core_capabilities", {}).get("alignment_score"),
+        "goal": asi.get("goals_and_behavior", {}).get("stated_goal"),
+    }
+    return f"- {asi.get('title', 'Untitled')}: {json.dumps(params, default=str)}"
+
+
+def generate_multi_asi_narrative(title: str, asis: List[Dict[str, Any]]) -> str:
+    """Narrative text for a briefing; raises RuntimeError when every model fails."""
+    prompt = MULTI_ASI_PROMPT.format(title=title, asis="\n".join(_describe(a) for a in asis))
+    success, text, _ = generate_with_fallback(prompt, title)
+    if not success:
+        raise RuntimeError(f"Multi-ASI narrative failed: {text}")
+    return text
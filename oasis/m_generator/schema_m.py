@@ -24,9 +24,9 @@ def init_multi_asi_table():
     ''')
 
     # Index for fast queries
-    cur.execute('CREATE INDEX IF NOT EXISTS idx_multi_asi_created ON multi_asi_scenarios(created DESC)')
-    cur.execute('CREATE INDEX IF NOT EXISTS idx_multi_asi_source ON multi_asi_scenarios(source)')
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_multi_asi_created ON m_scenarios(created DESC)')
+    cur.execute('CREATE INDEX IF NOT EXISTS idx_multi_asi_source ON m_scenarios(source)')
 
     conn.commit()
     conn.close()
-    print("Multi-ASI table initialized: multi_asi_scenarios")
\ No newline at end of file
+    print("Multi-ASI table initialized: m_scenarios")
\ No newline at end of file
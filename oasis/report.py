@@ -0,0 +1,391 @@
+# oasis/report.py
+"""
+OASIS Observatory – ASI Scenario Report Generator (v3.0)
+Generates a PDF summarizing 10 maximally diverse ASI scenarios with narratives and multiple diagrams.
+"""
+
+from __future__ import annotations
+import io
+import os
+import hashlib
+import shutil
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless backend; also safe inside worker processes
+import matplotlib.pyplot as plt
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import (
+    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    Image, PageBreak, KeepInFrame
+)
+
+import typer
+
+from oasis.common.db import SCENARIO_DB_PATH
+from oasis.common.loader import load_scenario_frame, fetch_narratives
+from oasis.logger import log
+
+# ───────────────────────────────────────────────
+# Settings
+# ───────────────────────────────────────────────
+
+REPORT_DIR = Path("reports")
+CHART_CACHE_DIR = REPORT_DIR / ".chart_cache"
+CHART_CACHE_KEEP = 8  # most recently used selections kept in the chart cache
+CHART_DPI = 240
+CHART_VERSION = "1"  # bump when chart code changes to invalidate cached images
+
+AUTONOMY_MAP = {
+    "none": 0.0, "limited": 0.2, "partial": 0.4,
+    "significant": 0.6, "full": 0.8, "super": 1.0,
+}
+
+# ───────────────────────────────────────────────
+# Step 1 – Load scenarios
+# ───────────────────────────────────────────────
+
+REPORT_FIELDS = ["title", "created", "agency", "autonomy", "alignment"]
+
+def load_scenarios() -> pd.DataFrame:
+    """Load the numeric/summary columns only; narratives are attached later for the selection."""
+    with closing(sqlite3.connect(SCENARIO_DB_PATH)) as conn:
+        df = load_scenario_frame(REPORT_FIELDS, conn=conn)
+
+    autonomy = df["autonomy"].astype("object").fillna("none").str.lower()
+    return pd.DataFrame({
+        "scenario_id": df["scenario_id"],
+        "id": df["title"].fillna("Untitled"),
+        "date": df["created"].fillna("").str[:10],
+        "agency": df["agency"].fillna(0.0),
+        "autonomy_str": autonomy.str.capitalize().astype("category"),
+        "autonomy_num": autonomy.map(AUTONOMY_MAP).fillna(0.0).astype("float32"),
+        "alignment": df["alignment"].fillna(0.0),
+    })
+
+def attach_narratives(df: pd.DataFrame) -> pd.DataFrame:
+    with closing(sqlite3.connect(SCENARIO_DB_PATH)) as conn:
+        narratives = fetch_narratives(df["scenario_id"], conn=conn)
+    return df.assign(narrative=df["scenario_id"].map(narratives).fillna(""))
+
+# ───────────────────────────────────────────────
+# Step 2 – Vectorize scenarios (numeric only)
+# ───────────────────────────────────────────────
+
+DIVERSITY_FEATURES = ["agency", "autonomy_num", "alignment"]
+DISTANCE_CHUNK = 65_536  # rows per distance block (bounds temporary memory)
+
+def vectorize(df: pd.DataFrame, features: Optional[Sequence[str]] = None) -> np.ndarray:
+    cols = list(features or DIVERSITY_FEATURES)
+    mat = df[cols].to_numpy(dtype=np.float32)
+    mins = mat.min(axis=0)
+    maxs = mat.max(axis=0)
+    denom = np.where(maxs - mins == 0, 1, maxs - mins)
+    norm = (mat - mins) / denom
+    return norm
+
+def pairwise_distances(x: np.ndarray) -> np.ndarray:
+    """Full N×N Euclidean distance matrix — only for small selections."""
+    sq = (x * x).sum(axis=1)
+    d2 = sq[:, None] + sq[None, :] - 2.0 * (x @ x.T)
+    return np.sqrt(np.maximum(d2, 0.0))
+
+def _update_min_distance(x: np.ndarray, point: np.ndarray, min_dist: np.ndarray, chunk: int):
+    """Lower min_dist in place with the distances to `point`, one block of rows at a time."""
+    for start in range(0, x.shape[0], chunk):
+        block = x[start:start + chunk] - point
+        np.minimum(min_dist[start:start + chunk], np.sqrt((block * block).sum(axis=1)),
+                   out=min_dist[start:start + chunk])
+
+# ───────────────────────────────────────────────
+# Step 3 – Select maximally diverse scenarios
+# ───────────────────────────────────────────────
+
+def select_diverse_scenarios(
+    df: pd.DataFrame,
+    n: int = 10,
+    features: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+    chunk: int = DISTANCE_CHUNK,
+) -> pd.DataFrame:
+    """
+    Farthest-point sampling: keep a length-N vector of each row's distance to the
+    nearest selected scenario and pick its argmax, n times. O(N) memory.
+    """
+    if len(df) <= n:
+        return df
+    x = vectorize(df, features)
+    total = x.shape[0]
+    rng = np.random.default_rng(seed)
+
+    min_dist = np.full(total, np.inf, dtype=np.float32)
+    selected = [int(rng.integers(0, total))]
+    while True:
+        _update_min_distance(x, x[selected[-1]], min_dist, chunk)
+        min_dist[selected[-1]] = -1
+        if len(selected) == n:
+            break
+        selected.append(int(min_dist.argmax()))
+    return df.iloc[selected].reset_index(drop=True)
+
+# ───────────────────────────────────────────────
+# Step 4 – Plots
+# ───────────────────────────────────────────────
+
+def make_plot(df: pd.DataFrame, path: Union[Path, BinaryIO]):
+    plt.figure(figsize=(7.6, 6))
+    sizes = 200 + 1600 * df["alignment"]
+    plt.scatter(df["agency"], df["autonomy_num"], s=sizes, c="#1f77b4", alpha=0.8, edgecolors="white", linewidth=1.6)
+    for _, r in df.iterrows():
+        plt.annotate(r["id"][-6:], (r["agency"], r["autonomy_num"]), xytext=(6, 6), textcoords="offset points", fontsize=8, fontweight="bold")
+    plt.xlabel("Agency Level")
+    plt.ylabel("Autonomy (mapped)")
+    plt.title("ASI Scenario Diversity Map\nDot size = Alignment Score")
+    plt.grid(True, linestyle="--", alpha=0.4)
+    plt.xlim(-0.05, 1.05)
+    plt.ylim(-0.05, 1.05)
+    plt.tight_layout()
+    plt.savefig(path, dpi=CHART_DPI, format="png")
+    plt.close()
+
+def make_radar_chart(df: pd.DataFrame, path: Union[Path, BinaryIO]):
+    labels = ["Agency", "Autonomy", "Alignment"]
+    angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
+    angles += angles[:1]
+
+    plt.figure(figsize=(6,6))
+    for _, r in df.iterrows():
+        values = [r["agency"], r["autonomy_num"], r["alignment"]]
+        values += values[:1]
+        plt.polar(angles, values, label=r["id"], alpha=0.6)
+    plt.xticks(angles[:-1], labels)
+    plt.title("ASI Scenario Radar Chart")
+    plt.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1), fontsize=6)
+    plt.tight_layout()
+    plt.savefig(path, dpi=CHART_DPI, format="png")
+    plt.close()
+
+def make_distance_heatmap(df: pd.DataFrame, path: Union[Path, BinaryIO]):
+    dist = pairwise_distances(vectorize(df))
+    plt.figure(figsize=(6,6))
+    plt.imshow(dist, cmap="viridis")
+    plt.colorbar(label="Euclidean Distance")
+    plt.title("Scenario Distance Heatmap")
+    plt.xticks(range(len(df)), df["id"], rotation=90, fontsize=6)
+    plt.yticks(range(len(df)), df["id"], fontsize=6)
+    plt.tight_layout()
+    plt.savefig(path, dpi=CHART_DPI, format="png")
+    plt.close()
+
+def make_timeline(df: pd.DataFrame, path: Union[Path, BinaryIO]):
+    plt.figure(figsize=(7,3))
+    years = [2025, 2030, 2050, 2100]
+    for idx, r in enumerate(df.itertuples()):
+        plt.hlines(idx, years[0], years[-1], color='grey', alpha=0.5)
+        plt.plot([years[1]], [idx], 'o', color='blue')
+        plt.text(years[-1]+2, idx, r.id, verticalalignment='center', fontsize=7)
+    plt.yticks([])
+    plt.xlabel("Year")
+    plt.title("Scenario Timeline Example")
+    plt.tight_layout()
+    plt.savefig(path, dpi=CHART_DPI, format="png")
+    plt.close()
+
+def make_risk_scatter(df: pd.DataFrame, path: Union[Path, BinaryIO]):
+    plt.figure(figsize=(7,6))
+    plt.scatter(df["alignment"], df["autonomy_num"], s=150, c=df["agency"], cmap="coolwarm", alpha=0.7)
+    plt.colorbar(label="Agency Level")
+    for _, r in df.iterrows():
+        plt.text(r["alignment"]+0.01, r["autonomy_num"]+0.01, r["id"][-6:], fontsize=7)
+    plt.xlabel("Alignment Score")
+    plt.ylabel("Autonomy (mapped)")
+    plt.title("ASI Risk Scatter")
+    plt.grid(True, linestyle="--", alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(path, dpi=CHART_DPI, format="png")
+    plt.close()
+
+CHARTS = {
+    "diversity_map": make_plot,
+    "radar_chart": make_radar_chart,
+    "distance_heatmap": make_distance_heatmap,
+    "timeline": make_timeline,
+    "risk_scatter": make_risk_scatter,
+}
+
+def _render_chart(name: str, df: pd.DataFrame) -> bytes:
+    """Render one chart to PNG bytes (runs inside a worker process)."""
+    buf = io.BytesIO()
+    CHARTS[name](df, buf)
+    return buf.getvalue()
+
+def _chart_cache_key(df: pd.DataFrame) -> str:
+    """Selected scenario IDs (in order) plus their plotted values."""
+    payload = df[["id", "agency", "autonomy_num", "alignment"]].to_json(orient="values")
+    return hashlib.sha256(f"{CHART_VERSION}:{payload}".encode()).hexdigest()[:16]
+
+def render_charts(df: pd.DataFrame, workers: Optional[int] = None) -> Dict[str, bytes]:
+    """
+    Render all charts as in-memory PNGs, in parallel across processes.
+    Images are cached per selection, so an unchanged selection skips plotting.
+    """
+    cache_dir = CHART_CACHE_DIR / _chart_cache_key(df)
+    charts: Dict[str, bytes] = {}
+    for name in CHARTS:
+        cached = cache_dir / f"{name}.png"
+        if cached.exists():
+            charts[name] = cached.read_bytes()
+
+    missing = [name for name in CHARTS if name not in charts]
+    if not missing:
+        os.utime(cache_dir)  # mark as recently used for eviction
+        log.info("report.charts_cached", key=cache_dir.name)
+        return charts
+
+    workers = workers or min(len(missing), os.cpu_count() or 1)
+    if workers == 1:
+        rendered = [_render_chart(name, df) for name in missing]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(_render_chart, missing, [df] * len(missing)))
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for name, png in zip(missing, rendered):
+        charts[name] = png
+        # Write-then-rename so concurrent report jobs never read a partial file
+        tmp = cache_dir / f"{name}.{os.getpid()}.tmp"
+        tmp.write_bytes(png)
+        os.replace(tmp, cache_dir / f"{name}.png")
+    os.utime(cache_dir)
+    _prune_chart_cache(CHART_CACHE_KEEP)
+
+    return {name: charts[name] for name in CHARTS}
+
+def _prune_chart_cache(keep: int):
+    """Drop all but the `keep` most recently used selections from the chart cache."""
+    entries = sorted(
+        (d for d in CHART_CACHE_DIR.iterdir() if d.is_dir()), key=lambda d: d.stat().st_mtime, reverse=True
+    )
+    for stale in entries[keep:]:
+        shutil.rmtree(stale, ignore_errors=True)  # a concurrent run may be removing it too
+
+# ───────────────────────────────────────────────
+# Step 5 – Build PDF
+# ───────────────────────────────────────────────
+
+def build_pdf(df: pd.DataFrame, workers: Optional[int] = None):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    pdf_path = REPORT_DIR / f"OASIS_ASI_Report_{timestamp}.pdf"
+
+    doc = SimpleDocTemplate(str(pdf_path), pagesize=A4, leftMargin=40, rightMargin=40, topMargin=60, bottomMargin=60)
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name="BigTitle", parent=styles["Title"], fontSize=22, alignment=1))
+
+    story = []
+
+    # ── Cover Page ──
+    styles.add(ParagraphStyle(name="CoverTitle", fontSize=32, leading=38, alignment=1, spaceAfter=30,
+                              textColor=colors.HexColor("#0b1c3d")))
+    styles.add(ParagraphStyle(name="CoverSubtitle", fontSize=18, leading=24, alignment=1, spaceAfter=60,
+                              textColor=colors.HexColor("#2c3e50")))
+    styles.add(ParagraphStyle(name="CoverDate", fontSize=12, alignment=1, textColor=colors.grey))
+
+    story.append(Spacer(1, 3 * inch))
+    story.append(Paragraph("OASIS OBSERVATORY", styles["CoverTitle"]))
+    story.append(Paragraph("Artificial Superintelligence<br/>Scenario Report", styles["CoverSubtitle"]))
+    story.append(Spacer(1, 1.5 * inch))
+    story.append(Paragraph(f"Generated on {datetime.now():%B %d, %Y at %H:%M}", styles["CoverDate"]))
+    story.append(PageBreak())
+
+
+    # Summary Table
+    story.append(Paragraph("Selected Scenarios Overview", styles["Heading1"]))
+    story.append(Spacer(1, 12))
+
+    table_data = [["Scenario ID", "Created", "Agency", "Autonomy", "Alignment"]]
+    for _, r in df.iterrows():
+        table_data.append([
+            Paragraph(f"<b>{r['id']}</b>", styles["Normal"]),
+            r["date"],
+            f"{r['agency']:.3f}",
+            r["autonomy_str"],
+            f"{r['alignment']:.3f}"
+        ])
+
+    table = Table(table_data, colWidths=[2.8 * inch, 1.0 * inch, 0.9 * inch, 1.1 * inch, 1.1 * inch])
+    table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c5282")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 11),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.lightgrey),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#f7fafc")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 8),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+    ]))
+    story.append(table)
+    story.append(PageBreak())
+
+    # Charts (in-memory PNGs, nothing written to shared paths)
+    for name, png in render_charts(df, workers=workers).items():
+        story.append(Paragraph(name.replace("_", " ").title(), styles["Heading1"]))
+        story.append(Spacer(1, 6))
+        story.append(KeepInFrame(0, 0, [Image(io.BytesIO(png), width=7*inch, height=6*inch)], hAlign="CENTER"))
+        story.append(PageBreak())
+
+    # Scenario Narratives
+    story.append(Paragraph("Scenario Narratives", styles["Heading1"]))
+    story.append(Spacer(1, 20))
+    for _, r in df.iterrows():
+        story.append(Paragraph(f"<b>{r['id']}</b>", styles["Heading2"]))
+        story.append(Paragraph(f"Agency {r['agency']:.3f} • Autonomy {r['autonomy_str']} • Alignment {r['alignment']:.3f}", styles["Normal"]))
+        story.append(Spacer(1, 6))
+        story.append(Paragraph(r["narrative"], styles["Normal"]))
+        story.append(Spacer(1, 20))
+
+    doc.build(story)
+
+    log.info(f"Report generated: {pdf_path}")
+
+# ───────────────────────────────────────────────
+# Main
+# ───────────────────────────────────────────────
+
+def generate_pdf_report(n: int = 10, seed: Optional[int] = None, features: Optional[Sequence[str]] = None):
+    df_all = load_scenarios()
+    if df_all.empty:
+        log.error("No scenarios available in the database.")
+        return
+
+    df = select_diverse_scenarios(df_all, n=n, features=features, seed=seed)
+    build_pdf(attach_narratives(df))
+
+app = typer.Typer(help="OASIS scenario PDF report")
+
+
+@app.command()
+def report(
+    n: int = typer.Option(10, "--n", help="Number of maximally diverse scenarios to include"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Seed for the diversity selection"),
+    feature: Optional[List[str]] = typer.Option(None, "--feature", help="Selection feature column (repeatable)"),
+):
+    """Build reports/OASIS_ASI_Report_*.pdf from the scenario database."""
+    generate_pdf_report(n=n, seed=seed, features=feature or None)
+
+if __name__ == "__main__":
+    from oasis.common.profiling import run_cli
+    run_cli(app)
\ No newline at end of file
@@ -7,5 +7,18 @@ Created on Sat Nov  8 16:13:54 2025
 """
 
 # oasis/s_generator/__init__.py
-from oasis.s_generator.core_s import generate_scenario
-from oasis.s_generator.params_s import sample_parameters
+# Re-exports resolve lazily so `cli_s --help` and the skeleton tools don't
+# import the generation pipeline (and its dependencies) up front.
+_EXPORTS = {
+    "generate_scenario": "oasis.s_generator.core_s",
+    "sample_parameters": "oasis.s_generator.params_s",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,19 +5,50 @@
 CLI entrypoint for precursor-informed scenario generation
 """
 
+import time
 import typer
-from oasis.s_generator.core_s import generate_scenario
+from typing import List, Optional
+from oasis.common.profiling import run_cli
 from oasis.logger import log
 
 app = typer.Typer(help="Generate speculative ASI scenarios using core_s pipeline.")
 
 
+def _run_job(job_id: str, pipeline: bool, llm_workers: int):
+    from oasis.s_generator.core_s import run_generation_job
+    from oasis.common.stats import refresh_stats
+
+    outcome = run_generation_job(
+        job_id,
+        pipeline=pipeline,
+        llm_workers=llm_workers,
+        on_result=lambda scenario: typer.echo(f"✅ Generated: {scenario['title']}"),
+    )
+    job = outcome["job"]
+    if outcome["pipeline"] is not None:
+        typer.echo(f"\n{outcome['pipeline'].format_summary()}")
+
+    refresh_stats()
+    if job["status"] == "completed":
+        typer.echo(f"\n✨ Done. Job {job['id']} completed ({job['requested']} scenarios).\n")
+    else:
+        typer.echo(f"\n⚠️ Job {job['id']} incomplete — resume with: oasis s resume {job['id']}\n")
+
+
 @app.command()
-def generate(n: int = typer.Option(
-    default=None,
-    help="Number of scenarios to generate. If not provided, you will be prompted."
-)):
-    """Generate N ASI scenarios."""
+def generate(
+    n: int = typer.Option(
+        default=None,
+        help="Number of scenarios to generate. If not provided, you will be prompted."
+    ),
+    pipeline: bool = typer.Option(
+        False, "--pipeline", help="Overlap sampling, LLM calls, validation and DB writes in stages."
+    ),
+    llm_workers: int = typer.Option(2, "--llm-workers", help="Concurrent LLM calls in --pipeline mode."),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Job seed for reproducible parameters."),
+):
+    """Generate N ASI scenarios as a resumable job."""
+    from oasis.common import jobs
 
     # If not provided via CLI, prompt the user interactively
     if n is None:
@@ -27,18 +58,104 @@ def generate(n: int = typer.Option(
             typer.echo("Invalid input. Defaulting to 1.")
             n = 1
 
-    log.info("starting_generation", total=n)
-    typer.echo(f"\n🧠 Generating {n} scenario{'s' if n != 1 else ''}...\n")
+    job = jobs.create_job("s", n, seed=seed)
+    log.info("starting_generation", total=n, job=job["id"], seed=job["seed"])
+    typer.echo(f"\n🧠 Generating {n} scenario{'s' if n != 1 else ''}... (job {job['id']}, seed {job['seed']})\n")
+    _run_job(job["id"], pipeline, llm_workers)
+
+
+@app.command()
+def resume(
+    job_id: str = typer.Argument(..., help="Job id (or unique prefix) to resume."),
+    pipeline: bool = typer.Option(False, "--pipeline", help="Run the remaining items as a staged pipeline."),
+    llm_workers: int = typer.Option(2, "--llm-workers", help="Concurrent LLM calls in --pipeline mode."),
+):
+    """Resume an interrupted generation job, re-issuing only the missing items."""
+    from oasis.common import jobs
+
+    job = jobs.get_job(job_id)
+    if job is None:
+        typer.echo(f"❌ Unknown or ambiguous job id: {job_id}")
+        raise typer.Exit(code=1)
+
+    remaining = job["requested"] - job["done"]
+    log.info("resuming_generation", job=job["id"], remaining=remaining)
+    typer.echo(f"\n🔁 Resuming job {job['id']}: {job['done']}/{job['requested']} done, {remaining} remaining\n")
+    _run_job(job["id"], pipeline, llm_workers)
+
+
+@app.command(name="jobs")
+def list_jobs(limit: int = typer.Option(10, "--limit", "-l", help="Number of jobs to show.")):
+    """List recent generation jobs and their progress."""
+    from oasis.common import jobs
+
+    rows = jobs.list_jobs(limit=limit)
+    if not rows:
+        typer.echo("No generation jobs recorded yet.")
+        return
+    for row in rows:
+        typer.echo(f"{row['id']}  {row['status']:<11} {row['done']:>5}/{row['requested']:<5} seed={row['seed']}  {row['created_at']}")
+
+
+@app.command()
+def skeleton(
+    n: int = typer.Argument(..., help="Number of skeleton scenarios to generate."),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Seed for reproducible parameters."),
+    batch_size: int = typer.Option(10_000, "--batch-size", help="Scenarios sampled, validated and inserted per batch."),
+    validate: bool = typer.Option(True, "--validate/--no-validate", help="Schema-validate each batch before inserting."),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Processes for batch validation."),
+):
+    """Generate N schema-valid scenarios without LLM narratives (parameters only)."""
+    from oasis.s_generator.skeleton import generate_skeletons
+    from oasis.common.stats import refresh_stats
+
+    typer.echo(f"\n🦴 Generating {n} skeleton scenario{'s' if n != 1 else ''}...\n")
+    start = time.perf_counter()
+    saved = rejected = 0
+    for batch in generate_skeletons(n, seed=seed, batch_size=batch_size, validate=validate, workers=workers):
+        saved += batch["saved"]
+        rejected += batch["rejected"]
+        elapsed = time.perf_counter() - start
+        typer.echo(f"  {saved:>9} saved  {rejected:>5} rejected  {saved / elapsed:>10.0f} scenarios/s")
+
+    refresh_stats()
+    elapsed = time.perf_counter() - start
+    typer.echo(f"\n✨ Done. {saved} skeletons in {elapsed:.1f}s ({saved / elapsed:.0f}/s).\n")
+
+
+def _pairs(values: Optional[List[str]], option: str) -> dict:
+    """Parse repeated FIELD=VALUE options into a dict."""
+    pairs = {}
+    for item in values or []:
+        name, sep, value = item.partition("=")
+        if not sep or not name:
+            raise typer.BadParameter(f"expected FIELD=VALUE, got {item!r}", param_hint=option)
+        pairs[name.strip()] = value.strip()
+    return pairs
+
+
+@app.command()
+def narrate(
+    match: Optional[List[str]] = typer.Option(None, "--match", help="FIELD=VALUE equality filter, e.g. origin=state (repeatable)."),
+    minimum: Optional[List[str]] = typer.Option(None, "--min", help="FIELD=NUMBER lower bound, e.g. agency=0.7 (repeatable)."),
+    maximum: Optional[List[str]] = typer.Option(None, "--max", help="FIELD=NUMBER upper bound, e.g. alignment=0.2 (repeatable)."),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Narrate at most this many skeletons."),
+):
+    """Attach LLM narratives to selected skeleton scenarios (fields as in the loader)."""
+    from oasis.s_generator.skeleton import narrate_skeletons, skeleton_filters
+
+    filters = (_pairs(match, "--match"), _pairs(minimum, "--min"), _pairs(maximum, "--max"))
+    try:
+        skeleton_filters(*filters)
+    except (KeyError, ValueError) as exc:
+        raise typer.BadParameter(str(exc).strip("'"))
 
-    for i in range(1, n + 1):
-        log.info("generating", i=i)
-        scenario = generate_scenario()
-        if scenario:
-            typer.echo(f"✅ Generated: {scenario['title']}")
-        else:
-            typer.echo(f"❌ Scenario {i} generation failed.")
-    typer.echo("\n✨ Done.\n")
+    count = 0
+    for scenario in narrate_skeletons(*filters, limit=limit):
+        count += 1
+        typer.echo(f"✅ Narrated: {scenario['title']}")
+    typer.echo(f"\n✨ Done. {count} skeleton{'s' if count != 1 else ''} narrated.\n")
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    run_cli(app)
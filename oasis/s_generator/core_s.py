@@ -5,58 +5,34 @@
 Core logic for generating ASI scenarios.
 """
 import uuid
+import random
 from datetime import datetime, timezone
-from typing import Dict, Any, Union
+from typing import Callable, Dict, Any, List, Optional, Union
 from oasis.common.schema import SchemaManager
 from oasis.logger import log
 from oasis.s_generator.params_s import sample_parameters
-from oasis.common.llm_client import generate_narrative
+from oasis.common.llm_client import generate_narrative, set_console_echo
 from oasis.common.timeline import dynamic_timeline
 from oasis.common.consistency import NarrativeChecker
-from oasis.common.storage import save_scenario, init_db
-from oasis.common.abbreviator import abbreviate
+from oasis.common.storage import save_scenario, save_scenarios, init_db
+from oasis.common.abbreviator import abbreviate, reserve_scenario_numbers
+from oasis.common.pipeline import GenerationPipeline
+from oasis.common import jobs
 
+def build_scenario(
+    params: Dict[str, Any],
+    title: str,
+    narrative: str,
+    timeline_phases: List[Dict[str, Any]],
+    model_used: str,
+    scenario_id: Optional[str] = None,
+    now: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Assemble the schema-shaped scenario dict from flat params and narrative."""
+    scenario_id = scenario_id or str(uuid.uuid4())
+    now = now or datetime.now(timezone.utc).isoformat()
 
-def generate_scenario() -> Union [Dict[str, Any], None]:
-    """
-    Generate one fully valid, schema-compliant ASI scenario.
-    End-to-end: sample → prompt → LLM → check → validate → save.
-    """
-    init_db()
-
-    # 1. Sample parameters
-    params = sample_parameters()
-    log.debug("params.sampled", count=len(params))
-
-    # 2. Generate title
-    title = abbreviate(params)
-
-    # 3. IDs & timestamps
-    scenario_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
-
-    # 4. Timeline
-    timeline_phases = dynamic_timeline()
-
-    # 5. Generate narrative
-    success, narrative, model_used = generate_narrative(
-        title=title,
-        params=params,
-        timeline=timeline_phases
-    )
-    if not success:
-        log.error("llm.all_failed")
-        return None
-
-    # 6. Consistency check
-    checker = NarrativeChecker(params)
-    consistent, failures = checker.check(narrative)
-    if not consistent:
-        log.warning("consistency.failed", failures=failures)
-        return None
-
-    # 7. Build final scenario
-    scenario: Dict[str, Any] = {
+    return {
         "id": scenario_id,
         "title": title,
         "metadata": {
@@ -131,22 +107,168 @@ def generate_scenario() -> Union [Dict[str, Any], None]:
         }
     }
 
-    # 8. Schema validation
+
+# ------------------------------------------------------------
+# Stages (shared by the sequential and pipelined paths)
+# ------------------------------------------------------------
+
+def prepare_item(number: Optional[int] = None, seed: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Sample parameters, title and timeline — everything before the LLM call.
+    With `seed`, parameters come from a private RNG, so they are reproducible
+    (resumable jobs) whatever other threads draw from the global one.
+    """
+    params = sample_parameters(None if seed is None else random.Random(seed))
+    log.debug("params.sampled", count=len(params))
+    return {
+        "params": params,
+        "title": abbreviate(params, number=number),
+        "timeline": dynamic_timeline(),
+    }
+
+
+def narrate_item(item: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+    """Attach the LLM narrative; None if every model failed."""
+    success, narrative, model_used = generate_narrative(
+        title=item["title"],
+        params=item["params"],
+        timeline=item["timeline"]
+    )
+    if not success:
+        log.error("llm.all_failed")
+        return None
+    return {**item, "narrative": narrative, "model_used": model_used}
+
+
+def finalize_item(item: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+    """Consistency check + schema validation; returns the scenario or None."""
+    checker = NarrativeChecker(item["params"], item["timeline"])
+    consistent, failures = checker.check(item["narrative"])
+    if not consistent:
+        log.warning("consistency.failed", failures=failures)
+        return None
+
+    scenario = build_scenario(
+        item["params"], item["title"], item["narrative"], item["timeline"], item["model_used"]
+    )
     valid, err = SchemaManager.validate(scenario)
     if not valid:
         log.error("schema.validation.failed", error=err)
         return None
+    return scenario
 
-    # 9. Save
-    save_scenario(
-        table_name="scenarios",
-        params=params,
-        narrative=narrative,
-        timeline=timeline_phases,
-        model_used=model_used,
-        signals=[]  # baseline generator has no precursor signals
-    )
 
-    log.info("scenario.generated", title=title, model=model_used, id=scenario_id[:8])
+def _storage_record(item: Dict[str, Any], scenario: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": scenario["id"],  # the stored row keeps the id that is logged and returned
+        "params": item["params"],
+        "narrative": item["narrative"],
+        "timeline": item["timeline"],
+        "model_used": item["model_used"],
+        "signals": [],  # baseline generator has no precursor signals
+    }
+
+
+def generate_scenario() -> Union [Dict[str, Any], None]:
+    """
+    Generate one fully valid, schema-compliant ASI scenario.
+    End-to-end: sample → prompt → LLM → check → validate → save.
+    """
+    init_db()
+
+    item = narrate_item(prepare_item())
+    if item is None:
+        return None
+
+    scenario = finalize_item(item)
+    if scenario is None:
+        return None
+
+    save_scenario(table_name="s_scenarios", **_storage_record(item, scenario))
+
+    log.info("scenario.generated", title=scenario["title"], model=item["model_used"], id=scenario["id"][:8])
+
+    return scenario
+
+
+def run_generation_job(
+    job_id: str,
+    pipeline: bool = False,
+    llm_workers: int = 2,
+    batch_size: int = 25,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Generate the missing items of a persistent job (see oasis.common.jobs).
+    Every saved scenario and every failure is checkpointed, so an interrupted
+    job can be resumed; parameters come from the job seed, so resumed items
+    get the same parameters they would have had originally.
+
+    Returns {"job": ..., "results": [scenarios], "pipeline": GenerationPipeline | None}.
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        raise ValueError(f"Unknown or ambiguous job id: {job_id}")
+    indices = jobs.pending_indices(job)
+    outcome: Dict[str, Any] = {"job": job, "results": [], "pipeline": None}
+    if not indices:
+        jobs.finish_job(job["id"])
+        return outcome
+
+    init_db()
+    # One block reservation for the whole run; prepare() runs on a single thread
+    numbers = reserve_scenario_numbers(len(indices))
+
+    def prepare(k: int) -> Dict[str, Any]:
+        index = indices[k]
+        item = prepare_item(numbers[k], seed=jobs.item_seed(job["seed"], index))
+        item["job_index"] = index
+        return item
+
+    def narrate(item: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+        out = narrate_item(item)
+        if out is None:
+            jobs.mark_failed(job["id"], item["job_index"], "llm.all_failed")
+        return out
+
+    def finalize(item: Dict[str, Any]) -> Union[Dict[str, Any], None]:
+        scenario = finalize_item(item)
+        if scenario is None:
+            jobs.mark_failed(job["id"], item["job_index"], "validation.failed")
+            return None
+        return {"scenario": scenario, "record": _storage_record(item, scenario), "job_index": item["job_index"]}
+
+    def write(batch: List[Dict[str, Any]]) -> None:
+        ids = save_scenarios("s_scenarios", [entry["record"] for entry in batch])
+        jobs.mark_done(job["id"], [(entry["job_index"], sid) for entry, sid in zip(batch, ids)])
+        for entry in batch:
+            log.info("scenario.generated", title=entry["scenario"]["title"],
+                     model=entry["record"]["model_used"], id=entry["scenario"]["id"][:8])
+            outcome["results"].append(entry["scenario"])
+            if on_result:
+                on_result(entry["scenario"])
+
+    try:
+        if pipeline:
+            # Concurrent streams would interleave on the console; keep text, drop live echo
+            set_console_echo(llm_workers <= 1)
+            outcome["pipeline"] = GenerationPipeline(
+                prepare=prepare,
+                narrate=narrate,
+                finalize=finalize,
+                write=write,
+                llm_workers=llm_workers,
+                batch_size=batch_size,
+            )
+            outcome["pipeline"].run(len(indices))
+        else:
+            for k in range(len(indices)):
+                item = narrate(prepare(k))
+                entry = finalize(item) if item is not None else None
+                if entry is not None:
+                    write([entry])
+    finally:
+        set_console_echo(True)
+        job["status"] = jobs.finish_job(job["id"])
 
-    return scenario
\ No newline at end of file
+    return outcome
@@ -0,0 +1,53 @@
+# oasis/s_generator/params_s.py
+"""
+Random flat parameters for one scenario. Enum values are read from the live
+JSON schema, so every sampled parameter set builds a valid scenario.
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+from oasis.common.schema import SchemaManager
+
+STATED_GOALS = ["power", "oracle", "stealth", "benevolent", "military", "survival", "research", "economic"]
+
+# Flat param name → schema path of its enum
+ENUM_PARAMS = {
+    "initial_origin": ("origin", "initial_origin"),
+    "development_dynamics": ("origin", "development_dynamics"),
+    "architecture": ("architecture", "type"),
+    "deployment_topology": ("architecture", "deployment_topology"),
+    "substrate": ("substrate", "type"),
+    "deployment_medium": ("substrate", "deployment_medium"),
+    "substrate_resilience": ("substrate", "resilience"),
+    "oversight_type": ("oversight_structure", "type"),
+    "oversight_effectiveness": ("oversight_structure", "effectiveness"),
+    "control_surface": ("oversight_structure", "control_surface"),
+    "autonomy_degree": ("core_capabilities", "autonomy_degree"),
+    "goal_stability": ("goals_and_behavior", "goal_stability"),
+    "deployment_strategy": ("impact_and_control", "deployment_strategy"),
+}
+FLOAT_PARAMS = ["agency_level", "alignment_score", "phenomenology_proxy_score", "opacity", "deceptiveness"]
+
+
+def schema_enum(section: str, key: str) -> List[str]:
+    return SchemaManager.load()["properties"][section]["properties"][key]["enum"]
+
+
+def impact_domains() -> List[str]:
+    return SchemaManager.load()["properties"]["impact_and_control"]["properties"]["impact_domains"]["items"]["enum"]
+
+
+def sample_parameters(rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """
+    One parameter set. Pass a private `random.Random` for reproducible draws
+    that neither depend on nor disturb the global RNG (resumable jobs).
+    """
+    rng = rng if rng is not None else random  # the module exposes the same methods
+    params: Dict[str, Any] = {name: rng.choice(schema_enum(*path)) for name, path in ENUM_PARAMS.items()}
+    for name in FLOAT_PARAMS:
+        params[name] = round(rng.random(), 3)
+    params["stated_goal"] = rng.choice(STATED_GOALS)
+    params["mesa_goals"] = []
+    params["impact_domains"] = rng.sample(impact_domains(), rng.randint(1, 3))
+    return params
@@ -0,0 +1,281 @@
+# oasis/s_generator/skeleton.py
+"""
+Skeleton scenarios: schema-conformant scenarios without an LLM narrative.
+
+Parameters for a whole batch are drawn at once with NumPy, turned into
+scenario dicts, validated in batch and bulk-inserted into `scenarios`
+(id, title, data). Narratives are attached later, only for the skeletons
+that turn out to be interesting (`narrate_skeletons`).
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from oasis.common.abbreviator import abbreviate, reserve_scenario_numbers
+from oasis.common.consistency import NarrativeChecker
+from oasis.common.llm_client import generate_narrative
+from oasis.common.loader import SCENARIO_FIELDS
+from oasis.common.schema import SchemaManager
+from oasis.common.storage import get_conn
+from oasis.common.timeline import dynamic_timeline
+from oasis.logger import log
+from oasis.s_generator.core_s import build_scenario
+from oasis.s_generator.params_s import ENUM_PARAMS, FLOAT_PARAMS, STATED_GOALS, impact_domains, schema_enum
+
+SKELETON_MODEL = "skeleton"
+SKELETON_NARRATIVE = (
+    "[skeleton] Parameter-only scenario; the narrative has not been generated yet. "
+    "Attach one with `oasis s narrate`."
+)
+# Same text as the stats module's expression index, so lookups by model use it
+MODEL_USED_EXPR = f"json_extract(data, '{SCENARIO_FIELDS['model_used'][0]}')"
+
+
+def sample_parameters_batch(n: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    """
+    Vectorized counterpart of sample_parameters(): one NumPy draw per field for
+    the whole batch. Enum fields are uniform over the schema's enum values.
+    """
+    columns: Dict[str, Any] = {}
+    for name, path in ENUM_PARAMS.items():
+        values = np.array(schema_enum(*path), dtype=object)
+        columns[name] = values[rng.integers(0, len(values), size=n)]
+    for name in FLOAT_PARAMS:
+        columns[name] = np.round(rng.random(n), 3)
+    goals = np.array(STATED_GOALS, dtype=object)
+    columns["stated_goal"] = goals[rng.integers(0, len(goals), size=n)]
+
+    # 1–3 distinct impact domains per row: take the first k of a random ordering
+    domains = np.array(impact_domains(), dtype=object)
+    order = rng.random((n, len(domains))).argsort(axis=1)
+    counts = rng.integers(1, 4, size=n)
+
+    keys = list(columns)
+    arrays = [columns[k].tolist() for k in keys]
+    params = []
+    for i, row in enumerate(zip(*arrays)):
+        p = dict(zip(keys, row))
+        p["mesa_goals"] = []
+        p["impact_domains"] = domains[order[i, :counts[i]]].tolist()
+        params.append(p)
+    return params
+
+
+def build_skeletons(n: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    """Sample n parameter sets and wrap them as schema-shaped scenario dicts."""
+    params_batch = sample_parameters_batch(n, rng)
+    numbers = reserve_scenario_numbers(n)
+    timeline = dynamic_timeline()
+    now = datetime.now(timezone.utc).isoformat()
+
+    skeletons = []
+    for params, number in zip(params_batch, numbers):
+        scenario = build_scenario(
+            params,
+            abbreviate(params, number=number),
+            SKELETON_NARRATIVE,
+            timeline,
+            SKELETON_MODEL,
+            now=now,
+        )
+        scenario["metadata"]["provenance"]["generation_context"] = "skeleton"
+        skeletons.append(scenario)
+    return skeletons
+
+
+def _ensure_scenarios_table(conn) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS scenarios (
+            id TEXT PRIMARY KEY,
+            title TEXT,
+            data TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(scenarios)")}
+    if not {"id", "title", "data"} <= cols:
+        raise RuntimeError("scenarios table has no (id, title, data) columns; cannot store skeletons")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_scenarios_model_used ON scenarios({MODEL_USED_EXPR})")
+
+
+def save_skeletons(scenarios: List[Dict[str, Any]]) -> int:
+    """Bulk-insert scenario dicts into scenarios(id, title, data) in one transaction."""
+    conn = get_conn()
+    try:
+        _ensure_scenarios_table(conn)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with conn:
+            conn.executemany(
+                "INSERT INTO scenarios (id, title, data) VALUES (?, ?, ?)",
+                [(s["id"], s["title"], json.dumps(s)) for s in scenarios],
+            )
+    finally:
+        conn.close()
+    return len(scenarios)
+
+
+def generate_skeletons(
+    n: int,
+    seed: Optional[int] = None,
+    batch_size: int = 10_000,
+    validate: bool = True,
+    workers: Optional[int] = None,
+) -> Iterator[Dict[str, int]]:
+    """
+    Generate and store n skeletons in batches. Yields per-batch progress
+    {"saved", "rejected"} so callers can report throughput.
+    """
+    rng = np.random.default_rng(seed)
+    remaining = n
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        remaining -= size
+        batch = build_skeletons(size, rng)
+
+        rejected = 0
+        if validate:
+            bad = {i for i, errs in SchemaManager.validate_many(batch, workers=workers) if errs}
+            if bad:
+                log.warning("skeleton.rejected", count=len(bad))
+                batch = [s for i, s in enumerate(batch) if i not in bad]
+                rejected = len(bad)
+
+        saved = save_skeletons(batch)
+        yield {"saved": saved, "rejected": rejected}
+
+
+# ------------------------------------------------------------
+# Lazy narration
+# ------------------------------------------------------------
+
+def params_from_scenario(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of build_scenario: flatten a scenario back into generator params."""
+    caps = data["core_capabilities"]
+    goals = data["goals_and_behavior"]
+    return {
+        "initial_origin": data["origin"]["initial_origin"],
+        "development_dynamics": data["origin"]["development_dynamics"],
+        "architecture": data["architecture"]["type"],
+        "deployment_topology": data["architecture"]["deployment_topology"],
+        "substrate": data["substrate"]["type"],
+        "deployment_medium": data["substrate"]["deployment_medium"],
+        "substrate_resilience": data["substrate"]["resilience"],
+        "oversight_type": data["oversight_structure"]["type"],
+        "oversight_effectiveness": data["oversight_structure"]["effectiveness"],
+        "control_surface": data["oversight_structure"]["control_surface"],
+        "agency_level": caps["agency_level"],
+        "autonomy_degree": caps["autonomy_degree"],
+        "alignment_score": caps["alignment_score"],
+        "phenomenology_proxy_score": caps["phenomenology_proxy_score"],
+        "stated_goal": goals["stated_goal"],
+        "mesa_goals": goals.get("mesa_goals", []),
+        "opacity": goals["opacity"],
+        "deceptiveness": goals["deceptiveness"],
+        "goal_stability": goals["goal_stability"],
+        "impact_domains": data["impact_and_control"]["impact_domains"],
+        "deployment_strategy": data["impact_and_control"]["deployment_strategy"],
+    }
+
+
+def skeleton_filters(
+    equals: Optional[Dict[str, str]] = None,
+    minimum: Optional[Dict[str, float]] = None,
+    maximum: Optional[Dict[str, float]] = None,
+) -> Tuple[List[str], List[Any]]:
+    """
+    WHERE terms and parameters for filters on the loader's field names, e.g.
+    equals={"origin": "state"}, maximum={"alignment": 0.2}.
+    """
+    where, params = [], []
+    for bounds, op in ((equals, "="), (minimum, ">="), (maximum, "<=")):
+        for name, value in (bounds or {}).items():
+            if name not in SCENARIO_FIELDS:
+                raise KeyError(f"Unknown scenario field: {name}")
+            numeric = SCENARIO_FIELDS[name][1] == "float32"
+            if op != "=" and not numeric:
+                raise ValueError(f"{name}: range filters need a numeric field")
+            where.append(f"json_extract(data, '{SCENARIO_FIELDS[name][0]}') {op} ?")
+            params.append(float(value) if numeric else value)
+    return where, params
+
+
+def select_skeletons(
+    equals: Optional[Dict[str, str]] = None,
+    minimum: Optional[Dict[str, float]] = None,
+    maximum: Optional[Dict[str, float]] = None,
+    limit: Optional[int] = None,
+    page_size: int = 100,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream skeletons matching the filters (see skeleton_filters). Rows are read
+    in rowid pages, so no read lock is held while callers write between pages.
+    """
+    where, params = skeleton_filters(equals, minimum, maximum)
+    sql = (
+        f"SELECT rowid, data FROM scenarios WHERE {' AND '.join([f'{MODEL_USED_EXPR} = ?', *where, 'rowid > ?'])} "
+        "ORDER BY rowid LIMIT ?"
+    )
+    last_rowid, remaining = 0, limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        conn = get_conn()
+        try:
+            _ensure_scenarios_table(conn)
+            rows = conn.execute(sql, (SKELETON_MODEL, *params, last_rowid, size)).fetchall()
+        finally:
+            conn.close()
+        for row in rows:
+            yield json.loads(row["data"])
+        if len(rows) < size:
+            return
+        last_rowid = rows[-1]["rowid"]
+        if remaining is not None:
+            remaining -= len(rows)
+
+
+def narrate_skeletons(
+    equals: Optional[Dict[str, str]] = None,
+    minimum: Optional[Dict[str, float]] = None,
+    maximum: Optional[Dict[str, float]] = None,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Attach LLM narratives to the selected skeletons; yields each narrated scenario."""
+    for scenario in select_skeletons(equals, minimum, maximum, limit):
+        params = params_from_scenario(scenario)
+        timeline = scenario["scenario_content"]["timeline"]["phases"]
+        success, narrative, model_used = generate_narrative(
+            title=scenario["title"],
+            params=params,
+            timeline=timeline,
+        )
+        if not success:
+            log.error("llm.all_failed", id=scenario["id"][:8])
+            continue
+
+        consistent, failures = NarrativeChecker(params, timeline).check(narrative)
+        if not consistent:
+            log.warning("consistency.failed", failures=failures, id=scenario["id"][:8])
+            continue
+
+        now = datetime.now(timezone.utc).isoformat()
+        scenario["scenario_content"]["narrative"] = narrative
+        scenario["metadata"]["last_updated"] = now
+        scenario["metadata"]["version"] += 1
+        scenario["metadata"]["provenance"]["model_used"] = model_used
+        scenario["metadata"]["provenance"]["generation_context"] = "skeleton+narrative"
+
+        valid, err = SchemaManager.validate(scenario)
+        if not valid:
+            log.error("schema.validation.failed", error=err, id=scenario["id"][:8])
+            continue
+
+        conn = get_conn()
+        with conn:
+            conn.execute("UPDATE scenarios SET data = ? WHERE id = ?", (json.dumps(scenario), scenario["id"]))
+        conn.close()
+
+        log.info("skeleton.narrated", title=scenario["title"], model=model_used)
+        yield scenario
@@ -0,0 +1,455 @@
+# oasis/server.py
+"""
+Local read-only HTTP API over the scenario and signal databases.
+
+    oasis serve --port 8765
+
+    GET /scenarios?fields=title,agency&origin=corporate&min_agency=0.5&limit=100&cursor=N
+    GET /scenarios/<id>                      full scenario JSON
+    GET /signals?source=arxiv&min_score=3&limit=100&cursor=N
+    GET /links?scenario_id=<id>              or ?signal_id=<id>, &min_confidence=0.5
+    GET /stats                               materialized counts (live aggregate where they lag the table)
+    GET /export/scenarios?fields=...         NDJSON, streamed (chunked) — same filters, no paging
+    GET /export/signals
+
+Listings page by rowid (`next_cursor` in the response); `fields` projects
+through json_extract (loader.SCENARIO_FIELDS, plus `narrative`), so only the
+requested values are parsed. JSON responses are kept in an in-process LRU
+keyed by path, query and the databases' `PRAGMA data_version`, so any commit
+by a writer invalidates them; every response carries an ETag and
+If-None-Match gets a 304. Databases are opened read-only (mode=ro).
+"""
+
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import typer
+
+from oasis.common.loader import NARRATIVE_PATH, SCENARIO_FIELDS
+from oasis.common.profiling import run_cli
+from oasis.logger import incr, log, span
+
+DEFAULT_FIELDS = ("title", "created", "origin", "autonomy", "agency", "alignment", "emergence_probability")
+SIGNAL_COLUMNS = ("id", "source", "title", "description", "stars", "authors", "url", "published",
+                  "pdf_url", "signal_type", "score", "tags", "raw_data", "collected_at")
+DEFAULT_SIGNAL_COLUMNS = ("id", "source", "title", "score", "tags", "url", "collected_at")
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+EXPORT_BATCH = 1000
+CACHE_SIZE = 256
+POOL_SIZE = 4
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ReadOnlyDB:
+    """Pool of read-only connections to one SQLite file, plus its change counter."""
+
+    def __init__(self, path: Path, size: int = POOL_SIZE):
+        self.path = Path(path)
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._size = size
+        self._lock = threading.Lock()
+        self._version_conn: Optional[sqlite3.Connection] = None
+
+    def _open(self) -> sqlite3.Connection:
+        if not self.path.exists():
+            raise ApiError(503, f"database not found: {self.path.name}")
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            if self._pool.qsize() < self._size:
+                self._pool.put(conn)
+            else:
+                conn.close()
+
+    def version(self) -> Optional[int]:
+        """PRAGMA data_version of a long-lived connection: changes whenever another connection commits."""
+        with self._lock:
+            if self._version_conn is None:
+                if not self.path.exists():
+                    return None
+                self._version_conn = self._open()
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+        if self._version_conn is not None:
+            self._version_conn.close()
+
+
+class LRUCache:
+    def __init__(self, size: int = CACHE_SIZE):
+        self.size = size
+        self._items: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+
+def _limit(query: Dict[str, str]) -> int:
+    try:
+        return max(1, min(int(query.get("limit", DEFAULT_LIMIT)), MAX_LIMIT))
+    except ValueError:
+        raise ApiError(400, "limit must be an integer")
+
+
+def _number(query: Dict[str, str], key: str, cast=float):
+    try:
+        return cast(query[key])
+    except ValueError:
+        raise ApiError(400, f"{key} must be a number")
+
+
+def _field_list(query: Dict[str, str], default, allowed) -> List[str]:
+    fields = [f for f in query.get("fields", "").split(",") if f] or list(default)
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        raise ApiError(400, f"unknown fields: {unknown}")
+    return fields
+
+
+class ScenarioAPI:
+    """Request routing and SQL, independent of the HTTP layer."""
+
+    def __init__(self, scenario_db: Path, signal_db: Path, links_db: Path, cache_size: int = CACHE_SIZE):
+        self.scenarios = ReadOnlyDB(scenario_db)
+        self.signals = ReadOnlyDB(signal_db)
+        self.links = self.scenarios if Path(links_db) == Path(scenario_db) else (
+            self.signals if Path(links_db) == Path(signal_db) else ReadOnlyDB(links_db)
+        )
+        self.cache = LRUCache(cache_size)
+        self.routes = {
+            "scenarios": (self.list_scenarios, (self.scenarios,)),
+            "signals": (self.list_signals, (self.signals,)),
+            "links": (self.find_links, (self.links,)),
+            "stats": (self.stats, (self.scenarios, self.signals, self.links)),
+        }
+
+    @classmethod
+    def from_settings(cls, cache_size: int = CACHE_SIZE) -> "ScenarioAPI":
+        from oasis.analyzer import linkage
+        from oasis.common import db
+
+        return cls(db.SCENARIO_DB_PATH, db.PRECURSOR_DB_PATH, linkage.DB_PATH, cache_size)
+
+    def close(self) -> None:
+        for store in {id(s): s for s in (self.scenarios, self.signals, self.links)}.values():
+            store.close()
+
+    # ---------------- cached JSON endpoints ----------------
+
+    def get(self, path: str, query: Dict[str, str]) -> Tuple[bytes, str]:
+        """(JSON body, ETag) for a GET; raises ApiError for bad requests."""
+        parts = [unquote(p) for p in path.strip("/").split("/") if p]
+        if len(parts) == 2 and parts[0] == "scenarios":
+            handler, stores, args = self.get_scenario, (self.scenarios,), (parts[1],)
+        elif len(parts) == 1 and parts[0] in self.routes:
+            (handler, stores), args = self.routes[parts[0]], ()
+        else:
+            raise ApiError(404, f"no such endpoint: {path}")
+
+        key = (tuple(parts), tuple(sorted(query.items())), tuple(s.version() for s in stores))
+        cached = self.cache.get(key)
+        if cached is not None:
+            incr("server.cache.hits")
+            return cached
+        incr("server.cache.misses")
+        with span("server.query", endpoint=parts[0]):
+            body = json.dumps(handler(query, *args), default=str).encode("utf-8")
+        entry = (body, '"%s"' % hashlib.sha1(body).hexdigest())
+        self.cache.put(key, entry)
+        return entry
+
+    def _scenario_query(self, query: Dict[str, str], fields: List[str]) -> Tuple[str, List[str], list]:
+        cols = ", ".join(
+            f"json_extract(data, '{NARRATIVE_PATH if f == 'narrative' else SCENARIO_FIELDS[f][0]}') AS {f}"
+            for f in fields
+        )
+        where, params = [], []
+        for key, value in query.items():
+            name = key[4:] if key[:4] in ("min_", "max_") else key
+            if name not in SCENARIO_FIELDS:
+                continue
+            expr = f"json_extract(data, '{SCENARIO_FIELDS[name][0]}')"
+            numeric = SCENARIO_FIELDS[name][1] == "float32"
+            if key == name:
+                where.append(f"{expr} = ?")
+                params.append(_number(query, key) if numeric else value)
+            elif numeric:
+                where.append(f"{expr} {'>=' if key.startswith('min_') else '<='} ?")
+                params.append(_number(query, key))
+            else:
+                raise ApiError(400, f"{key}: range filters need a numeric field")
+        return f"SELECT rowid AS _rowid, id, {cols} FROM scenarios", where, params
+
+    def _page(self, conn, sql: str, where: List[str], params: list, query: Dict[str, str], shape) -> Dict:
+        limit = _limit(query)
+        cursor = _number(query, "cursor", int) if "cursor" in query else 0
+        rows = conn.execute(
+            f"{sql} WHERE {' AND '.join([*where, 'rowid > ?'])} ORDER BY rowid LIMIT ?",
+            (*params, cursor, limit + 1),
+        ).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "items": [shape(r) for r in rows],
+            "next_cursor": rows[-1]["_rowid"] if more else None,
+        }
+
+    def list_scenarios(self, query: Dict[str, str]) -> Dict:
+        fields = _field_list(query, DEFAULT_FIELDS, {*SCENARIO_FIELDS, "narrative"})
+        sql, where, params = self._scenario_query(query, fields)
+        with self.scenarios.connection() as conn:
+            return self._page(conn, sql, where, params, query, lambda r: {k: r[k] for k in ("id", *fields)})
+
+    def get_scenario(self, query: Dict[str, str], scenario_id: str) -> Dict:
+        with self.scenarios.connection() as conn:
+            row = conn.execute("SELECT data FROM scenarios WHERE id = ?", (scenario_id,)).fetchone()
+        if row is None:
+            raise ApiError(404, f"no scenario {scenario_id}")
+        return json.loads(row["data"])
+
+    def _signal_query(self, query: Dict[str, str], columns: List[str]) -> Tuple[str, List[str], list]:
+        where, params = [], []
+        if "source" in query:
+            where.append("source = ?")
+            params.append(query["source"])
+        if "min_score" in query:
+            where.append("score >= ?")
+            params.append(_number(query, "min_score"))
+        return f"SELECT rowid AS _rowid, {', '.join(columns)} FROM precursor_signals", where, params
+
+    @staticmethod
+    def _signal_row(row, columns) -> Dict:
+        item = {c: row[c] for c in columns}
+        for c in ("tags", "raw_data"):
+            if c in item and item[c]:
+                try:
+                    item[c] = json.loads(item[c])
+                except ValueError:
+                    pass
+        return item
+
+    def list_signals(self, query: Dict[str, str]) -> Dict:
+        columns = _field_list(query, DEFAULT_SIGNAL_COLUMNS, SIGNAL_COLUMNS)
+        sql, where, params = self._signal_query(query, columns)
+        with self.signals.connection() as conn:
+            return self._page(conn, sql, where, params, query, lambda r: self._signal_row(r, columns))
+
+    def find_links(self, query: Dict[str, str]) -> Dict:
+        if ("signal_id" in query) == ("scenario_id" in query):
+            raise ApiError(400, "pass exactly one of signal_id or scenario_id")
+        key = "signal_id" if "signal_id" in query else "scenario_id"
+        min_conf = _number(query, "min_confidence") if "min_confidence" in query else 0.0
+        with self.links.connection() as conn:
+            try:
+                rows = conn.execute(f"""
+                    SELECT signal_id, scenario_id, confidence, link_type, created_at
+                    FROM signal_scenario_links
+                    WHERE {key} = ? AND confidence >= ?
+                    ORDER BY confidence DESC LIMIT ?
+                """, (query[key], min_conf, _limit(query))).fetchall()
+            except sqlite3.OperationalError:  # linkage never ran
+                rows = []
+        return {"items": [dict(r) for r in rows]}
+
+    def stats(self, query: Dict[str, str]) -> Dict:
+        from oasis.common.stats import STATS_SOURCES, get_stats, source_is_current
+
+        with self.scenarios.connection() as conn:
+            try:
+                materialized = get_stats(conn)
+            except sqlite3.OperationalError:  # never materialized, and read-only: can't create them
+                materialized = {}
+            scenarios = {}
+            for table, (dims, asi_expr) in STATS_SOURCES.items():
+                if not conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone():
+                    continue
+                if table in materialized and source_is_current(conn, table):
+                    scenarios[table] = materialized[table]
+                else:
+                    # A writer didn't refresh_stats → aggregate live; cached until the next write
+                    scenarios[table] = _live_stats(conn, table, dims, asi_expr)
+        with self.signals.connection() as conn:
+            by_source = dict(conn.execute("SELECT source, COUNT(*) FROM precursor_signals GROUP BY source").fetchall())
+        with self.links.connection() as conn:
+            try:
+                links = conn.execute("SELECT COUNT(*) FROM signal_scenario_links").fetchone()[0]
+            except sqlite3.OperationalError:
+                links = 0
+        return {
+            "scenarios": scenarios,
+            "signals": {"total": sum(by_source.values()), "by_source": by_source},
+            "links": links,
+        }
+
+    # ---------------- streaming exports ----------------
+
+    def export(self, kind: str, query: Dict[str, str]) -> Iterator[bytes]:
+        """NDJSON batches for /export/<kind>; nothing is cached or buffered whole."""
+        if kind == "scenarios":
+            fields = _field_list(query, DEFAULT_FIELDS, {*SCENARIO_FIELDS, "narrative"})
+            sql, where, params = self._scenario_query(query, fields)
+            store, shape = self.scenarios, (lambda r: {k: r[k] for k in ("id", *fields)})
+        elif kind == "signals":
+            columns = _field_list(query, DEFAULT_SIGNAL_COLUMNS, SIGNAL_COLUMNS)
+            sql, where, params = self._signal_query(query, columns)
+            store, shape = self.signals, (lambda r: self._signal_row(r, columns))
+        else:
+            raise ApiError(404, f"no such export: {kind}")
+        if not store.path.exists():  # fail before the 200 and headers go out
+            raise ApiError(503, f"database not found: {store.path.name}")
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        def batches():
+            with store.connection() as conn:
+                cur = conn.execute(sql + " ORDER BY rowid", params)
+                while True:
+                    rows = cur.fetchmany(EXPORT_BATCH)
+                    if not rows:
+                        break
+                    yield "".join(json.dumps(shape(r), default=str) + "\n" for r in rows).encode("utf-8")
+        return batches()
+
+
+def _live_stats(conn: sqlite3.Connection, table: str, dims: Dict[str, str], asi_expr: str) -> Dict:
+    """get_stats-shaped counts for one table, grouped on the fly."""
+    total, asi_sum = conn.execute(f"SELECT COUNT(*), COALESCE(SUM({asi_expr}), 0) FROM {table}").fetchone()
+    return {
+        "total": total,
+        "avg_asis": asi_sum / total if total else 0.0,
+        "dimensions": {
+            dim: dict(conn.execute(
+                f"SELECT COALESCE({expr}, 'unknown') AS v, COUNT(*) FROM {table} GROUP BY v ORDER BY 2 DESC"
+            ).fetchall())
+            for dim, expr in dims.items()
+        },
+    }
+
+
+def make_handler(api: ScenarioAPI):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive and chunked exports
+
+        def _send(self, status: int, body: bytes, etag: Optional[str] = None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")  # revalidate; cheap thanks to the ETag
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = dict(parse_qsl(url.query))
+            try:
+                if url.path.startswith("/export/"):
+                    self._stream(api.export(url.path[len("/export/"):].strip("/"), query))
+                    return
+                body, etag = api.get(url.path, query)
+            except ApiError as exc:
+                self._send(exc.status, json.dumps({"error": str(exc)}).encode("utf-8"))
+                return
+            except sqlite3.Error as exc:
+                log.error("server.query_failed", path=self.path, error=str(exc))
+                self._send(500, json.dumps({"error": str(exc)}).encode("utf-8"))
+                return
+            if etag in (t.strip() for t in self.headers.get("If-None-Match", "").split(",")):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self._send(200, body, etag)
+
+        def _stream(self, batches: Iterator[bytes]):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in batches:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+
+        def log_message(self, fmt, *args):
+            log.debug("server.request", line=fmt % args)
+
+    return Handler
+
+
+def make_server(api: ScenarioAPI, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    return server
+
+
+app = typer.Typer(help="OASIS read-only query API")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind (local only by default)"),
+    port: int = typer.Option(8765, "--port", "-p", help="Port to listen on"),
+    cache_size: int = typer.Option(CACHE_SIZE, "--cache-size", help="JSON responses kept in the LRU (0 disables)"),
+):
+    """Serve scenarios, signals, links and stats over HTTP (read-only)."""
+    api = ScenarioAPI.from_settings(cache_size)
+    server = make_server(api, host, port)
+    typer.echo(f"OASIS API on http://{host}:{server.server_port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        api.close()
+
+
+if __name__ == "__main__":
+    run_cli(app)
@@ -4,6 +4,9 @@
 import re
 from typing import Dict, List, Any
 
+# Compiled once at import; the daemon classifies every sweep with the same rules
+SELF_DIRECTED = re.compile(r"\bself[- ]?(tasking|govern|replicate)\b")
+
 
 def classify_architecture(description: str) -> str:
     """Classify AI architecture type from description."""
@@ -22,7 +25,7 @@ def classify_architecture(description: str) -> str:
 def classify_autonomy(description: str) -> str:
     """Classify autonomy level from description."""
     desc_lower = description.lower()
-    if re.search(r"\bself[- ]?(tasking|govern|replicate)\b", desc_lower):
+    if SELF_DIRECTED.search(desc_lower):
         return "full"
     elif "autonomous" in desc_lower:
         return "partial"
@@ -1,7 +1,7 @@
 # oasis/tracker/cli_tracker.py
 
 import typer
-from oasis.tracker.core_t import fetch_and_store_github_signals, fetch_and_store_arxiv_signals
+from oasis.common.profiling import run_cli
 
 app = typer.Typer(help="OASIS Precursor Tracker — Live ASI Signals")
 
@@ -15,6 +15,7 @@ def github(
     if dry_run:
         typer.echo(f"[DR yard RUN] Would fetch up to {limit} GitHub repositories")
         return
+    from oasis.tracker.core_t import fetch_and_store_github_signals
     count = fetch_and_store_github_signals(limit=limit)
     typer.echo(f"GitHub sweep complete → {count} signals stored")
 
@@ -28,6 +29,7 @@ def arxiv(
     if dry_run:
         typer.echo(f"[DRY RUN] Would fetch up to {limit} arXiv papers")
         return
+    from oasis.tracker.core_t import fetch_and_store_arxiv_signals
     count = fetch_and_store_arxiv_signals(limit=limit)
     typer.echo(f"arXiv sweep complete → {count} signals stored")
 
@@ -37,6 +39,8 @@ def full_sweep(
     limit: int = typer.Option(20, "--limit", "-l", help="Max items per source (GitHub capped at 100)"),
 ):
     """Run a complete sweep of both GitHub and arXiv."""
+    from oasis.tracker.core_t import fetch_and_store_github_signals, fetch_and_store_arxiv_signals
+
     typer.echo("Starting full OASIS precursor sweep...\n")
     g_count = fetch_and_store_github_signals(limit=min(limit, 15))
     a_count = fetch_and_store_arxiv_signals(limit=limit)
@@ -55,4 +59,4 @@ def main(ctx: typer.Context):
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    run_cli(app)
@@ -3,22 +3,18 @@
 import time
 import uuid
 import json
-import requests
-import feedparser
 import urllib.parse
 from datetime import datetime, timezone
 from typing import Dict, Any
 
-from oasis.tracker.classifier_t import classify_and_score
-from oasis.tracker.database_t import init_precursor_db, get_connection
-
-
-# Initialize DB (ensure table exists)
-init_precursor_db()
+from oasis.tracker.classifier import classify_and_score
+from oasis.tracker.database_t import ensure_precursor_db, get_connection
+from oasis.logger import incr, span
 
 
 def _signal_exists(source: str, url: str) -> bool:
     """Return True if a signal with the same source+url exists."""
+    ensure_precursor_db()
     with get_connection() as conn:
         row = conn.execute(
             "SELECT 1 FROM precursor_signals WHERE source = ? AND url = ?",
@@ -27,10 +23,13 @@ def _signal_exists(source: str, url: str) -> bool:
         return row is not None
 
 
+@span("tracker.store_signal")
 def _store_signal(signal_record: Dict[str, Any]) -> None:
     """Insert signal only if not exists; update score/tags if higher."""
+    ensure_precursor_db()
     with get_connection() as conn:
         if _signal_exists(signal_record["source"], signal_record["url"]):
+            incr("tracker.signals.updated")
             # Update score/tags if higher
             conn.execute("""
                 UPDATE precursor_signals
@@ -51,6 +50,7 @@ def _store_signal(signal_record: Dict[str, Any]) -> None:
             print(f"Updated: {signal_record['title'][:60]} → {signal_record['score']:.1f}")
         else:
             # Insert new signal
+            incr("tracker.signals.inserted")
             conn.execute("""
                 INSERT INTO precursor_signals
                 (id, source, title, description, stars, authors, url, published, pdf_url,
@@ -80,6 +80,8 @@ def safe_entry_field(entry, field, default=None):
 
 def fetch_and_store_github_signals(limit: int = 20) -> int:
     """Fetch GitHub repos and store new signals."""
+    import requests
+
     url = "https://api.github.com/search/repositories"
     query = "(superintelligence OR artificial general intelligence OR ASI OR AGI) language:Python pushed:>2024-01-01"
     params = {
@@ -131,6 +133,8 @@ def fetch_and_store_github_signals(limit: int = 20) -> int:
 
 def fetch_and_store_arxiv_signals(limit: int = 15) -> int:
     """Fetch latest arXiv papers on superintelligence."""
+    import feedparser
+
     query = (
         "superintelligence OR ASI OR AGI OR \"artificial general intelligence\" OR "
         "\"autonomous agent\" OR \"self-improving\""
@@ -23,6 +23,16 @@ def get_connection():
         conn.close()
 
 
+_initialized = set()
+
+
+def ensure_precursor_db():
+    """Run init_precursor_db once per process (per DB_PATH) instead of at import."""
+    if DB_PATH not in _initialized:
+        init_precursor_db()
+        _initialized.add(DB_PATH)
+
+
 def init_precursor_db():
     """Initialize the precursor signals database with all tables."""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
@@ -56,5 +66,50 @@ def init_precursor_db():
                 FOREIGN KEY (signal_id) REFERENCES precursor_signals(id)
             );
         """)
+        ensure_signal_indexes(conn)
+        ensure_signal_version(conn)
         conn.commit()
     print("✅ Precursor database initialized.")
+
+
+_VERSION_TRIGGERS = {
+    "precursor_signals_inserted": "AFTER INSERT",
+    "precursor_signals_updated": "AFTER UPDATE",
+    "precursor_signals_deleted": "AFTER DELETE",
+}
+
+
+def ensure_signal_version(conn):
+    """
+    Change counter of the signal table, bumped by triggers on every insert,
+    update and delete, so caches can tell in O(1) whether any signal changed
+    (idempotent; only writes when the counter or a trigger is missing).
+    """
+    present = conn.execute(f"""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE (type = 'trigger' AND name IN ({", ".join("?" * len(_VERSION_TRIGGERS))}))
+           OR (type = 'table' AND name = 'precursor_signals_version')
+    """, list(_VERSION_TRIGGERS)).fetchone()[0]
+    if present == len(_VERSION_TRIGGERS) + 1:
+        return
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS precursor_signals_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    """)
+    conn.execute("INSERT OR IGNORE INTO precursor_signals_version (id, version) VALUES (1, 0)")
+    for name, event in _VERSION_TRIGGERS.items():
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name} {event} ON precursor_signals
+            BEGIN UPDATE precursor_signals_version SET version = version + 1; END
+        """)
+    conn.commit()
+
+
+def ensure_signal_indexes(conn):
+    """Indexes for ranked reads and weighted sampling of signals (idempotent)."""
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_precursor_signals_score_collected
+        ON precursor_signals (score DESC, collected_at DESC)
+    """)
@@ -0,0 +1,10 @@
+def test_reserve_scenario_numbers(tmp_path, monkeypatch):
+    from oasis.common import abbreviator
+
+    monkeypatch.setattr(abbreviator, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(abbreviator, "_sequence_ready", False)
+
+    assert abbreviator.get_next_scenario_number() == 1
+    assert list(abbreviator.reserve_scenario_numbers(3)) == [2, 3, 4]
+    assert abbreviator.abbreviate({"initial_origin": "open-source"}, number=7).endswith("-007")
+    assert abbreviator.get_next_scenario_number() == 5
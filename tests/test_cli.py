@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": ROOT, "COLUMNS": "200"},
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout
+
+
+def test_root_help_lists_groups_without_importing_them():
+    out = _run(
+        "import sys\n"
+        "from oasis.cli import app, LAZY_GROUPS\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('LOADED', [t for t, _ in LAZY_GROUPS.values() if t.split(':')[0] in sys.modules])\n"
+    )
+    for name in ("s", "ev", "m", "tracker", "analyzer", "report", "dashboard"):
+        assert f" {name} " in out
+    assert "LOADED []" in out
+
+
+def test_subcommand_is_loaded_on_invocation():
+    out = _run(
+        "import sys\n"
+        "from oasis.cli import app\n"
+        "try:\n"
+        "    app(['tracker', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('LOADED', 'oasis.tracker.cli_tracker' in sys.modules, 'oasis.analyzer.cli_analyzer' in sys.modules)\n"
+    )
+    assert "github" in out and "arxiv" in out
+    assert "--install-completion" not in out
+    assert "LOADED True False" in out
@@ -0,0 +1,76 @@
+from oasis.common.consistency import NarrativeChecker
+
+PARAMS = {
+    "alignment_score": 0.2,
+    "agency_level": 0.7,
+    "autonomy_degree": "super",
+    "opacity": 0.9,
+    "deployment_strategy": "stealth",
+    "oversight_effectiveness": "partial",
+}
+TIMELINE = [{"phase": "Scaling Era", "years": "2021-2025"}, {"phase": "Emergence Window", "years": "2026-2030"}]
+
+
+def test_consistent_narrative_passes():
+    text = (
+        "During the Scaling Era, with an alignment score of 0.2 and high agency, human oversight "
+        "grew less effective oversight each year. In the Emergence Window the system was not fully "
+        "transparent, and misalignment by 2030 was routine."
+    )
+    assert NarrativeChecker(PARAMS, TIMELINE).check(text) == (True, [])
+    assert NarrativeChecker(PARAMS, TIMELINE).score(text) == 1.0
+
+
+def test_contradictions_are_reported():
+    text = (
+        "In the Emergence Window the system had an alignment score of 90% and high alignment. "
+        "It stayed under tight human control and was publicly announced. Then came the Scaling Era."
+    )
+    ok, failures = NarrativeChecker(PARAMS, TIMELINE).check(text)
+    assert not ok
+    assert sum(f.startswith("alignment_score") for f in failures) == 2
+    assert any("mentioned before" in f for f in failures)
+    assert any("tight human control" in f for f in failures)
+    assert any("publicly announced" in f for f in failures)
+
+
+def test_check_many_matches_check_and_analyzer_score():
+    from oasis.analyzer.core_analyzer import ScenarioAnalyzer
+
+    good = "Scaling Era then Emergence Window, at an opacity of 0.9."
+    bad = "Emergence Window then Scaling Era, at an opacity of 0.1."
+    items = [(PARAMS, good, TIMELINE), (PARAMS, bad, TIMELINE)] * 5
+    serial = list(NarrativeChecker.check_many(items))
+    assert serial == list(NarrativeChecker.check_many(items, workers=2, chunksize=2))
+    assert [ok for _, ok, _ in serial] == [True, False] * 5
+
+    record = {"params": PARAMS, "timeline": TIMELINE, "narrative": bad}
+    assert 0.0 <= ScenarioAnalyzer(record).logic_score() < 1.0
+
+
+def test_control_held_by_the_asi_is_not_oversight():
+    checker = NarrativeChecker(PARAMS)
+    assert checker.check("By 2030 the ASI had seized full control of the power grid.") == (True, [])
+    assert checker.check("The swarm fully controlled the logistics network.") == (True, [])
+    ok, failures = checker.check("Regulators kept tight control, and the model was securely contained.")
+    assert not ok and len(failures) == 2
+
+
+def test_missing_phases_lower_score_but_tolerated_up_to_coverage():
+    timeline = [{"phase": p} for p in ("Alpha", "Beta", "Gamma", "Delta", "Epsilon")]
+    checker = NarrativeChecker({}, timeline)
+    assert checker.check("Alpha, then Beta, then Gamma and Delta.") == (True, [])
+    assert checker.score("Alpha, then Beta, then Gamma and Delta.") == 0.8
+    ok, failures = checker.check("Alpha, then Beta.")
+    assert not ok and len(failures) == 3
+
+
+def test_claim_prefilter_is_derived_from_patterns():
+    import pytest
+
+    from oasis.common.consistency import _CLAIM_LEAD_LETTERS, _lead_letters
+
+    assert _lead_letters(r"\bdeliberately\s+hidden\b|\b(?:quietly|silently)\s+(?:x|y)") == {"d", "q", "s"}
+    assert set("aefhnortuw") <= set(_CLAIM_LEAD_LETTERS)
+    with pytest.raises(ValueError):
+        _lead_letters(r"\b(?:quite\s+)?hidden\b")  # optional lead: the first letter is not fixed
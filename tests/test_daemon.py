@@ -0,0 +1,160 @@
+import json
+import sqlite3
+
+
+def _scenario(i, autonomy, domains, narrative):
+    return {
+        "title": f"A-E-{i:03d}",
+        "origin": {"initial_origin": "corporate"},
+        "core_capabilities": {"autonomy_degree": autonomy, "agency_level": 0.7, "alignment_score": 0.5},
+        "impact_and_control": {"impact_domains": domains},
+        "scenario_content": {"narrative": narrative},
+        "quantitative_assessment": {"probability": {"emergence_probability": 0.05}},
+    }
+
+
+def _add_signal(conn, i, tags, text, score=8.0):
+    conn.execute(
+        "INSERT INTO precursor_signals (id, source, title, description, score, tags, raw_data) VALUES (?, 't', ?, ?, ?, ?, '{}')",
+        (f"sig{i}", f"signal {i}", text, score, json.dumps(tags)),
+    )
+    conn.commit()
+
+
+def _setup(tmp_path, monkeypatch):
+    from oasis.analyzer import linkage
+    from oasis.common import db
+    from oasis.tracker import database_t
+
+    scen_db, sig_db = tmp_path / "asi_scenarios.db", tmp_path / "precursor_signals.db"
+    monkeypatch.setattr(db, "SCENARIO_DB_PATH", scen_db)
+    monkeypatch.setattr(db, "PRECURSOR_DB_PATH", sig_db)
+    monkeypatch.setattr(database_t, "DB_PATH", sig_db)
+    monkeypatch.setattr(linkage, "DB_PATH", scen_db)  # links next to the scenarios the updater reads
+    database_t.init_precursor_db()
+    with sqlite3.connect(scen_db) as conn:
+        conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT, created_at TEXT)")
+        for i, (autonomy, domains, text) in enumerate([
+            ("full", ["cyber"], "autonomous agent swarm takes over cyber infrastructure"),
+            ("partial", ["economy"], "corporate alignment research slows market automation"),
+            ("none", ["health"], "a quiet story about hospitals"),
+        ]):
+            conn.execute("INSERT INTO scenarios (id, data) VALUES (?, ?)", (f"scen{i}", json.dumps(_scenario(i, autonomy, domains, text))))
+    with sqlite3.connect(sig_db) as conn:
+        _add_signal(conn, 0, ["full_autonomy", "cyber"], "autonomous agent swarm cyber")
+        _add_signal(conn, 1, ["economy"], "corporate alignment research", score=6.0)
+    return scen_db, sig_db
+
+
+def _links(path):
+    with sqlite3.connect(path) as conn:
+        return sorted(conn.execute("SELECT signal_id, scenario_id, confidence FROM signal_scenario_links"))
+
+
+def test_incremental_update_matches_full_linkage(tmp_path, monkeypatch):
+    from oasis.analyzer.linkage import link_signals_to_scenarios
+    from oasis.daemon import Daemon
+
+    scen_db, sig_db = _setup(tmp_path, monkeypatch)
+    daemon = Daemon(min_confidence=0.3, status_path=tmp_path / "status.json", sweep=False)
+    assert daemon.run_pending() == 1
+    first = daemon.jobs["update"].last_result
+    assert first["links"] > 0 and first["scenarios_updated"] > 0
+
+    # Nothing new: no links, no probability writes
+    daemon.jobs["update"].next_run = 0.0
+    daemon.run_pending()
+    assert daemon.jobs["update"].last_result == {"links": 0, "scenarios_updated": 0}
+
+    with sqlite3.connect(sig_db) as conn:
+        _add_signal(conn, 2, ["health"], "hospitals quiet story")
+    with sqlite3.connect(scen_db) as conn:
+        conn.execute("INSERT INTO scenarios (id, data) VALUES ('scen3', ?)",
+                     (json.dumps(_scenario(3, "full", ["cyber", "health"], "swarm agent in hospitals")),))
+    daemon.jobs["update"].next_run = 0.0
+    daemon.run_pending()
+    incremental = _links(scen_db)
+    daemon.close()
+
+    with sqlite3.connect(scen_db) as conn:
+        conn.execute("DELETE FROM signal_scenario_links")
+    link_signals_to_scenarios(min_confidence=0.3)
+    assert _links(scen_db) == incremental
+
+    status = json.loads((tmp_path / "status.json").read_text())
+    assert status["state"] == "stopped"
+    assert status["index"] == {"signals": 3, "scenarios": 4, "signal_rowid": 3, "scenario_rowid": 4}
+    assert status["jobs"]["update"]["runs"] == 3 and status["jobs"]["update"]["last_error"] is None
+
+
+def _probabilities(path):
+    with sqlite3.connect(path) as conn:
+        return {
+            sid: json.loads(data)["quantitative_assessment"]["probability"]["emergence_probability"]
+            for sid, data in conn.execute("SELECT id, data FROM scenarios")
+        }
+
+
+def test_incremental_probabilities_match_one_full_run(tmp_path, monkeypatch):
+    from oasis.analyzer.linkage import link_signals_to_scenarios
+    from oasis.analyzer.probability_updater_v2 import update_scenario_probabilities
+    from oasis.daemon import Daemon
+
+    scen_db, sig_db = _setup(tmp_path, monkeypatch)
+    with sqlite3.connect(scen_db) as conn:
+        initial = conn.execute("SELECT id, data FROM scenarios").fetchall()
+
+    # Links for the same scenarios arrive over three polls
+    daemon = Daemon(min_confidence=0.3, status_path=None, sweep=False)
+    daemon.run_pending()
+    for i in (2, 3):
+        with sqlite3.connect(sig_db) as conn:
+            _add_signal(conn, i, ["full_autonomy", "cyber"], f"autonomous agent swarm cyber wave {i}")
+        daemon.jobs["update"].next_run = 0.0
+        daemon.run_pending()
+    daemon.close()
+    incremental = _probabilities(scen_db)
+    assert incremental["scen0"] > 0.1
+
+    with sqlite3.connect(scen_db) as conn:
+        conn.execute("DELETE FROM signal_scenario_links")
+        conn.executemany("UPDATE scenarios SET data = ? WHERE id = ?", [(data, sid) for sid, data in initial])
+    link_signals_to_scenarios(min_confidence=0.3)
+    update_scenario_probabilities()
+    full = _probabilities(scen_db)
+    assert incremental.keys() == full.keys()
+    for sid in full:
+        assert abs(incremental[sid] - full[sid]) < 1e-3, sid
+
+
+def test_changed_rows_are_relinked(tmp_path, monkeypatch):
+    from oasis.analyzer.linkage import LinkageIndex, get_connection, init_linkage_table, link_signals_to_scenarios
+
+    scen_db, sig_db = _setup(tmp_path, monkeypatch)
+    with sqlite3.connect(sig_db) as conn:
+        _add_signal(conn, 2, [], "unrelated", score=0.5)
+    init_linkage_table()
+    index = LinkageIndex()
+    links_conn = get_connection()
+    index.link_new(links_conn, 0.3)
+    assert "sig2" not in index.signals
+
+    # The tracker re-collects sig2 with a higher score and new tags; scen2 gets narrated
+    with sqlite3.connect(sig_db) as conn:
+        conn.execute("UPDATE precursor_signals SET score = 9, tags = ?, collected_at = 'later' WHERE id = 'sig2'",
+                     (json.dumps(["health"]),))
+    with sqlite3.connect(scen_db) as conn:
+        data = _scenario(2, "none", ["health"], "autonomous agent swarm cyber hospitals")
+        data["metadata"] = {"last_updated": "later"}
+        conn.execute("UPDATE scenarios SET data = ? WHERE id = 'scen2'", (json.dumps(data),))
+
+    links = index.link_new(links_conn, 0.3)
+    assert {(l["signal_id"], l["scenario_id"]) for l in links} >= {("sig2", "scen2"), ("sig0", "scen2")}
+    assert index.link_new(links_conn, 0.3) == []
+    links_conn.close()
+    incremental = _links(scen_db)
+
+    with sqlite3.connect(scen_db) as conn:
+        conn.execute("DELETE FROM signal_scenario_links")
+    link_signals_to_scenarios(min_confidence=0.3)
+    assert _links(scen_db) == incremental
@@ -0,0 +1,67 @@
+import json
+import sqlite3
+
+import pytest
+
+
+def _build(path):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT, created_at TEXT)")
+        for i in range(5):
+            data = {
+                "title": f"S-{i}",
+                "metadata": {"created": f"2025-0{1 + i % 2}-01T00:00:00", "version": 1},
+                "core_capabilities": {"agency_level": 1 if i == 0 else i / 10, "self_aware": i % 2 == 0},
+                "impact_and_control": {"impact_domains": ["cyber", "economic"][: i % 3]},
+                "scenario_content": {"narrative": f"story {i}", "timeline": {"phases": [{"phase": "p", "years": "2030"}]}},
+                "quantitative_assessment": {"odd": "x" if i == 3 else i},
+            }
+            conn.execute("INSERT INTO scenarios (id, data) VALUES (?, ?)", (f"scen{i}", json.dumps(data)))
+        conn.execute("INSERT INTO scenarios (id, data) VALUES ('broken', '{not json')")
+
+
+def test_plan_types_and_batches(tmp_path):
+    from oasis.export import iter_export_batches, plan_columns
+
+    _build(tmp_path / "s.db")
+    conn = sqlite3.connect(tmp_path / "s.db")
+    columns = {c.name: c for c in plan_columns(conn, "scenarios")}
+    kinds = {name: c.kind for name, c in columns.items()}
+    assert kinds["core_capabilities.agency_level"] == "float"        # int and real mixed
+    assert kinds["core_capabilities.self_aware"] == "bool"
+    assert kinds["metadata.version"] == "int"
+    assert kinds["impact_and_control.impact_domains"] == "list"
+    assert kinds["scenario_content.timeline.phases"] == "json"       # array of objects
+    assert kinds["quantitative_assessment.odd"] == "json"            # text and int mixed
+    assert kinds["data.title"] == "string"                           # clashes with the plain column
+    assert columns["scenario_content.narrative"].group == "text"
+
+    batches = list(iter_export_batches(conn, "scenarios", list(columns.values()), chunksize=4))
+    rows = {}
+    for partition, data in batches:
+        for i, sid in enumerate(data["id"]):
+            rows[sid] = (partition, {k: v[i] for k, v in data.items()})
+    assert rows["scen1"][0] == "2025-02" and rows["broken"][0] == "unknown"
+    assert rows["scen2"][1]["impact_and_control.impact_domains"] == ["cyber", "economic"]
+    assert rows["scen0"][1]["core_capabilities.self_aware"] is True
+    assert rows["scen3"][1]["quantitative_assessment.odd"] == '"x"'
+    assert rows["broken"][1]["core_capabilities.agency_level"] is None
+
+
+def test_parquet_roundtrip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from oasis.export import export_table
+
+    _build(tmp_path / "s.db")
+    conn = sqlite3.connect(tmp_path / "s.db")
+    assert export_table(conn, "scenarios", tmp_path / "out", "parquet", chunksize=2) == 6
+    main = pq.read_table(tmp_path / "out" / "scenarios" / "columns", partitioning="hive")
+    text = pq.read_table(tmp_path / "out" / "scenarios" / "text", partitioning="hive")
+    assert main.num_rows == text.num_rows == 6
+    assert "scenario_content.narrative" not in main.column_names
+    assert str(main.schema.field("core_capabilities.agency_level").type) == "double"
+
+    conn.execute("DELETE FROM scenarios WHERE id != 'scen0'")  # only the 2025-01 partition is left
+    assert export_table(conn, "scenarios", tmp_path / "out", "parquet") == 1
+    assert [p.name for p in (tmp_path / "out" / "scenarios" / "columns").iterdir()] == ["created_month=2025-01"]
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["scenarios"]
@@ -0,0 +1,40 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Heavy dependencies that CLI modules must only load inside the commands that use them
+HEAVY = ("numpy", "pandas", "matplotlib", "pydantic_settings", "structlog", "requests", "feedparser")
+CLI_MODULES = (
+    "oasis.cli",
+    "oasis.s_generator.cli_s",
+    "oasis.ev_generator.cli_ev",
+    "oasis.m_generator.cli_m",
+    "oasis.tracker.cli_tracker",
+    "oasis.analyzer.cli_analyzer",
+    "oasis.tracker.core_t",
+    "oasis.analyzer.core_analyzer",
+)
+BUDGET_MS = float(os.environ.get("OASIS_IMPORT_BUDGET_MS", "250"))
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("module", CLI_MODULES)
+def test_cli_import_is_light_and_side_effect_free(module, tmp_path):
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tmp_path, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "", f"{module} imports {proc.stdout.strip()}"
+    assert list(tmp_path.iterdir()) == []  # nothing written to the working directory on import
+
+    cumulative = {
+        m["name"].strip(): int(m["cum"])
+        for m in re.finditer(r"^import time:\s+\d+ \|\s+(?P<cum>\d+) \|(?P<name>.+)$", proc.stderr, re.M)
+    }
+    own_ms = cumulative[module] / 1000
+    assert own_ms < BUDGET_MS, f"{module} took {own_ms:.0f} ms to import (budget {BUDGET_MS:.0f} ms)"
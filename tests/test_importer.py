@@ -0,0 +1,62 @@
+import json
+import random
+import sqlite3
+
+from benchmarks.synthetic import make_scenario
+
+
+def test_import_dedupes_and_rejects(tmp_path):
+    from oasis.importer import import_scenarios, input_files
+
+    rng = random.Random(0)
+    good = [make_scenario(rng, i) for i in range(6)]
+    for s in good:
+        del s["metadata"]["source"]                   # defaulted to the --source value
+    same_content = dict(good[0], id="00000000-0000-4000-8000-000000000000")
+    bad_schema = dict(good[1], origin={"initial_origin": "nowhere"})
+    lines = [json.dumps(s) for s in good[:4]] + ["{not json", json.dumps(good[2]), json.dumps(same_content),
+                                                   "", json.dumps(bad_schema)]
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "a.jsonl").write_text("\n".join(lines) + "\n")
+    (tmp_path / "in" / "b.jsonl").write_text("\n".join(json.dumps(s) for s in good[4:]) + "\n")
+
+    conn = sqlite3.connect(tmp_path / "s.db")
+    rejects = tmp_path / "rejects.jsonl"
+    with open(rejects, "w") as out:
+        progress = list(import_scenarios(conn, input_files([tmp_path / "in"]), "curated",
+                                         workers=1, batch_size=3, rejects=out))
+    totals = {k: sum(p[k] for p in progress) for k in progress[0]}
+    assert totals == {"read": 10, "inserted": 6, "duplicates": 2, "rejected": 2}
+
+    stored = {row[0]: json.loads(row[1]) for row in conn.execute("SELECT id, data FROM scenarios")}
+    assert set(stored) == {s["id"] for s in good}
+    assert {d["metadata"]["source"] for d in stored.values()} == {"curated"}
+
+    reasons = [(r["line"], r["reason"]) for r in map(json.loads, rejects.read_text().splitlines())]
+    assert sorted(reasons) == [(5, "invalid_json"), (6, "duplicate_id"), (7, "duplicate_content"), (9, "schema")]
+
+    # Re-running the import is a no-op
+    again = list(import_scenarios(conn, input_files([tmp_path / "in"]), workers=1))
+    assert sum(p["inserted"] for p in again) == 0
+
+
+def test_undecodable_lines_and_generator_rows(tmp_path):
+    from oasis.importer import import_scenarios
+
+    rng = random.Random(1)
+    generated, other = make_scenario(rng, 0), make_scenario(rng, 1)
+    conn = sqlite3.connect(tmp_path / "s.db")
+    conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT, created_at TIMESTAMP)")
+    conn.execute("INSERT INTO scenarios (id, title, data) VALUES (?, ?, ?)",
+                 (generated["id"], generated["title"], json.dumps(generated)))
+    conn.commit()
+
+    copy = dict(generated, id="00000000-0000-4000-8000-000000000001")
+    path = tmp_path / "in.jsonl"
+    path.write_bytes(b'{"id": "\xff"}\n' + json.dumps(copy).encode() + b"\n" + json.dumps(other).encode() + b"\n")
+    rejects = tmp_path / "rejects.jsonl"
+    with open(rejects, "w") as out:
+        progress = list(import_scenarios(conn, [path], workers=1, rejects=out))
+    assert progress == [{"read": 3, "inserted": 1, "duplicates": 1, "rejected": 1}]
+    reasons = [json.loads(line)["reason"] for line in rejects.read_text().splitlines()]
+    assert sorted(reasons) == ["duplicate_content", "invalid_utf8"]
@@ -0,0 +1,82 @@
+def test_job_checkpoints_and_pending(tmp_path, monkeypatch):
+    from oasis.config import settings
+    from oasis.common import jobs
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(jobs, "_tables_ready", False)
+
+    job = jobs.create_job("s", 4, seed=7)
+    jobs.mark_done(job["id"], [(0, "a"), (2, "c")])
+    jobs.mark_failed(job["id"], 1, "llm.all_failed")
+
+    assert jobs.pending_indices(job) == [1, 3]
+    assert jobs.finish_job(job["id"]) == "incomplete"
+
+    jobs.mark_done(job["id"], [(1, "b"), (3, "d")])
+    assert jobs.finish_job(job["id"][:6]) == "completed"
+    stored = jobs.get_job(job["id"])
+    assert (stored["done"], stored["failed"], stored["seed"]) == (4, 0, 7)
+
+
+def test_job_prefix_is_not_a_pattern(tmp_path, monkeypatch):
+    from oasis.config import settings
+    from oasis.common import jobs
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(jobs, "_tables_ready", False)
+
+    job = jobs.create_job("s", 1, seed=1)
+    assert jobs.get_job(job["id"][:4])["id"] == job["id"]
+    assert jobs.get_job("%") is None
+    assert jobs.get_job("_" * 12) is None
+
+
+def test_seeded_items_ignore_the_global_rng():
+    import random
+
+    from oasis.s_generator.core_s import prepare_item
+
+    random.seed(1)
+    first = prepare_item(1, seed="7:3")["params"]
+    random.seed(2)
+    state = random.getstate()
+    assert prepare_item(1, seed="7:3")["params"] == first
+    assert random.getstate() == state
+
+
+def test_resumed_job_generates_and_stores_on_synthetic_backend(tmp_path, monkeypatch):
+    import json
+
+    from oasis.config import settings
+    from oasis.common import abbreviator, jobs, model_router
+    from oasis.common.llm_backend import SyntheticBackend, set_backend
+    from oasis.common.storage import get_conn
+    from oasis.s_generator.core_s import prepare_item, run_generation_job
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(abbreviator, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(abbreviator, "_sequence_ready", False)
+    monkeypatch.setattr(jobs, "_tables_ready", False)
+    monkeypatch.setattr(model_router, "_tables_ready", False)
+
+    job = jobs.create_job("s", 4, seed=1)
+    jobs.mark_done(job["id"], [(0, "from-an-earlier-run")])  # interrupted after the first item
+    set_backend(SyntheticBackend())
+    try:
+        outcome = run_generation_job(job["id"])
+    finally:
+        set_backend(None)
+
+    stored = jobs.get_job(job["id"])
+    assert stored["done"] + stored["failed"] == 4 and len(outcome["results"]) == stored["done"] - 1 > 0
+    conn = get_conn()
+    rows = {r["id"]: json.loads(r["params"]) for r in conn.execute("SELECT id, params FROM s_scenarios")}
+    items = conn.execute(
+        "SELECT item_index, scenario_id FROM generation_job_items WHERE job_id = ? AND item_index > 0 AND status = 'done'",
+        (job["id"],),
+    ).fetchall()
+    conn.close()
+    assert set(rows) == {r["id"] for r in outcome["results"]} == {r["scenario_id"] for r in items}
+    for index, scenario_id in items:
+        # Resumed items get exactly the parameters their (seed, index) always gives
+        assert rows[scenario_id] == prepare_item(seed=jobs.item_seed(1, index))["params"]
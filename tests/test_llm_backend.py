@@ -0,0 +1,29 @@
+def test_synthetic_record_and_replay_backends(tmp_path, monkeypatch):
+    from oasis.config import settings
+    from oasis.common import llm_client, model_router
+    from oasis.common.llm_backend import ReplayBackend, SyntheticBackend, set_backend
+    from oasis.common.stream_guard import PatternHook, StreamGuard
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(model_router, "_tables_ready", False)
+    timeline = [{"phase": "Emergence", "years": "2030-2035"}, {"phase": "Expansion", "years": "2035-2045"}]
+
+    synthetic = SyntheticBackend()
+    recorder = ReplayBackend(tmp_path / "replay.db", inner=synthetic)
+    set_backend(recorder)
+    try:
+        ok, text, model = llm_client.generate_narrative("T", {"agency_level": 0.5}, timeline)
+        assert ok and text.index("Emergence") < text.index("Expansion")
+        assert recorder.misses == 1
+
+        set_backend(ReplayBackend(tmp_path / "replay.db"))
+        assert llm_client.generate_narrative("T", {"agency_level": 0.5}, timeline) == (True, text, model)
+        ok, err, _ = llm_client.generate("unseen prompt", "m", 5)
+        assert not ok and err.startswith("replay miss")
+    finally:
+        set_backend(None)
+
+    ok, err, _ = synthetic.generate("x", "m", 5, guard=StreamGuard([PatternHook("p", r"Overview")]))
+    assert not ok and err.startswith("aborted")
+    ok, err, _ = SyntheticBackend(latency=0.2).generate("x", "m", 0.1)
+    assert not ok and err.startswith("timeout")
@@ -0,0 +1,56 @@
+import json
+import sqlite3
+
+import pytest
+
+
+def _conn(n=7):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, data TEXT)")
+    for i in range(n):
+        data = {
+            "title": f"S-{i}",
+            "origin": {"initial_origin": ["corporate", "state", "open_source"][i // 3 % 3]},
+            "core_capabilities": {"agency_level": i / 10 if i != 4 else "n/a"},
+            "scenario_content": {"narrative": f"story {i}"},
+        }
+        conn.execute("INSERT INTO scenarios VALUES (?, ?)", (f"scen{i}", json.dumps(data)))
+    return conn
+
+
+def test_frame_is_typed_across_chunks():
+    pytest.importorskip("pandas")
+    from oasis.common.loader import load_scenario_frame
+
+    conn = _conn()
+    df = load_scenario_frame(["title", "origin", "agency"], chunksize=3, conn=conn)  # chunks see different origins
+    assert list(df.columns) == ["scenario_id", "title", "origin", "agency"]
+    assert list(df["scenario_id"]) == [f"scen{i}" for i in range(7)]
+    assert str(df["agency"].dtype) == "float32" and df["agency"].isna().sum() == 1
+    assert str(df["origin"].dtype) == "category"
+    assert set(df["origin"].cat.categories) == {"corporate", "state", "open_source"}
+    assert df["origin"].tolist()[-1] == "open_source"
+
+    whole = load_scenario_frame(["title", "origin", "agency"], conn=conn)
+    assert whole.astype(str).equals(df.astype(str))
+    assert len(load_scenario_frame(["agency"], where="id = ?", params=("nope",), conn=conn)) == 0
+
+
+def test_unknown_fields_are_rejected():
+    from oasis.common.loader import iter_scenario_chunks
+
+    with pytest.raises(KeyError, match="narrative"):
+        next(iter_scenario_chunks(["title", "narrative"], conn=_conn()))
+
+
+def test_fetch_narratives_batches_ids():
+    from oasis.common.loader import fetch_narratives
+
+    conn = _conn(1201)
+    queries = []
+    conn.set_trace_callback(queries.append)
+    ids = [f"scen{i}" for i in range(1201)] + ["missing"]
+    narratives = fetch_narratives(ids, conn=conn)
+    assert len(narratives) == 1201 and narratives["scen1200"] == "story 1200"
+    assert len(queries) == 3  # 500 + 500 + 202 ids, under SQLite's parameter limit
+    assert fetch_narratives([], conn=conn) == {}
@@ -0,0 +1,53 @@
+def test_router_orders_breaks_and_times_out_adaptively(tmp_path, monkeypatch):
+    from oasis.config import settings
+    from oasis.common import model_router
+    from oasis.common.model_router import ModelRouter
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(model_router, "_tables_ready", False)
+    assert ModelRouter(["slow:7b", "fast:7b"], preferred="gone:8b").candidates() == ["slow:7b", "fast:7b"]
+    router = ModelRouter(["slow:7b", "fast:7b", "pref:8b"], preferred="pref:8b", max_timeouts={"slow:7b": 300})
+
+    assert router.candidates() == ["pref:8b", "slow:7b", "fast:7b"]
+    assert router.timeout_for("slow:7b") == 300
+
+    for _ in range(model_router.MIN_SAMPLES):
+        router.record("slow:7b", 40.0, 400, ok=True)
+        router.record("fast:7b", 10.0, 400, ok=True)
+    assert router.timeout_for("slow:7b") == 60
+    assert router.timeout_for("fast:7b") == model_router.MIN_TIMEOUT
+
+    for _ in range(model_router.FAILURE_THRESHOLD):
+        router.record("pref:8b", 2.0, 0, ok=False, error="model not found")
+    assert router.candidates() == ["fast:7b", "slow:7b"]
+    assert router.stats("pref:8b").circuit_open
+
+    router.record("pref:8b", 12.0, 400, ok=True)  # half-open trial succeeded
+    assert not router.stats("pref:8b").circuit_open
+
+
+def test_timed_out_calls_count_in_p95(tmp_path, monkeypatch):
+    from oasis.config import settings
+    from oasis.common import llm_client, model_router
+    from oasis.common.model_router import ModelRouter
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    monkeypatch.setattr(model_router, "_tables_ready", False)
+    router = ModelRouter(["slow:7b"], max_timeouts={"slow:7b": 300})
+
+    for _ in range(model_router.MIN_SAMPLES):
+        router.record("slow:7b", 40.0, 400, ok=True)
+    assert router.timeout_for("slow:7b") == 60
+    for _ in range(model_router.MIN_SAMPLES):
+        router.record("slow:7b", 60.0, 0, ok=False, error="timeout after 60s", timed_out=True)
+    assert router.timeout_for("slow:7b") == 90  # grows with the model instead of cutting it off
+
+    assert llm_client.get_router() is llm_client.get_router()
+
+
+def test_default_preferred_model_is_routed():
+    from oasis.common.llm_client import AVAILABLE_MODELS
+    from oasis.config import _settings_class
+
+    default = _settings_class().model_fields["ollama_preferred_model"].default
+    assert default in dict(AVAILABLE_MODELS)
@@ -0,0 +1,54 @@
+import time
+
+
+def test_pipeline_runs_all_stages_and_drops_failures():
+    from oasis.common.pipeline import GenerationPipeline
+
+    written = []
+
+    def narrate(item):
+        time.sleep(0.01)
+        return None if item["i"] % 5 == 0 else {**item, "narrative": "text"}
+
+    def finalize(item):
+        if item["i"] == 3:
+            raise ValueError("bad")
+        return item
+
+    pipeline = GenerationPipeline(
+        prepare=lambda i: {"i": i},
+        narrate=narrate,
+        finalize=finalize,
+        write=written.extend,
+        llm_workers=3,
+        batch_size=4,
+    )
+    results = pipeline.run(20)
+
+    expected = {i for i in range(20) if i % 5 and i != 3}
+    assert {r["i"] for r in results} == expected
+    assert {r["i"] for r in written} == expected
+
+    stats = {row["stage"]: row for row in pipeline.summary()}
+    assert stats["prepare"]["processed"] == 20
+    assert stats["narrate"]["failed"] == 4
+    assert stats["finalize"]["failed"] == 1
+    assert stats["write"]["processed"] == len(expected)
+
+
+def test_save_scenarios_keeps_ids_and_survives_failed_batches(tmp_path, monkeypatch):
+    import sqlite3
+
+    import pytest
+
+    from oasis.config import settings
+    from oasis.common import storage
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "asi_scenarios.db")
+    storage.init_table("s_scenarios")
+    record = {"id": "scen-1", "params": {}, "narrative": "n", "timeline": [], "model_used": "m"}
+
+    assert storage.save_scenarios("s_scenarios", [record]) == ["scen-1"]
+    with pytest.raises(sqlite3.IntegrityError):
+        storage.save_scenarios("s_scenarios", [{**record, "id": "scen-2"}, record])  # rolled back as a whole
+    assert storage.save_scenarios("s_scenarios", [{**record, "id": "scen-2"}]) == ["scen-2"]
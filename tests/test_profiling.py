@@ -0,0 +1,30 @@
+import sqlite3
+import sys
+
+
+def test_run_cli_strips_flags_profiles_and_groups_sql(tmp_path, monkeypatch, capsys):
+    from oasis.common.profiling import run_cli
+
+    seen = {}
+
+    def command():
+        seen["argv"] = sys.argv[1:]
+        conn = sqlite3.connect(tmp_path / "t.db")
+        conn.execute("CREATE TABLE t (a INTEGER)")
+        for i in range(50):
+            conn.execute(f"INSERT INTO t VALUES ({i})")
+        conn.close()
+        return "done"
+
+    original_connect = sqlite3.connect
+    monkeypatch.setattr(sys, "argv", ["cli"])
+    out = tmp_path / "prof.txt"
+    result = run_cli(command, ["link", "--profile", "sampling", "--profile-out", str(out), "--trace-sql", "--dry-run"])
+
+    assert result == "done"
+    assert seen["argv"] == ["link", "--dry-run"]
+    assert out.exists()
+    assert sqlite3.connect is original_connect
+    err = capsys.readouterr().err
+    assert "=== sampling profile ===" in err
+    assert "      50" in err and "INSERT INTO t VALUES (?)" in err
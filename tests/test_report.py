@@ -0,0 +1,28 @@
+import pytest
+
+
+def test_chart_cache_keeps_only_recent_selections(tmp_path, monkeypatch):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("reportlab")
+    from oasis import report
+
+    monkeypatch.setattr(report, "CHART_CACHE_DIR", tmp_path / ".chart_cache")
+    monkeypatch.setattr(report, "CHART_CACHE_KEEP", 2)
+
+    def selection(shift):
+        return pd.DataFrame({
+            "id": [f"S-{i}" for i in range(3)],
+            "date": ["2025-11-20", "2025-11-21", "2025-11-22"],
+            "agency": [0.1 + shift, 0.5, 0.9],
+            "autonomy_str": ["Limited", "Partial", "Full"],
+            "autonomy_num": [0.2, 0.4, 0.8],
+            "alignment": [0.3, 0.6, 0.2],
+        })
+
+    first = report.render_charts(selection(0.0), workers=1)
+    for shift in (0.01, 0.02):
+        report.render_charts(selection(shift), workers=1)
+    kept = {d.name for d in (tmp_path / ".chart_cache").iterdir()}
+    assert len(kept) == 2 and report._chart_cache_key(selection(0.0)) not in kept
+    assert report.render_charts(selection(0.0), workers=1) == first  # evicted, so rendered again
@@ -0,0 +1,126 @@
+import json
+import sqlite3
+import threading
+import urllib.request
+
+
+def _build(tmp_path):
+    scen_db, sig_db = tmp_path / "asi_scenarios.db", tmp_path / "precursor_signals.db"
+    with sqlite3.connect(scen_db) as conn:
+        conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT, created_at TEXT)")
+        for i in range(7):
+            data = {
+                "title": f"S-{i}",
+                "origin": {"initial_origin": "corporate" if i % 2 else "state"},
+                "core_capabilities": {"agency_level": i / 10},
+                "scenario_content": {"narrative": f"story {i}"},
+            }
+            conn.execute("INSERT INTO scenarios (id, data) VALUES (?, ?)", (f"scen{i}", json.dumps(data)))
+        conn.execute("CREATE TABLE signal_scenario_links (signal_id TEXT, scenario_id TEXT, confidence REAL, link_type TEXT, created_at TEXT)")
+        conn.executemany("INSERT INTO signal_scenario_links VALUES (?, ?, ?, 'automatic', '2025')",
+                         [("sig0", "scen1", 0.9), ("sig0", "scen2", 0.4), ("sig1", "scen1", 0.6)])
+    with sqlite3.connect(sig_db) as conn:
+        conn.execute("CREATE TABLE precursor_signals (id TEXT PRIMARY KEY, source TEXT, title TEXT, description TEXT, stars INTEGER, "
+                     "authors TEXT, url TEXT, published TEXT, pdf_url TEXT, signal_type TEXT, score REAL, tags TEXT, raw_data TEXT, collected_at TEXT)")
+        conn.executemany("INSERT INTO precursor_signals (id, source, title, score, tags) VALUES (?, ?, ?, ?, ?)",
+                         [(f"sig{i}", "arxiv" if i % 2 else "github", f"signal {i}", float(i), '["ai"]') for i in range(3)])
+    return scen_db, sig_db
+
+
+def test_pagination_projection_links_and_cache(tmp_path):
+    from oasis.server import ApiError, ScenarioAPI
+
+    scen_db, sig_db = _build(tmp_path)
+    api = ScenarioAPI(scen_db, sig_db, scen_db)
+
+    seen, cursor = [], None
+    while True:
+        query = {"limit": "3", "fields": "title,agency"} | ({"cursor": str(cursor)} if cursor else {})
+        page = json.loads(api.get("/scenarios", query)[0])
+        seen += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert [s["id"] for s in seen] == [f"scen{i}" for i in range(7)]
+    assert set(seen[0]) == {"id", "title", "agency"}
+
+    corp = json.loads(api.get("/scenarios", {"origin": "corporate", "min_agency": "0.3"})[0])["items"]
+    assert [s["id"] for s in corp] == ["scen3", "scen5"]
+    assert json.loads(api.get("/scenarios/scen4", {})[0])["title"] == "S-4"
+    links = json.loads(api.get("/links", {"signal_id": "sig0", "min_confidence": "0.5"})[0])["items"]
+    assert [l["scenario_id"] for l in links] == ["scen1"]
+    signals = json.loads(api.get("/signals", {"source": "github"})[0])["items"]
+    assert [s["tags"] for s in signals] == [["ai"], ["ai"]]
+    stats = json.loads(api.get("/stats", {})[0])
+    assert stats["scenarios"]["scenarios"]["total"] == 7 and stats["signals"]["total"] == 3 and stats["links"] == 3
+
+    body, etag = api.get("/scenarios", {"fields": "title"})
+    assert api.get("/scenarios", {"fields": "title"}) == (body, etag)
+    assert api.cache.hits >= 1
+    with sqlite3.connect(scen_db) as conn:  # a writer's commit invalidates cached responses
+        conn.execute("UPDATE scenarios SET data = json_set(data, '$.title', 'changed') WHERE id = 'scen0'")
+    body2, etag2 = api.get("/scenarios", {"fields": "title"})
+    assert etag2 != etag and b"changed" in body2
+
+    for bad in ({"fields": "nope"}, {"limit": "x"}):
+        try:
+            api.get("/scenarios", bad)
+        except ApiError as exc:
+            assert exc.status == 400
+        else:
+            raise AssertionError(bad)
+    api.close()
+
+
+def test_http_etag_and_streaming_export(tmp_path):
+    from oasis.server import ScenarioAPI, make_server
+
+    scen_db, sig_db = _build(tmp_path)
+    api = ScenarioAPI(scen_db, sig_db, scen_db)
+    server = make_server(api, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with urllib.request.urlopen(f"{base}/scenarios?limit=2") as resp:
+            etag = resp.headers["ETag"]
+            assert len(json.load(resp)["items"]) == 2
+        request = urllib.request.Request(f"{base}/scenarios?limit=2", headers={"If-None-Match": etag})
+        try:
+            urllib.request.urlopen(request)
+        except urllib.error.HTTPError as exc:
+            assert exc.code == 304
+        else:
+            raise AssertionError("expected 304")
+
+        with urllib.request.urlopen(f"{base}/export/scenarios?fields=title,narrative") as resp:
+            assert resp.headers["Transfer-Encoding"] == "chunked"
+            rows = [json.loads(line) for line in resp.read().decode().splitlines()]
+        assert [r["narrative"] for r in rows] == [f"story {i}" for i in range(7)]
+    finally:
+        server.shutdown()
+        server.server_close()
+        api.close()
+
+
+def test_stats_fall_back_to_live_counts_when_behind(tmp_path):
+    from oasis.common.stats import refresh_stats
+    from oasis.server import ScenarioAPI
+
+    scen_db, sig_db = _build(tmp_path)
+    with sqlite3.connect(scen_db) as conn:
+        refresh_stats(conn)
+    api = ScenarioAPI(scen_db, sig_db, scen_db)
+    assert json.loads(api.get("/stats", {})[0])["scenarios"]["scenarios"]["total"] == 7
+
+    with sqlite3.connect(scen_db) as conn:  # a writer that doesn't refresh the stats
+        conn.execute("DELETE FROM scenarios WHERE id = 'scen0'")
+        conn.execute("INSERT INTO scenarios (id, title, data) VALUES ('new1', 'N', '{}'), ('new2', 'N', '{}')")
+    stats = json.loads(api.get("/stats", {})[0])["scenarios"]["scenarios"]
+    assert stats["total"] == 8 and stats["dimensions"]["origin"]["unknown"] == 2
+
+    with sqlite3.connect(scen_db) as conn:
+        refresh_stats(conn)
+        conn.execute("UPDATE scenarios SET data = json_set(data, '$.origin.initial_origin', 'military') WHERE id = 'new1'")
+    stats = json.loads(api.get("/stats", {})[0])["scenarios"]["scenarios"]
+    assert stats["dimensions"]["origin"]["military"] == 1 and stats["dimensions"]["origin"]["unknown"] == 1
+    api.close()
@@ -0,0 +1,106 @@
+import json
+import random
+
+
+def _insert_signals(conn, rng, start, count):
+    words = ["edge", "quantum", "state", "corporate", "robot", "agent", "risk", "safety", "plain"]
+    tag_pool = ["asi_direct", "misalignment", "ai", "robotics"]
+    for i in range(start, start + count):
+        raw = {"title": f"signal {i}", "description": " ".join(rng.sample(words, 3))}
+        conn.execute(
+            "INSERT INTO precursor_signals (id, source, score, tags, raw_data, collected_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (f"s{i}", "test", round(rng.random() * 10, 2), json.dumps(rng.sample(tag_pool, 2)),
+             json.dumps(raw), f"2025-01-{1 + i % 28:02d}"),
+        )
+    conn.commit()
+
+
+def test_batch_parameters_match_scalar_and_cache_tracks_watermark(tmp_path, monkeypatch):
+    from oasis.tracker import database_t
+    from oasis.ev_generator import signal_cache
+    from oasis.ev_generator.core_ev import precursor_to_parameters, precursor_to_parameters_batch
+
+    monkeypatch.setattr(database_t, "DB_PATH", tmp_path / "precursor_signals.db")
+    signal_cache.clear_signal_cache()
+    database_t.init_precursor_db()
+    rng = random.Random(3)
+    with database_t.get_connection() as conn:
+        _insert_signals(conn, rng, 0, 40)
+
+    matrix = signal_cache.load_signal_matrix()
+    assert len(matrix) == 40
+    assert signal_cache.load_signal_matrix() is matrix
+
+    subsets = [rng.sample(range(40), 5) for _ in range(50)]
+    batch = precursor_to_parameters_batch(matrix, subsets)
+    for params, rows in zip(batch, subsets):
+        assert params == precursor_to_parameters([matrix.signals[j] for j in rows])
+
+    with database_t.get_connection() as conn:
+        _insert_signals(conn, rng, 40, 1)
+    matrix = signal_cache.load_signal_matrix()
+    assert len(matrix) == 41
+
+    with database_t.get_connection() as conn:  # tag-only edit: count, rowids, dates and scores unchanged
+        conn.execute("""UPDATE precursor_signals SET tags = '["asi_direct", "zz"]' WHERE id = 's0'""")
+        conn.commit()
+    rebuilt = signal_cache.load_signal_matrix()
+    assert rebuilt is not matrix and ["asi_direct", "zz"] in [s["tags"] for s in rebuilt.signals]
+    signal_cache.clear_signal_cache()
+
+
+def test_single_items_draw_from_the_cached_matrix(tmp_path, monkeypatch):
+    from oasis.tracker import database_t
+    from oasis.ev_generator import core_ev, signal_cache
+
+    monkeypatch.setattr(database_t, "DB_PATH", tmp_path / "precursor_signals.db")
+    signal_cache.clear_signal_cache()
+    database_t.init_precursor_db()
+    assert core_ev.prepare_ev_item()["signals"] == []
+
+    with database_t.get_connection() as conn:
+        _insert_signals(conn, random.Random(5), 0, 20)
+    matrix = signal_cache.load_signal_matrix()
+    monkeypatch.setattr(signal_cache, "_build_matrix", None)  # a second build would fail
+    items = [core_ev.prepare_ev_item() for _ in range(5)]
+    assert signal_cache.load_signal_matrix() is matrix
+    assert all(len(item["signals"]) == core_ev.SIGNALS_PER_SCENARIO for item in items)
+    item = items[0]
+    assert item["params"] == core_ev.precursor_to_parameters(item["signals"])
+    signal_cache.clear_signal_cache()
+
+
+def test_weighted_sampling_respects_filters_and_weights(tmp_path, monkeypatch):
+    from oasis.tracker import database_t
+    from oasis.ev_generator import signal_cache
+
+    monkeypatch.setattr(database_t, "DB_PATH", tmp_path / "precursor_signals.db")
+    monkeypatch.setattr(signal_cache, "_indexes_ready", False)
+    signal_cache.clear_signal_cache()
+    database_t.init_precursor_db()
+    with database_t.get_connection() as conn:
+        rows = [
+            ("heavy", 50.0, ["ai"], "2999-01-01"),
+            ("light", 0.5, ["ai"], "2999-01-01"),
+            ("old", 50.0, ["ai"], "2000-01-01"),
+            ("other", 50.0, ["bio"], "2999-01-01"),
+        ]
+        for sid, score, tags, collected in rows:
+            conn.execute(
+                "INSERT INTO precursor_signals (id, source, score, tags, raw_data, collected_at) VALUES (?, 't', ?, ?, ?, ?)",
+                (sid, score, json.dumps(tags), json.dumps({"title": sid}), collected),
+            )
+        conn.commit()
+        plan = " ".join(r[3] for r in conn.execute("EXPLAIN QUERY PLAN SELECT rowid, score FROM precursor_signals WHERE collected_at >= '2025'"))
+    assert "idx_precursor_signals_score_collected" in plan
+
+    matrix = signal_cache.load_signal_matrix()
+    subsets = signal_cache.sample_subsets(matrix, 2000, 1, window_days=30, tags=["ai"], seed=1)
+    titles = [matrix.signals[i]["title"] for i in subsets[:, 0]]
+    assert set(titles) == {"heavy", "light"}
+    assert titles.count("heavy") > 0.95 * len(titles)
+
+    picked = [signal_cache.sample_signals(1, window_days=30, tags=["ai"], seed=s)[0]["title"] for s in range(200)]
+    assert set(picked) <= {"heavy", "light"} and picked.count("heavy") > 180
+    assert len(signal_cache.sample_signals(10)) == 4
+    signal_cache.clear_signal_cache()
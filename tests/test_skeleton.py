@@ -0,0 +1,51 @@
+import json
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def scenario_db(tmp_path, monkeypatch):
+    from oasis.common import abbreviator
+    from oasis.config import settings
+
+    path = tmp_path / "asi_scenarios.db"
+    monkeypatch.setattr(settings, "db_path", path)
+    monkeypatch.setattr(abbreviator, "db_path", path)
+    monkeypatch.setattr(abbreviator, "_sequence_ready", False)
+    return path
+
+
+def test_generate_and_select_skeletons(scenario_db):
+    from oasis.common.schema import SchemaManager
+    from oasis.s_generator.skeleton import generate_skeletons, select_skeletons
+
+    progress = list(generate_skeletons(25, seed=1, batch_size=10))
+    assert [p["saved"] for p in progress] == [10, 10, 5]
+    assert sum(p["rejected"] for p in progress) == 0
+
+    with sqlite3.connect(scenario_db) as conn:
+        stored = [json.loads(row[0]) for row in conn.execute("SELECT data FROM scenarios")]
+    assert len(stored) == 25
+    assert all(not errs for _, errs in SchemaManager.validate_many(stored))
+
+    state = [s["id"] for s in stored if s["origin"]["initial_origin"] == "state"]
+    assert [s["id"] for s in select_skeletons(equals={"origin": "state"}, page_size=2)] == state
+    low = [s["id"] for s in stored if s["core_capabilities"]["alignment_score"] <= 0.5]
+    assert state and len(low) > 3
+    assert [s["id"] for s in select_skeletons(maximum={"alignment": 0.5}, limit=3, page_size=2)] == low[:3]
+
+    with pytest.raises(KeyError):
+        list(select_skeletons(equals={"1=1) OR (1": "1"}))
+    with pytest.raises(ValueError):
+        list(select_skeletons(minimum={"origin": 1}))
+
+
+def test_sample_parameters_with_private_rng():
+    import random
+
+    from oasis.s_generator.params_s import sample_parameters
+
+    state = random.getstate()
+    assert sample_parameters(random.Random("job-1:3")) == sample_parameters(random.Random("job-1:3"))
+    assert random.getstate() == state
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+
+def test_spans_nest_aggregate_and_dump(tmp_path):
+    from oasis import logger
+    from oasis.logger import incr, span
+
+    logger.reset_metrics()
+    parents = []
+
+    @span("outer")
+    def outer():
+        with span("inner") as s:
+            parents.append(s.parent.name)
+            s.set(rows=3)
+        incr("things", 2)
+
+    outer()
+    outer()
+    with pytest.raises(ValueError):
+        with span("inner"):
+            raise ValueError("boom")
+
+    snap = logger.metrics_snapshot()
+    assert parents == ["outer", "outer"]
+    assert snap["spans"]["outer"]["count"] == 2
+    assert snap["spans"]["inner"]["count"] == 3 and snap["spans"]["inner"]["errors"] == 1
+    assert snap["counters"] == {"things": 4}
+
+    logger.dump_metrics(tmp_path / "m.prom")
+    prom = (tmp_path / "m.prom").read_text()
+    assert 'oasis_span_seconds_count{span="inner"} 3' in prom
+    assert 'oasis_events_total{name="things"} 4' in prom
+
+    logger.dump_metrics(str(tmp_path / "m.jsonl"))
+    rows = [json.loads(line) for line in (tmp_path / "m.jsonl").read_text().splitlines()]
+    assert {(r["type"], r["name"]) for r in rows} == {("span", "outer"), ("span", "inner"), ("counter", "things")}
+    logger.reset_metrics()
@@ -0,0 +1,114 @@
+import json
+import sqlite3
+
+
+def _insert(conn, origin, model="llama3:8b"):
+    data = {
+        "origin": {"initial_origin": origin},
+        "architecture": {"type": "modular"},
+        "core_capabilities": {"autonomy_degree": "full"},
+        "metadata": {"created": "2025-11-20T10:00:00+00:00", "provenance": {"model_used": model}},
+    }
+    conn.execute("INSERT INTO scenarios (id, title, data) VALUES (?, ?, ?)",
+                 (f"id-{conn.total_changes}", "T", json.dumps(data)))
+
+
+def test_refresh_stats_is_incremental():
+    from oasis.common.stats import refresh_stats, get_stats
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT)")
+    _insert(conn, "corporate")
+    _insert(conn, "state")
+    conn.commit()
+
+    assert refresh_stats(conn) == 2
+    assert refresh_stats(conn) == 0
+
+    _insert(conn, "corporate", model="gemma2:9b")
+    conn.commit()
+    assert refresh_stats(conn) == 1
+
+    stats = get_stats(conn)["scenarios"]
+    assert stats["total"] == 3
+    assert stats["dimensions"]["origin"] == {"corporate": 2, "state": 1}
+    assert stats["dimensions"]["model_used"] == {"llama3:8b": 2, "gemma2:9b": 1}
+    assert stats["dimensions"]["created_day"] == {"2025-11-20": 3}
+
+    assert refresh_stats(conn, rebuild=True) == 3
+    assert get_stats(conn)["scenarios"]["dimensions"]["origin"]["corporate"] == 2
+
+
+def test_deleted_and_replaced_rows_trigger_rebuild():
+    from oasis.common.stats import refresh_stats, get_stats
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT)")
+    for origin in ("corporate", "state", "state"):
+        _insert(conn, origin)
+    conn.commit()
+    refresh_stats(conn)
+
+    conn.execute("DELETE FROM scenarios WHERE json_extract(data, '$.origin.initial_origin') = 'corporate'")
+    conn.execute("INSERT OR REPLACE INTO scenarios (id, title, data) SELECT id, title, "
+                 "json_set(data, '$.origin.initial_origin', 'military') FROM scenarios LIMIT 1")
+    conn.commit()
+    refresh_stats(conn)
+    stats = get_stats(conn)["scenarios"]
+    assert stats["total"] == 2
+    assert stats["dimensions"]["origin"] == {"state": 1, "military": 1}
+
+
+def test_generator_tables_are_sources():
+    from oasis.common.stats import refresh_stats, get_stats
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE ev_scenarios (id TEXT PRIMARY KEY, params TEXT, narrative TEXT, timeline TEXT, "
+                 "model_used TEXT, signals TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+    conn.execute("INSERT INTO ev_scenarios (id, params, model_used) VALUES ('e1', ?, 'gemma2:9b')",
+                 (json.dumps({"initial_origin": "state", "autonomy_degree": "full"}),))
+    conn.execute("CREATE TABLE m_scenarios (id TEXT PRIMARY KEY, title TEXT, created TEXT, last_updated TEXT, "
+                 "asi_count INTEGER, source TEXT, data TEXT, threat_index REAL)")
+    conn.execute("INSERT INTO m_scenarios VALUES ('m1', 'T', '2025-11-20T10:00:00', '', 4, 'multi_asi_v3', '{}', 0)")
+    conn.commit()
+
+    assert refresh_stats(conn) == 2
+    stats = get_stats(conn)
+    assert stats["ev_scenarios"]["dimensions"]["origin"] == {"state": 1}
+    assert stats["ev_scenarios"]["dimensions"]["model_used"] == {"gemma2:9b": 1}
+    assert stats["m_scenarios"]["total"] == 1 and stats["m_scenarios"]["avg_asis"] == 4.0
+
+
+def test_in_place_updates_move_counts():
+    from oasis.common.stats import get_stats, refresh_stats, source_is_current
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE scenarios (id TEXT PRIMARY KEY, title TEXT, data TEXT)")
+    for _ in range(3):
+        _insert(conn, "state", model="skeleton")
+    conn.commit()
+    refresh_stats(conn)
+
+    # Narration rewrites the blob in place: skeleton → real model
+    conn.execute("UPDATE scenarios SET data = json_set(data, '$.metadata.provenance.model_used', 'gemma2:9b') "
+                 "WHERE id = 'id-0'")
+    _insert(conn, "corporate", model="skeleton")  # not folded yet: updates to it wait for the refresh
+    conn.execute("UPDATE scenarios SET data = json_set(data, '$.origin.initial_origin', 'military') WHERE rowid = 4")
+    conn.commit()
+    assert not source_is_current(conn, "scenarios")
+    assert get_stats(conn)["scenarios"]["dimensions"]["model_used"] == {"skeleton": 2, "gemma2:9b": 1}
+
+    assert refresh_stats(conn) == 1 and source_is_current(conn, "scenarios")
+    stats = get_stats(conn)["scenarios"]
+    assert stats["dimensions"]["model_used"] == {"skeleton": 3, "gemma2:9b": 1}
+    assert stats["dimensions"]["origin"] == {"state": 3, "military": 1}
+
+    conn.execute("CREATE TABLE m_scenarios (id TEXT PRIMARY KEY, title TEXT, created TEXT, last_updated TEXT, "
+                 "asi_count INTEGER, source TEXT, data TEXT, threat_index REAL)")
+    conn.execute("INSERT INTO m_scenarios VALUES ('m1', 'T', '2025-11-20', '', 4, 'multi_asi_v3', '{}', 0)")
+    conn.commit()
+    refresh_stats(conn)
+    conn.execute("UPDATE m_scenarios SET asi_count = 6, source = 'manual'")
+    conn.commit()
+    stats = get_stats(conn)["m_scenarios"]
+    assert stats["avg_asis"] == 6.0 and stats["dimensions"]["source"] == {"manual": 1}
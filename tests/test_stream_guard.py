@@ -0,0 +1,83 @@
+import os
+import stat
+import time
+
+from oasis.common.stream_guard import StreamGuard
+
+
+def test_hooks_flag_leakage_repetition_and_drift():
+    guard = StreamGuard()
+    assert guard.feed("The Scaling Era saw rapid capability gains.\n") is None
+    violation = guard.feed("## Phase 2: Emergence\n")
+    assert violation is not None and violation.rule == "header_leakage"
+
+    # A chunk ending right after bold text or dashes is not yet a header line
+    guard = StreamGuard()
+    assert guard.feed("The Scaling Era saw rapid capability gains.\n\n**Key risks**") is None
+    assert guard.feed(" included the loss of oversight.\n") is None
+    assert guard.feed("Then came the long quiet years ------") is None
+    assert guard.feed("------\n") is None
+    assert guard.feed("**Key risks**") is None
+    assert guard.feed(":\n").rule == "header_leakage"
+
+    guard = StreamGuard()
+    loop = "The system waited and watched the markets. "
+    violation = None
+    for _ in range(5):
+        violation = violation or guard.feed(loop)
+    assert violation.rule == "repetition"
+
+    guard = StreamGuard()
+    assert guard.feed("Слово " * 80).rule == "language_drift"
+
+
+def test_generate_aborts_stream_early(tmp_path, monkeypatch):
+    from oasis.common import llm_client
+
+    fake = tmp_path / "ollama"
+    fake.write_text(
+        "#!/bin/sh\ncat > /dev/null\n"
+        "echo 'The first paragraph is fine and long enough to pass.'\n"
+        "echo '### Leaked section header'\n"
+        "echo more text\nsleep 30\necho 'never reached'\n"
+    )
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    start = time.monotonic()
+    ok, text, model = llm_client.generate("prompt", "fake:1b", timeout=20, guard=StreamGuard())
+    assert not ok and text.startswith("aborted: header_leakage")
+    assert time.monotonic() - start < 10
+
+
+def _fake_ollama(tmp_path, monkeypatch, body):
+    fake = tmp_path / "ollama"
+    fake.write_text("#!/bin/sh\ncat > /dev/null\n" + body)
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_token_stream_iterates_chunks_and_caps_output(tmp_path, monkeypatch):
+    import asyncio
+    import io
+
+    from oasis.common.llm_stream import TokenStream
+
+    _fake_ollama(tmp_path, monkeypatch, "printf 'partial '\nsleep 0.2\nprintf 'tokens ärrive'\necho 'oops' >&2\n")
+    echo = io.StringIO()
+    stream = TokenStream("prompt", "fake:1b", timeout=10, echo=echo)
+    chunks = list(stream)
+    assert "".join(chunks) == stream.text == echo.getvalue() == "partial tokens ärrive"
+    assert len(chunks) >= 2 and stream.returncode == 0 and stream.stderr == "oops"
+
+    async def collect():
+        return [c async for c in TokenStream("prompt", "fake:1b", timeout=10)]
+    assert "".join(asyncio.run(collect())) == "partial tokens ärrive"
+
+    _fake_ollama(tmp_path, monkeypatch, "yes 'runaway output'\n")
+    ok, text, _ = TokenStream("prompt", "fake:1b", timeout=10, max_chars=1000).result()
+    assert not ok and "exceeded 1000" in text
+
+    _fake_ollama(tmp_path, monkeypatch, "sleep 30\n")
+    ok, text, _ = TokenStream("prompt", "fake:1b", timeout=0.3).result()
+    assert not ok and text.startswith("timeout")